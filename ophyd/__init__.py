@@ -1,14 +1,17 @@
 # type: ignore
 
+import importlib
 import logging
 import os
+import threading
 import types
 
 from ophyd.log import set_handler  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
-cl = None
+# The control layer is set up by set_cl(), or on first use through get_cl()
+_cl_lock = threading.Lock()
 
 
 def set_cl(control_layer=None, *, pv_telemetry=False):
@@ -81,27 +84,25 @@ def set_cl(control_layer=None, *, pv_telemetry=False):
 
 
 def get_cl():
-    if cl is None:
-        raise RuntimeError("control layer not set, " "unsure how you got to this state")
+    if "cl" not in globals():
+        with _cl_lock:
+            if "cl" not in globals():
+                set_cl()
     return cl
 
 
-set_cl()
-
-# Areadetector-related
-from .areadetector import *  # noqa: F401, F402, E402, F403
 from .device import (  # noqa: F401, F402, E402
     ALL_COMPONENTS,
     Component,
     Device,
     DynamicDeviceComponent,
     FormattedComponent,
+    VectorComponent,
+    create_devices,
     do_not_wait_for_lazy_connection,
     kind_context,
     wait_for_lazy_connection,
 )
-from .epics_motor import EpicsMotor, MotorBundle  # noqa: F401, F402, E402
-from .mca import EpicsDXP, EpicsMCA  # noqa: F401, F402, E402
 from .ophydobj import (  # noqa: F401, F402, E402
     Kind,
     register_instances_in_weakset,
@@ -111,17 +112,6 @@ from .ophydobj import (  # noqa: F401, F402, E402
 
 # Positioners
 from .positioner import PositionerBase, SoftPositioner  # noqa: F401, F402, E402
-from .pseudopos import PseudoPositioner, PseudoSingle  # noqa: F401, F402, E402
-from .pv_positioner import (  # noqa: F401, F402, E402
-    PVPositioner,
-    PVPositionerDone,
-    PVPositionerIsClose,
-    PVPositionerPC,
-)
-from .quadem import APS_EM, NSLS_EM, QuadEM, TetrAMM  # noqa: F401, F402, E402
-
-# Devices
-from .scaler import EpicsScaler  # noqa: F401, F402, E402
 
 # Signals
 from .signal import (  # noqa: F401, F402, E402
@@ -131,10 +121,158 @@ from .signal import (  # noqa: F401, F402, E402
     EpicsSignalRO,
     Signal,
     SignalRO,
+    VectorSignal,
+    put_group,
 )
 from .status import StatusBase, wait  # noqa: F401, F402, E402
 from .utils.startup import setup as setup_ophyd  # noqa: F401, F402, E402
 
+# Larger subsystems are imported on first access, see __getattr__
+_LAZY_MODULES = {
+    ".epics_motor": ("EpicsMotor", "MotorBundle"),
+    ".mca": ("EpicsDXP", "EpicsMCA"),
+    ".pseudopos": ("PseudoPositioner", "PseudoSingle"),
+    ".pv_positioner": (
+        "PVPositioner",
+        "PVPositionerDone",
+        "PVPositionerIsClose",
+        "PVPositionerPC",
+    ),
+    ".quadem": ("APS_EM", "NSLS_EM", "QuadEM", "TetrAMM"),
+    ".scaler": ("EpicsScaler",),
+    # The names formerly star-imported from ophyd.areadetector
+    ".areadetector.base": (
+        "ADBase",
+        "ADComponent",
+        "DDC_EpicsSignal",
+        "DDC_EpicsSignalRO",
+        "DDC_SignalWithRBV",
+        "EpicsSignalWithRBV",
+        "NDDerivedSignal",
+        "ad_group",
+    ),
+    ".areadetector.cam": (
+        "AdscDetectorCam",
+        "Andor3DetectorCam",
+        "AndorDetectorCam",
+        "BrukerDetectorCam",
+        "CamBase",
+        "DexelaDetectorCam",
+        "EigerDetectorCam",
+        "EmergentVisionDetectorCam",
+        "FirewireLinDetectorCam",
+        "FirewireWinDetectorCam",
+        "GreatEyesDetectorCam",
+        "Lambda750kCam",
+        "LightFieldDetectorCam",
+        "Mar345DetectorCam",
+        "MarCCDDetectorCam",
+        "PICamDetectorCam",
+        "PSLDetectorCam",
+        "PcoDetectorCam",
+        "PcoDetectorIO",
+        "PcoDetectorSimIO",
+        "PerkinElmerDetectorCam",
+        "PilatusDetectorCam",
+        "PixiradDetectorCam",
+        "PointGreyDetectorCam",
+        "ProsilicaDetectorCam",
+        "PvaDetectorCam",
+        "PvcamDetectorCam",
+        "RoperDetectorCam",
+        "SimDetectorCam",
+        "URLDetectorCam",
+        "UVCDetectorCam",
+        "Xspress3DetectorCam",
+    ),
+    ".areadetector.common_plugins": ("CommonPlugins", "PluginNamespace"),
+    ".areadetector.detectors": (
+        "AdscDetector",
+        "Andor3Detector",
+        "AndorDetector",
+        "AreaDetector",
+        "BrukerDetector",
+        "DetectorBase",
+        "DexelaDetector",
+        "EigerDetector",
+        "EmergentVisionDetector",
+        "FirewireLinDetector",
+        "FirewireWinDetector",
+        "GreatEyesDetector",
+        "LightFieldDetector",
+        "Mar345Detector",
+        "MarCCDDetector",
+        "PICamDetector",
+        "PSLDetector",
+        "PerkinElmerDetector",
+        "PilatusDetector",
+        "PixiradDetector",
+        "PointGreyDetector",
+        "ProsilicaDetector",
+        "PvaDetector",
+        "PvcamDetector",
+        "RoperDetector",
+        "SimDetector",
+        "URLDetector",
+        "UVCDetector",
+        "Xspress3Detector",
+    ),
+    ".areadetector.paths": ("EpicsPathSignal",),
+    ".areadetector.plugins": (
+        "ColorConvPlugin",
+        "FilePlugin",
+        "HDF5Plugin",
+        "ImagePlugin",
+        "JPEGPlugin",
+        "MagickPlugin",
+        "NetCDFPlugin",
+        "NexusPlugin",
+        "OverlayPlugin",
+        "ProcessPlugin",
+        "ROIPlugin",
+        "StatsPlugin",
+        "TIFFPlugin",
+        "TransformPlugin",
+        "get_areadetector_plugin",
+        "plugin_from_pvname",
+        "register_plugin",
+    ),
+    ".areadetector.trigger_mixins": (
+        "ADTriggerStatus",
+        "ContinuousAcquisitionTrigger",
+        "MultiTrigger",
+        "NDCircularBuffTriggerStatus",
+        "SingleTrigger",
+        "TriggerBase",
+        "TriggerStatus",
+    ),
+    ".device": ("BlueskyInterface", "Staged"),
+    ".ophydobj": ("OphydObject",),
+    ".signal": ("ArrayAttributeSignal", "UNSET_VALUE"),
+    ".status": ("DeviceStatus",),
+}
+_LAZY_ATTRS = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
+
+
+def __getattr__(name):
+    if name == "cl":
+        return get_cl()
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name == "__all__":
+        # For ``from ophyd import *``, which includes all of the lazy names
+        return sorted(name for name in __dir__() if not name.startswith("_"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS, "cl"})
+
+
 try:
     # Use live version from git
     from setuptools_scm import get_version
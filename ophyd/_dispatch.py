@@ -1,10 +1,16 @@
 import functools
+import heapq
+import itertools
 import logging
 import queue
 import threading
 import time
 
 
+def _wake():
+    "Queued to wake a callback thread when a timed callback is added"
+
+
 class _CallbackThread(threading.Thread):
     "A queue-based callback dispatcher thread"
 
@@ -32,6 +38,10 @@ class _CallbackThread(threading.Thread):
             callback_queue = queue.Queue()
 
         self.queue = callback_queue
+        # Heap of (deadline, sequence, callback, args, kwargs), see call_later
+        self._timed = []
+        self._timed_lock = threading.Lock()
+        self._timed_count = itertools.count()
 
     def __repr__(self):
         return "<{} qsize={}>".format(self.__class__.__name__, self.queue.qsize())
@@ -43,25 +53,64 @@ class _CallbackThread(threading.Thread):
 
         while not self.stop_event.is_set():
             try:
-                callback, args, kwargs = self.queue.get(True, self.timeout)
+                callback, args, kwargs = self.queue.get(True, self._run_timed())
             except queue.Empty:
                 ...
             else:
-                try:
-                    self.current_callback = (
-                        getattr(callback, "__name__", "(unnamed)"),
-                        kwargs.get("pvname"),
-                    )
-                    callback(*args, **kwargs)
-                except Exception:
-                    self.logger.exception(
-                        "Exception occurred during callback %r (pvname=%r)",
-                        callback,
-                        kwargs.get("pvname"),
-                    )
+                self._run_callback(callback, args, kwargs)
 
         self.detach_context()
 
+    def _run_callback(self, callback, args, kwargs):
+        try:
+            self.current_callback = (
+                getattr(callback, "__name__", "(unnamed)"),
+                kwargs.get("pvname"),
+            )
+            callback(*args, **kwargs)
+        except Exception:
+            self.logger.exception(
+                "Exception occurred during callback %r (pvname=%r)",
+                callback,
+                kwargs.get("pvname"),
+            )
+
+    def _run_timed(self):
+        """Run the timed callbacks which are due
+
+        Returns
+        -------
+        timeout : float
+            How long to wait for queued callbacks before checking again
+        """
+        while True:
+            with self._timed_lock:
+                if not self._timed:
+                    return self.timeout
+                wait = self._timed[0][0] - time.monotonic()
+                if wait > 0:
+                    return min(wait, self.timeout)
+                _, _, callback, args, kwargs = heapq.heappop(self._timed)
+            self._run_callback(callback, args, kwargs)
+
+    def call_later(self, delay, callback, *args, **kwargs):
+        """Run ``callback(*args, **kwargs)`` in this thread after ``delay``
+        seconds
+
+        Timed callbacks are run between queued callbacks, so they are ordered
+        with respect to the other callbacks of this thread.
+        """
+        deadline = time.monotonic() + delay
+        with self._timed_lock:
+            heapq.heappush(
+                self._timed,
+                (deadline, next(self._timed_count), callback, args, kwargs),
+            )
+            first = self._timed[0][0] == deadline
+        if first and threading.current_thread() is not self:
+            # Let the thread recompute how long it may block on the queue
+            self.queue.put((_wake, (), {}))
+
     def attach_context(self):
         self.logger.debug(
             "Callback thread %s attaching to context %s", self.name, self.context
@@ -198,6 +247,30 @@ class EventDispatcher:
         "Schedule `callback` with the given args and kwargs in a util thread"
         self._utility_queue.put((callback, args, kwargs))
 
+    def call_later(self, event_type, delay, callback, *args, **kwargs):
+        """Run ``callback(*args, **kwargs)`` after ``delay`` seconds, in the
+        thread of ``event_type``"""
+        self._threads[event_type].call_later(delay, callback, *args, **kwargs)
+
+    def _queued_by_pvname(self):
+        """Snapshot of the queued callbacks, for Device.memory_usage
+
+        Returns
+        -------
+        queued : dict
+            PV name to the keyword arguments of each callback queued for it
+        """
+        queues = {id(thread.queue): thread.queue for thread in self._threads.values()}
+        queued = {}
+        for callback_queue in queues.values():
+            with callback_queue.mutex:
+                items = list(callback_queue.queue)
+            for callback, args, kwargs in items:
+                pvname = kwargs.get("pvname")
+                if pvname is not None:
+                    queued.setdefault(pvname, []).append(kwargs)
+        return queued
+
     def get_thread_context(self, name):
         "Get the DispatcherThreadContext for the given thread name"
         return self._thread_contexts[name]
@@ -25,9 +25,18 @@ class DummyDispatcher:
     def schedule_utility_task(self, callback, *args, **kwargs):
         ...
 
+    def call_later(self, event_type, delay, callback, *args, **kwargs):
+        # There are no dispatcher threads to run the callback in
+        timer = threading.Timer(delay, callback, args, kwargs)
+        timer.daemon = True
+        timer.start()
+
     def get_thread_context(self, name):
         return DummyDispatcherThreadContext()
 
+    def _queued_by_pvname(self):
+        return {}
+
 
 thread_class = threading.Thread
 pv_form = "time"
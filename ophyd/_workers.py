@@ -0,0 +1,144 @@
+import concurrent.futures
+import contextvars
+import functools
+import queue
+import threading
+
+from . import get_cl
+
+
+def _start_thread(target, *args, name):
+    """Start a daemon thread running ``target(*args)``
+
+    The thread is of the control layer's thread class, so that it can make
+    control-system requests (with pyepics, it attaches to the CA context), and
+    runs in a copy of the current context variables.
+    """
+    thread = get_cl().thread_class(
+        target=contextvars.copy_context().run,
+        args=(target, *args),
+        name=name,
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+class _WorkerPool:
+    """Worker threads of a control layer, started as needed
+
+    Like ``concurrent.futures.ThreadPoolExecutor``, but the workers are made
+    with :func:`_start_thread`, and each call runs in a copy of the context of
+    its caller.
+    """
+
+    def __init__(self, max_workers, name):
+        self.max_workers = max_workers
+        self.name = name
+        self._queue = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._num_workers = 0
+        self._local = threading.local()
+
+    @property
+    def in_worker(self):
+        "Is the current thread one of the workers?"
+        return getattr(self._local, "in_worker", False)
+
+    def submit(self, func):
+        "Call ``func()`` in a worker; returns a concurrent.futures.Future"
+        future = concurrent.futures.Future()
+        self._queue.put((future, contextvars.copy_context(), func))
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                if self._num_workers < self.max_workers:
+                    self._num_workers += 1
+                    _start_thread(self._work, name=f"{self.name}_{self._num_workers}")
+        return future
+
+    def shutdown(self):
+        "Stop the workers once the calls already submitted are done"
+        with self._lock:
+            for _ in range(self._num_workers):
+                self._queue.put(None)
+            self._num_workers = 0
+
+    def _work(self):
+        self._local.in_worker = True
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, context, func = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = context.run(func)
+                except BaseException as ex:
+                    future.set_exception(ex)
+                else:
+                    future.set_result(result)
+            del item, future, context, func
+            self._idle.release()
+
+
+# Shared by all Devices to wait on control-system requests concurrently, one
+# per control layer thread class
+_MAX_WORKERS = 16
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool():
+    "The worker pool used for concurrent reads, created on first use"
+    thread_class = get_cl().thread_class
+    with _pools_lock:
+        pool = _pools.get(thread_class)
+        if pool is None:
+            pool = _pools[thread_class] = _WorkerPool(_MAX_WORKERS, "ophyd_device")
+        return pool
+
+
+def _call_all(components, method, parallel=True, **kwargs):
+    """Call ``method(**kwargs)`` on each of ``components``, returning results
+    in order
+
+    Calls on signals whose reads wait on the control system are made
+    concurrently, by worker threads of the control layer, while the others
+    are made here.  If any call fails, the exception of the first (in order)
+    is raised once all calls are done.
+    """
+    blocking = (
+        [cpt for cpt in components if getattr(cpt, "_read_needs_request", False)]
+        if parallel
+        else ()
+    )
+    if len(blocking) < 2:
+        return [getattr(cpt, method)(**kwargs) for cpt in components]
+
+    pool = _get_pool()
+    if pool.in_worker:
+        # Called from a read already made by a worker: waiting on the pool
+        # from here could deadlock it
+        return [getattr(cpt, method)(**kwargs) for cpt in components]
+
+    futures = {
+        id(cpt): pool.submit(functools.partial(getattr(cpt, method), **kwargs))
+        for cpt in blocking
+    }
+    results = []
+    error = None
+    for cpt in components:
+        future = futures.get(id(cpt))
+        try:
+            results.append(
+                future.result()
+                if future is not None
+                else getattr(cpt, method)(**kwargs)
+            )
+        except Exception as ex:
+            if error is None:
+                error = ex
+    if error is not None:
+        raise error
+    return results
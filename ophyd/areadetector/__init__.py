@@ -1,35 +1,110 @@
 """ """
 
+import importlib
+import importlib.util
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
-from .base import *  # noqa: F401, F402, E402, F403
-from .cam import *  # noqa: F401, F402, E402, F403
-from .common_plugins import *  # noqa: F401, F402, E402, F403
-from .detectors import *  # noqa: F401, F402, E402, F403
-from .paths import EpicsPathSignal  # noqa: F401, F402, E402, F403
-
-# NOTE: the following imports are here for backward compatibility with
-# previous ophyd versions. This does not represent all available plugins
-# in ophyd. For that, import directly from ophyd.areadetector.plugins.
-from .plugins import (  # noqa: F401, F402, E402
-    ColorConvPlugin,
-    FilePlugin,
-    HDF5Plugin,
-    ImagePlugin,
-    JPEGPlugin,
-    MagickPlugin,
-    NetCDFPlugin,
-    NexusPlugin,
-    OverlayPlugin,
-    ProcessPlugin,
-    ROIPlugin,
-    StatsPlugin,
-    TIFFPlugin,
-    TransformPlugin,
-    get_areadetector_plugin,
-    plugin_from_pvname,
-    register_plugin,
-)
-from .trigger_mixins import *  # noqa: F401, F402, E402, F403
+# The namespace of this package is filled on first access (see __getattr__) as
+# though by ``from module import *`` of each of these, in order, so that
+# importing a single submodule does not import all of the plugin and cam
+# classes.
+_STAR_MODULES = (".base", ".cam", ".common_plugins", ".detectors")
+_STAR_MODULES_LAST = (".trigger_mixins",)
+
+# NOTE: the following are here for backward compatibility with previous ophyd
+# versions. This does not represent all available plugins in ophyd. For that,
+# import directly from ophyd.areadetector.plugins.
+_ATTRS = {
+    "EpicsPathSignal": ".paths",
+    **{
+        name: ".plugins"
+        for name in (
+            "ColorConvPlugin",
+            "FilePlugin",
+            "HDF5Plugin",
+            "ImagePlugin",
+            "JPEGPlugin",
+            "MagickPlugin",
+            "NetCDFPlugin",
+            "NexusPlugin",
+            "OverlayPlugin",
+            "ProcessPlugin",
+            "ROIPlugin",
+            "StatsPlugin",
+            "TIFFPlugin",
+            "TransformPlugin",
+            "get_areadetector_plugin",
+            "plugin_from_pvname",
+            "register_plugin",
+        )
+    },
+}
+
+_load_lock = threading.RLock()
+_loaded = False
+_loading = False
+
+
+def _public_names(module):
+    "The names ``from module import *`` would import"
+    try:
+        return {name: getattr(module, name) for name in module.__all__}
+    except AttributeError:
+        return {
+            name: value
+            for name, value in vars(module).items()
+            if not name.startswith("_")
+        }
+
+
+def _is_submodule(name):
+    "Is ``name`` an (unimported) submodule, e.g., for ``from . import plugins``?"
+    try:
+        return importlib.util.find_spec(f"{__name__}.{name}") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _load():
+    global _loaded, _loading
+    with _load_lock:
+        # Submodules import each other through the package while loading
+        if _loaded or _loading:
+            return
+        _loading = True
+        try:
+            _load_namespace()
+            _loaded = True
+        finally:
+            _loading = False
+
+
+def _load_namespace():
+    namespace = {}
+    for module in _STAR_MODULES:
+        namespace.update(_public_names(importlib.import_module(module, __name__)))
+    for name, module in _ATTRS.items():
+        namespace[name] = getattr(importlib.import_module(module, __name__), name)
+    for module in _STAR_MODULES_LAST:
+        namespace.update(_public_names(importlib.import_module(module, __name__)))
+    globals().update(namespace)
+
+
+def __getattr__(name):
+    if (name.startswith("_") and name != "__all__") or _is_submodule(name):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load()
+    if name == "__all__":
+        return sorted(name for name in globals() if not name.startswith("_"))
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__():
+    _load()
+    return sorted(globals())
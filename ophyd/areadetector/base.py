@@ -140,8 +140,8 @@ class NDDerivedSignal(DerivedSignal):
 
         return np.asarray(value[:array_len]).reshape(array_shape)
 
-    def subscribe(self, callback, event_type=None, run=True):
-        cid = super().subscribe(callback, event_type=event_type, run=run)
+    def subscribe(self, callback, event_type=None, run=True, **kwargs):
+        cid = super().subscribe(callback, event_type=event_type, run=run, **kwargs)
         if not self._has_subscribed and (
             event_type is None or event_type == self.SUB_VALUE
         ):
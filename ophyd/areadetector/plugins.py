@@ -2922,14 +2922,14 @@ def get_areadetector_plugin_class(prefix, timeout=2.0):
     ValueError
         If the plugin type can't be determined
     """
-    from .. import cl
+    from .. import get_cl
 
     cls = plugin_from_pvname(prefix)
     if cls is not None:
         return cls
 
     type_rbv = prefix + "PluginType_RBV"
-    type_ = cl.caget(type_rbv, timeout=timeout)
+    type_ = get_cl().caget(type_rbv, timeout=timeout)
 
     if type_ is None:
         raise ValueError("Unable to determine plugin type (caget timed out)")
@@ -10,6 +10,7 @@ import itertools
 import logging
 import operator
 import textwrap
+import threading
 import time as ttime
 import typing
 import warnings
@@ -31,16 +32,36 @@ from typing import (
     Union,
 )
 
-from .ophydobj import Kind, OphydObject
-from .signal import Signal
+import numpy as np
+
+from ._workers import _MAX_WORKERS, _call_all, _start_thread, _WorkerPool
+from .lazy_profile import _record_instantiation
+from .ophydobj import (
+    Kind,
+    OphydObject,
+    _get_kind_generation,
+    _kind_changed,
+)
+from .signal import (
+    UNSET_VALUE,
+    Signal,
+    VectorSignal,
+    _copy_description,
+    put_group,
+)
 from .status import DeviceStatus, StatusBase
+from .tracing import trace_class_methods
 from .utils import (
+    DeviceCreationError,
+    DisconnectedError,
     ExceptionBundle,
     RedundantStaging,
+    approx_nbytes,
     doc_annotation_forwarder,
     getattrs,
     underscores_to_camel_case,
 )
+from .utils.epics_pvs import _compare_maybe_enum
 
 A, B = TypeVar("A"), TypeVar("B")
 ALL_COMPONENTS = object()
@@ -86,6 +107,25 @@ DEVICE_RESERVED_ATTRS = {
 
 DEFAULT_CONNECTION_TIMEOUT = object()
 
+# Device methods implemented via Device._get_read_plan, and the component kind
+# each is collected over
+_READ_PLAN_KINDS = {
+    "read": Kind.normal,
+    "describe": Kind.normal,
+    "hints": Kind.normal,
+    "read_configuration": Kind.config,
+    "describe_configuration": Kind.config,
+}
+
+
+def _uses_default_read(cls, method):
+    """Does ``cls`` use Device's own implementation of ``method``?
+
+    Only sub-devices which do can be flattened into their parent's read plan.
+    """
+    definers = [base for base in cls.__mro__ if method in base.__dict__]
+    return definers[0] is Device and set(definers) <= {Device, BlueskyInterface}
+
 
 class OrderedDictType(Dict[A, B]):
     ...
@@ -103,6 +143,25 @@ class Staged(Enum):
 
 
 ComponentWalk = namedtuple("ComponentWalk", "ancestors dotted_name item")
+MemoryUsage = namedtuple(
+    "MemoryUsage",
+    "name kind readback replay subscriptions queued queued_bytes buffers total",
+)
+MemoryUsage.__doc__ = """Approximate memory attributed to a Signal or Device
+
+Sizes are in bytes; for a Device they include everything below it.
+"""
+
+# Columns of Device.memory_report and their headings
+_MEMORY_COLUMNS = (
+    ("readback", "readback"),
+    ("replay", "replay"),
+    ("subscriptions", "subs"),
+    ("queued", "queued"),
+    ("queued_bytes", "queued B"),
+    ("buffers", "buffers"),
+    ("total", "total"),
+)
 
 
 K = TypeVar("K", bound=OphydObject)
@@ -193,6 +252,7 @@ class Component(typing.Generic[K]):
         self.kwargs = kwargs
         self.lazy = lazy if lazy is not None else self.lazy_default
         self.suffix = suffix
+        self._doc_owner = None
         self.doc = doc
         self.trigger_value = trigger_value  # TODO discuss
         self.kind = Kind[kind.lower()] if isinstance(kind, str) else Kind(kind)
@@ -214,8 +274,19 @@ class Component(typing.Generic[K]):
 
     def __set_name__(self, owner, attr_name: str):
         self.attr = attr_name
-        if self.doc is None:
-            self.doc = self.make_docstring(owner)
+        # The docstring is made on first access of ``doc``
+        self._doc_owner = owner
+
+    @property
+    def doc(self) -> Optional[str]:
+        "Documentation string, by default generated by make_docstring"
+        if self._doc is None and self._doc_owner is not None:
+            self._doc = self.make_docstring(self._doc_owner)
+        return self._doc
+
+    @doc.setter
+    def doc(self, doc: Optional[str]):
+        self._doc = doc
 
     @property
     def is_device(self):
@@ -280,8 +351,8 @@ class Component(typing.Generic[K]):
 
     def make_docstring(self, parent_class):
         "Create a docstring for the Component"
-        if self.doc is not None:
-            return self.doc
+        if self._doc is not None:
+            return self._doc
 
         doc = [
             "{} attribute".format(self.__class__.__name__),
@@ -516,18 +587,269 @@ class DynamicDeviceComponent(Component["Device"]):
         )
 
 
+class VectorComponent(Component[VectorSignal]):
+    """A bank of homogeneous channel PVs, as one array-valued signal
+
+    Rather than one sub-device or signal per channel, as with a
+    DynamicDeviceComponent, the channels are read and described as a single
+    :class:`~ophyd.signal.VectorSignal`:
+
+    >>> class Scaler(Device):
+    ...     counts = VectorComponent(EpicsSignalRO, ".S{channel}", range(1, 33))
+
+    >>> scaler = Scaler("XF:SCALER", name="scaler")
+    >>> scaler.counts.channels[0].pvname
+    'XF:SCALER.S1'
+
+    Parameters
+    ----------
+    channel_cls : class
+        Class of the channel signals, such as EpicsSignalRO
+    suffix : str
+        The PV suffix, with a ``{channel}`` field formatted with each of
+        ``channels``.  It is then added onto the parent prefix, as with
+        Component.
+    channels : iterable
+        The channel identifiers, in array order
+    channel_names : sequence of str, optional
+        Names of the channels, as reported by ``describe()``.  Defaults to
+        the channel identifiers.
+    dtype : numpy dtype, optional
+        Data type of the array
+    cls : class, optional
+        Defaults to VectorSignal
+
+    Other keyword arguments are passed to ``channel_cls``.  For more, refer to
+    Component.
+    """
+
+    def __init__(
+        self,
+        channel_cls,
+        suffix,
+        channels,
+        *,
+        channel_names=None,
+        dtype=None,
+        cls=VectorSignal,
+        lazy=None,
+        doc=None,
+        kind=Kind.normal,
+        **kwargs,
+    ):
+        self.channel_cls = channel_cls
+        self.channels = tuple(channels)
+        if channel_names is None:
+            channel_names = [str(channel) for channel in self.channels]
+        self.channel_names = tuple(channel_names)
+        self.dtype = dtype
+        super().__init__(cls, suffix, lazy=lazy, doc=doc, kind=kind, **kwargs)
+
+    def __getnewargs_ex__(self):
+        "Get arguments needed to copy this class (used for pickle/copy)"
+        kwargs = dict(
+            self.kwargs,
+            channel_names=self.channel_names,
+            dtype=self.dtype,
+            cls=self.cls,
+            lazy=self.lazy,
+            doc=self._doc,
+            kind=self.kind,
+        )
+        return ((self.channel_cls, self.suffix, self.channels), kwargs)
+
+    def create_component(self, instance):
+        "Instantiate the channel signals and the VectorSignal for a Device"
+        name = f"{instance.name}{instance._child_name_separator}{self.attr}"
+        kwargs = {
+            kw: self.maybe_add_prefix(instance, kw, val)
+            for kw, val in self.kwargs.items()
+        }
+        channels = [
+            self.channel_cls(
+                self.maybe_add_prefix(
+                    instance, "suffix", self.suffix.format(channel=channel)
+                ),
+                name=f"{name}_{channel_name}",
+                **kwargs,
+            )
+            for channel, channel_name in zip(self.channels, self.channel_names)
+        ]
+        cpt_inst = self.cls(
+            channels,
+            channel_names=self.channel_names,
+            dtype=self.dtype,
+            name=name,
+            parent=instance,
+            kind=instance._component_kinds[self.attr],
+            attr_name=self.attr,
+        )
+
+        if self.lazy and getattr(instance, "lazy_wait_for_connection", True):
+            cpt_inst.wait_for_connection()
+
+        return cpt_inst
+
+    def __repr__(self):
+        repr_dict = dict(self.kwargs, kind=self.kind.name)
+        kw_str = "".join(f", {k}={v!r}" for k, v in repr_dict.items())
+        return (
+            f"{self.__class__.__name__}({self.channel_cls.__name__}, "
+            f"{self.suffix!r}, {list(self.channels)!r}{kw_str})"
+        )
+
+    __str__ = __repr__
+
+
 # These stub 'Interface' classes are the apex of the mro heirarchy for
 # their respective methods. They make multiple interitance more
 # forgiving, and let us define classes that customize these methods
 # but are not full Devices.
 
 
+# describe() dtypes to numpy dtypes, where there is no dtype_numpy
+_STRUCTURED_DTYPES = {
+    "number": "f8",
+    "integer": "i8",
+    "boolean": "?",
+}
+
+
+def _structured_field_dtype(data_key):
+    "The numpy dtype of a field of read_structured, for a describe() entry"
+    shape = tuple(data_key.get("shape") or ())
+    if not all(isinstance(dim, int) and dim > 0 for dim in shape):
+        return "O"
+    dtype = data_key.get("dtype_numpy") or _STRUCTURED_DTYPES.get(data_key["dtype"])
+    if dtype is None or (shape and not data_key.get("dtype_numpy")):
+        return "O"
+    return (dtype, shape) if shape else dtype
+
+
+def _values_equal(a, b):
+    "Compare two readback values, which may be arrays or enum strings"
+    try:
+        return bool(_compare_maybe_enum(a, b, (), None, None))
+    except Exception:
+        return False
+
+
+def _always_set(sig):
+    "Does writing ``sig`` have an effect even if its value does not change?"
+    if getattr(sig, "always_set", False):
+        return True
+    # Writing a record's PROC field processes it
+    setpoint_pvname = getattr(sig, "setpoint_pvname", None)
+    return isinstance(setpoint_pvname, str) and setpoint_pvname.upper().endswith(
+        ".PROC"
+    )
+
+
+def _current_setpoint(sig, value=UNSET_VALUE):
+    """The value of ``sig`` to compare with the target of a set
+
+    This is the setpoint, for signals with a setpoint PV of their own, and
+    otherwise ``value`` (the value of ``sig``, read here if not given).
+    Returns None if it cannot be read.
+    """
+    try:
+        if hasattr(sig, "get_setpoint") and sig.setpoint_pvname != sig.pvname:
+            return sig.get_setpoint()
+        if value is UNSET_VALUE:
+            return sig.get()
+    except Exception:
+        return None
+    return value
+
+
+def _value_matches(sig, current, target):
+    """Is ``current``, a value of ``sig``, already ``target``?
+
+    Uses the tolerances and enum strings of ``sig``, as when waiting for a
+    set to complete.  Values that cannot be compared do not match.
+    """
+    if current is None:
+        return False
+    try:
+        enum_strs = sig.enum_strs or ()
+    except (AttributeError, KeyError):
+        enum_strs = ()
+    try:
+        return bool(
+            _compare_maybe_enum(
+                target,
+                current,
+                enum_strs,
+                getattr(sig, "tolerance", None),
+                getattr(sig, "rtolerance", None),
+            )
+        )
+    except Exception:
+        return False
+
+
+def _call_in_threads(funcs):
+    """Call each of ``funcs`` in its own control layer thread and wait for all
+    of them
+
+    Returns the results in order.  If any call fails, the exception of the
+    first (in order) is raised once all calls are done.
+    """
+    if len(funcs) < 2:
+        return [func() for func in funcs]
+
+    results = [None] * len(funcs)
+    errors = [None] * len(funcs)
+
+    def run(idx, func):
+        try:
+            results[idx] = func()
+        except Exception as ex:
+            errors[idx] = ex
+
+    threads = [
+        _start_thread(run, idx, func, name=f"ophyd_stage_{idx}")
+        for idx, func in enumerate(funcs)
+    ]
+    for thread in threads:
+        thread.join()
+
+    for error in errors:
+        if error is not None:
+            raise error
+    return results
+
+
 class BlueskyInterface:
     """Classes that inherit from this can safely customize the
     these methods without breaking mro.
 
+    Attributes
+    ----------
+    parallel_staging : bool
+        If True, ``stage()`` and ``unstage()`` set the ``stage_sigs``
+        concurrently and stage sibling sub-devices in parallel, following
+        ``stage_order``.  Default is False: everything is done one at a
+        time, in order.
+    skip_redundant_sets : bool
+        If True, ``stage()``, ``unstage()`` and ``configure()`` do not set
+        signals whose setpoint already has the requested value (within
+        their tolerances), other than signals with ``always_set`` and PROC
+        fields.  Skipped ``stage_sigs`` are still restored by ``unstage()``
+        if they changed in the meantime.  Default is False.
+    stage_order : sequence
+        Ordering hints used with ``parallel_staging``.  Each entry is a group
+        of ``stage_sigs`` keys and/or sub-device attribute names (or a single
+        one) which is applied, all at once, only after the previous groups
+        are done.  Anything not listed is applied last.  ``unstage()`` uses
+        the reverse order.  For example, ``[["cam.acquire"]]`` stops
+        acquisition before any other setting is changed.
     """
 
+    parallel_staging = False
+    stage_order = ()
+    skip_redundant_sets = False
+
     def __init__(self, *args, **kwargs):
         # Subclasses can populate this with (signal, value) pairs, to be
         # set by stage() and restored back by unstage().
@@ -663,6 +985,9 @@ class BlueskyInterface:
         # Read current values, to be restored by unstage()
         original_vals = {sig: sig.get() for sig in stage_sigs}
 
+        if self.parallel_staging:
+            return self._stage_parallel(stage_sigs, original_vals)
+
         # We will add signals and values from original_vals to
         # self._original_vals one at a time so that
         # we can undo our partial work in the event of an error.
@@ -677,7 +1002,9 @@ class BlueskyInterface:
                     val,
                     original_vals[sig],
                 )
-                sig.set(val).wait()
+                status = self._set_if_needed(sig, val, original_vals[sig])
+                if status is not None:
+                    status.wait()
                 # It worked -- now add it to this list of sigs to unstage.
                 self._original_vals[sig] = original_vals[sig]
             devices_staged.append(self)
@@ -722,6 +1049,9 @@ class BlueskyInterface:
         """
         self.log.debug("Unstaging %s", self.name)
         self._staged = Staged.partially
+        if self.parallel_staging:
+            return self._unstage_parallel()
+
         devices_unstaged = []
 
         # Call unstage() on child devices.
@@ -734,13 +1064,166 @@ class BlueskyInterface:
         # Restore original values.
         for sig, val in reversed(list(self._original_vals.items())):
             self.log.debug("Setting %s back to its original value: %r", sig.name, val)
-            sig.set(val).wait()
+            status = self._set_if_needed(sig, val)
+            if status is not None:
+                status.wait()
             self._original_vals.pop(sig)
         devices_unstaged.append(self)
 
         self._staged = Staged.no
         return devices_unstaged
 
+    def _set_if_needed(self, sig, val, current=UNSET_VALUE):
+        """Start setting ``sig`` to ``val``, unless it already has that value
+
+        Parameters
+        ----------
+        sig : Signal
+        val : any
+        current : any, optional
+            The current value of ``sig``, if known; otherwise it is read
+
+        Returns
+        -------
+        status : StatusBase or None
+            None if no set was needed
+        """
+        if self.skip_redundant_sets and not _always_set(sig):
+            current = _current_setpoint(sig, current)
+            if _value_matches(sig, current, val):
+                self.log.debug("%s is already %r, not setting it", sig.name, val)
+                return None
+        return sig.set(val)
+
+    def _stage_groups(self, items, order=None):
+        """Split ``items`` into groups to apply in turn, as per ``stage_order``
+
+        ``items`` are signals (resolved ``stage_sigs`` keys) or sub-device
+        attribute names.  ``order``, if given, is used instead of
+        ``stage_order``.
+        """
+        if order is None:
+            order = self.stage_order
+        remaining = list(items)
+        groups = []
+        for hint in order:
+            if isinstance(hint, (str, OphydObject)):
+                hint = [hint]
+            names = {key for key in hint if isinstance(key, str)}
+            # Device.__getattr__ handles nested attr lookup
+            objects = [
+                getattr(self, key, None) if key in names else key for key in hint
+            ]
+            group = [
+                item
+                for item in remaining
+                if (
+                    item in names
+                    if isinstance(item, str)
+                    else any(item is obj for obj in objects)
+                )
+            ]
+            if group:
+                groups.append(group)
+                remaining = [item for item in remaining if item not in group]
+        if remaining:
+            groups.append(remaining)
+        return groups
+
+    def _stage_parallel(self, stage_sigs, original_vals):
+        "stage() with parallel_staging: set each group of signals at once"
+        devices_staged = []
+        try:
+            for group in self._stage_groups(list(stage_sigs)):
+                statuses = []
+                for sig in group:
+                    self.log.debug(
+                        "Setting %s to %r (original value: %r)",
+                        sig.name,
+                        stage_sigs[sig],
+                        original_vals[sig],
+                    )
+                    statuses.append(
+                        self._set_if_needed(sig, stage_sigs[sig], original_vals[sig])
+                    )
+
+                error = None
+                for sig, status in zip(group, statuses):
+                    try:
+                        if status is not None:
+                            status.wait()
+                    except Exception as ex:
+                        error = error or ex
+                    else:
+                        # It worked -- now add it to the sigs to unstage.
+                        self._original_vals[sig] = original_vals[sig]
+                if error is not None:
+                    raise error
+            devices_staged.append(self)
+
+            # Stage each group of child devices in parallel
+            children = [
+                attr
+                for attr in self._sub_devices
+                if hasattr(getattr(self, attr), "stage")
+            ]
+            for group in self._stage_groups(children):
+                devices = [getattr(self, attr) for attr in group]
+                _call_in_threads([device.stage for device in devices])
+                devices_staged.extend(devices)
+        except Exception:
+            self.log.debug(
+                "An exception was raised while staging %s or "
+                "one of its children. Attempting to restore "
+                "original settings before re-raising the "
+                "exception.",
+                self.name,
+            )
+            self.unstage()
+            raise
+        else:
+            self._staged = Staged.yes
+        return devices_staged
+
+    def _unstage_parallel(self):
+        "unstage() with parallel_staging: the reverse of _stage_parallel"
+        devices_unstaged = []
+
+        children = [
+            attr
+            for attr in self._sub_devices
+            if hasattr(getattr(self, attr), "unstage")
+        ]
+        for group in reversed(self._stage_groups(children)):
+            devices = [getattr(self, attr) for attr in group]
+            _call_in_threads([device.unstage for device in devices])
+            devices_unstaged.extend(devices)
+
+        for group in reversed(self._stage_groups(list(self._original_vals))):
+            statuses = []
+            for sig in group:
+                val = self._original_vals[sig]
+                self.log.debug(
+                    "Setting %s back to its original value: %r", sig.name, val
+                )
+                statuses.append(self._set_if_needed(sig, val))
+
+            error = None
+            for sig, status in zip(group, statuses):
+                try:
+                    if status is not None:
+                        status.wait()
+                except Exception as ex:
+                    error = error or ex
+                else:
+                    self._original_vals.pop(sig)
+            if error is not None:
+                raise error
+        devices_unstaged.append(self)
+
+        self._staged = Staged.no
+        return devices_unstaged
+
     def pause(self) -> None:
         """Attempt to 'pause' the device.
 
@@ -821,6 +1304,20 @@ class Device(BlueskyInterface, OphydObject):
         connect before returning control to the user.  See also the context
         manager helpers: ``wait_for_lazy_connection`` and
         ``do_not_wait_for_lazy_connection``.
+    parallel_reads : bool
+        In ``read()`` and ``read_configuration()``, read the signals that
+        request their value from the control system (such as EpicsSignals
+        without ``auto_monitor``) concurrently, in worker threads of the
+        control layer.  Default is False.
+    cache_configuration : bool
+        Subscribe to the configuration signals and have
+        ``read_configuration()`` re-read only those that reported a new
+        value since the last call, returning the cached reading for the
+        others.  Default is False.
+    configuration_changed_keys : frozenset
+        With ``cache_configuration``, the keys of ``read_configuration()``
+        whose value changed between its last two calls (all keys on the
+        first call).
 
     Subscriptions
     -------------
@@ -851,6 +1348,12 @@ class Device(BlueskyInterface, OphydObject):
     # connect before returning control to the user
     lazy_wait_for_connection = True
 
+    # Read signals which wait on the control system concurrently
+    parallel_reads = False
+
+    # Track changes of configuration signals; see _read_configuration_cached
+    cache_configuration = False
+
     def __init__(
         self,
         prefix="",
@@ -868,9 +1371,29 @@ class Device(BlueskyInterface, OphydObject):
         self._child_name_separator = child_name_separator
         # Store EpicsSignal objects (only created once they are accessed)
         self._signals = {}
+        self._instantiate_lock = threading.RLock()
+        # Flattened hierarchy of instantiated components; see _get_index
+        self._index = {}
+        self._index_generation = 0
 
         # Copy the Device-defined signal kinds, for user modification
         self._component_kinds = self._component_kinds.copy()
+        # method name -> flattened components to call it on; see _get_read_plan
+        self._read_plans = {}
+        self._read_plans_generation = None
+        # method name -> (plan, keys, description); see _describe_plan
+        self._describe_cache = {}
+        # (plan, describe keys, value dtype, timestamp dtype) and
+        # (plan, layout); see structured_dtype
+        self._structured = None
+        self._structured_layout_cache = None
+        # State of _read_configuration_cached
+        self._config_lock = threading.Lock()
+        self._config_plan = None
+        self._config_subscriptions = []
+        self._config_dirty = set()
+        self._config_readings = {}
+        self.configuration_changed_keys = frozenset()
 
         # Subscriptions to run or general methods necessary to call prior to
         # marking the Device as connected
@@ -978,6 +1501,11 @@ class Device(BlueskyInterface, OphydObject):
 
         cls._sig_attrs.update(**this_sig_attrs)
 
+        # methods which instances can implement via their read plans
+        cls._default_read_methods = frozenset(
+            method for method in _READ_PLAN_KINDS if _uses_default_read(cls, method)
+        )
+
         # Record the class-defined kinds - these can be updated on a
         # per-instance basis
         cls._component_kinds = {attr: cpt.kind for attr, cpt in cls._sig_attrs.items()}
@@ -1017,6 +1545,8 @@ class Device(BlueskyInterface, OphydObject):
         "This is called automatically in Python for all subclasses of Device"
         super().__init_subclass__(**kwargs)
         cls._initialize_device()
+        # Spans on stage/unstage/trigger, see ophyd.tracing.config_ophyd_tracing
+        trace_class_methods(cls, "devices", ("stage", "unstage", "trigger"))
 
     @classmethod
     def walk_components(cls):
@@ -1097,27 +1627,7 @@ class Device(BlueskyInterface, OphydObject):
             Where ancestors is all ancestors of the signal, including the
             top-level device `walk_signals` was called on.
         """
-        for attr, cpt in self._sig_attrs.items():
-            # 2 scenarios:
-            #  - Always include non-lazy components
-            #  - Include a lazy if already instantiated OR requested with
-            #    include_lazy
-            lazy_ok = cpt.lazy and (include_lazy or attr in self._signals)
-            should_walk = not cpt.lazy or lazy_ok
-
-            if not should_walk:
-                continue
-
-            sig = getattr(self, attr)
-            if isinstance(sig, Device):
-                for walk in sig.walk_signals(include_lazy=include_lazy):
-                    ancestors = (self,) + walk.ancestors
-                    dotted_name = ".".join((attr, walk.dotted_name))
-                    yield ComponentWalk(
-                        ancestors=ancestors, dotted_name=dotted_name, item=walk.item
-                    )
-            else:
-                yield ComponentWalk(ancestors=(self,), dotted_name=attr, item=sig)
+        yield from self._get_index("signals", include_lazy)
 
     @classmethod
     def walk_subdevice_classes(cls):
@@ -1147,23 +1657,93 @@ class Device(BlueskyInterface, OphydObject):
         ------
         (dotted_name, subdevice_instance)
         """
-        # TODO: Devices can be lazy, outside of original design intent; should
-        # discuss this at some point
-        cls = type(self)
-        for attr in cls._sub_devices:
-            cpt = getattr(cls, attr)
-            lazy_ok = cpt.lazy and (include_lazy or attr in self._signals)
-            should_walk = not cpt.lazy or lazy_ok
+        yield from self._get_index("subdevices", include_lazy)
 
-            if should_walk:
-                dev = getattr(self, attr)
-                yield (attr, dev)
-                for sub_attr, sub_dev in dev.walk_subdevices(include_lazy=include_lazy):
-                    yield (".".join((attr, sub_attr)), sub_dev)
+    def _walked_components(self, include_lazy):
+        "(attr, component instance) pairs walked by walk_signals/subdevices"
+        for attr, cpt in self._sig_attrs.items():
+            # 2 scenarios:
+            #  - Always include non-lazy components
+            #  - Include a lazy if already instantiated OR requested with
+            #    include_lazy
+            # TODO: Devices can be lazy, outside of original design intent;
+            # should discuss this at some point
+            if not cpt.lazy or include_lazy or attr in self._signals:
+                yield attr, getattr(self, attr)
+
+    def _build_index(self, include_lazy):
+        "Flatten the hierarchy below this Device; see _get_index"
+        signals = []
+        subdevices = []
+        for attr, obj in self._walked_components(include_lazy):
+            if isinstance(obj, Device):
+                subdevices.append((attr, obj))
+                for walk in obj._get_index("signals", include_lazy):
+                    signals.append(
+                        ComponentWalk(
+                            ancestors=(self,) + walk.ancestors,
+                            dotted_name=f"{attr}.{walk.dotted_name}",
+                            item=walk.item,
+                        )
+                    )
+                subdevices.extend(
+                    (f"{attr}.{sub_attr}", sub_dev)
+                    for sub_attr, sub_dev in obj._get_index("subdevices", include_lazy)
+                )
+            else:
+                signals.append(
+                    ComponentWalk(ancestors=(self,), dotted_name=attr, item=obj)
+                )
+
+        names = dict(subdevices)
+        names.update((walk.dotted_name, walk.item) for walk in signals)
+        return {
+            "signals": tuple(signals),
+            "subdevices": tuple(subdevices),
+            "names": names,
+        }
+
+    def _get_index(self, kind, include_lazy=False):
+        """The flattened component hierarchy below this Device
+
+        The index is built on first use and kept until a component is
+        instantiated anywhere below this Device, so that whole-tree walks
+        do not recurse on every call.
+
+        Parameters
+        ----------
+        kind : {'signals', 'subdevices', 'names'}
+            'signals' is a tuple of ComponentWalk for all signals,
+            'subdevices' a tuple of (dotted_name, device) and 'names' a
+            dictionary of dotted name to signal or device.
+        include_lazy : bool, optional
+            Include (and instantiate) lazy components which have not yet been
+            instantiated
+        """
+        try:
+            return self._index[include_lazy][kind]
+        except KeyError:
+            pass
+
+        generation = self._index_generation
+        index = self._build_index(include_lazy)
+        if self._index_generation == generation:
+            self._index[include_lazy] = index
+        return index[kind]
+
+    def _invalidate_index(self):
+        "Drop the component index of this Device and all of its parents"
+        dev = self
+        while isinstance(dev, Device):
+            dev._index_generation += 1
+            dev._index = {}
+            dev = dev.parent
 
     def destroy(self):
         "Disconnect and destroy all signals on the Device"
         self._destroyed = True
+        self._config_subscriptions = []
+        self._config_plan = None
         exceptions = []
         for walk in self.walk_signals(include_lazy=False):
             sig = walk.item
@@ -1204,8 +1784,9 @@ class Device(BlueskyInterface, OphydObject):
         """Set the Kind for a given Component"""
         if name in self._signals:
             self._signals[name].kind = kind
-        else:
+        elif self._component_kinds.get(name) != kind:
             self._component_kinds[name] = kind
+            _kind_changed()
 
     def _get_components_of_kind(self, kind):
         "Get names of components that match a specific kind"
@@ -1215,6 +1796,84 @@ class Device(BlueskyInterface, OphydObject):
             if kind & component_kind:
                 yield component_name, getattr(self, component_name)
 
+    def _get_read_plan(self, method):
+        """The components to call ``method`` on to implement it for this Device
+
+        Sub-devices which use the default implementation of ``method`` are
+        flattened into their own plans, so the result is mostly leaf signals
+        in the order the recursive implementation would visit them.  Plans
+        are cached until the kind of any component changes (including by
+        setting ``read_attrs`` or ``configuration_attrs``).
+
+        Parameters
+        ----------
+        method : {'read', 'describe', 'read_configuration',
+                  'describe_configuration', 'hints'}
+
+        Returns
+        -------
+        components : tuple
+        """
+        generation = _get_kind_generation()
+        if self._read_plans_generation != generation:
+            self._read_plans.clear()
+            self._read_plans_generation = generation
+
+        try:
+            return self._read_plans[method]
+        except KeyError:
+            pass
+
+        plan = []
+        for _, component in self._get_components_of_kind(_READ_PLAN_KINDS[method]):
+            if method in getattr(component, "_default_read_methods", ()):
+                plan.extend(component._get_read_plan(method))
+            else:
+                plan.append(component)
+
+        plan = tuple(plan)
+        # Only cache it if no kinds changed while building it
+        if _get_kind_generation() == generation:
+            self._read_plans[method] = plan
+        return plan
+
+    def _describe_plan(self, method):
+        """Merge the output of ``method`` over the components of its read plan
+
+        The merged description is cached, and reused for as long as the plan
+        and the ``_describe_key()`` of each signal in it are unchanged.
+        """
+        plan = self._get_read_plan(method)
+        keys = [
+            cpt._describe_key() if getattr(cpt, "_describe_cacheable", False) else None
+            for cpt in plan
+        ]
+        cacheable = None not in keys
+
+        cached = self._describe_cache.get(method)
+        if cacheable and cached is not None:
+            cached_plan, cached_keys, desc = cached
+            if cached_plan is plan and cached_keys == keys:
+                return OrderedDict(
+                    (key, _copy_description(val)) for key, val in desc.items()
+                )
+
+        desc = OrderedDict()
+        for cpt in plan:
+            desc.update(getattr(cpt, method)())
+
+        if cacheable:
+            # Describing may have read values for the first time
+            keys = [cpt._describe_key() for cpt in plan]
+            self._describe_cache[method] = (
+                plan,
+                keys,
+                OrderedDict((key, _copy_description(val)) for key, val in desc.items()),
+            )
+        else:
+            self._describe_cache.pop(method, None)
+        return desc
+
     def _validate_kind(self, val):
         val = super()._validate_kind(val)
         if Kind.normal & val:
@@ -1323,6 +1982,117 @@ class Device(BlueskyInterface, OphydObject):
 
         return "\n".join(out)
 
+    def _memory_buffers(self):
+        """Bytes buffered by this Device on behalf of its components
+
+        Returns
+        -------
+        buffers : dict
+            Dotted component name (or '' for the Device itself) to a list of
+            the buffered objects
+        """
+        return {}
+
+    def memory_usage(self):
+        """Attribute the memory held by ophyd to each signal and sub-device
+
+        Only instantiated components are included.  Each Signal is attributed
+        its cached readback value, the payloads in its subscription replay
+        cache, the callbacks queued for its PVs in the dispatcher and the
+        buffers held for it by its parents (such as the data collected by a
+        flyer).  Each Device is attributed its own caches plus everything
+        below it.
+
+        The sizes are approximate: the ``nbytes`` of arrays and
+        ``sys.getsizeof`` of other values.  An object held in several places,
+        such as a readback value which is also in the replay cache, is only
+        counted once per row, in the first of the readback, replay, queued
+        and buffers columns.
+
+        Returns
+        -------
+        usage : list of MemoryUsage
+            Largest total first
+        """
+        signals = [walk.item for walk in self._get_index("signals")]
+        devices = [self] + [dev for _, dev in self._get_index("subdevices")]
+        usage = {obj: obj._memory_usage() for obj in signals + devices}
+        for entry in usage.values():
+            entry.update(queued=0, queued_bytes=[], buffers=[])
+
+        dispatchers = {getattr(sig, "_dispatcher", None) for sig in signals}
+        dispatchers.discard(None)
+        queued = {}
+        for dispatcher in dispatchers:
+            queued.update(dispatcher._queued_by_pvname())
+
+        for sig in signals:
+            entry = usage[sig]
+            for pvname in {
+                getattr(sig, "pvname", None),
+                getattr(sig, "setpoint_pvname", None),
+            }:
+                for kwargs in queued.get(pvname, ()):
+                    entry["queued"] += 1
+                    entry["queued_bytes"].append(kwargs.get("value"))
+
+        for dev in devices:
+            names = dev._get_index("names")
+            for dotted_name, buffered in dev._memory_buffers().items():
+                obj = names.get(dotted_name, dev) if dotted_name else dev
+                usage[obj]["buffers"].extend(buffered)
+
+        def row(obj, entries, kind):
+            totals = {
+                key: sum(entry[key] for entry in entries)
+                for key in ("subscriptions", "queued")
+            }
+            seen = set()
+            for key in ("readback", "replay", "queued_bytes", "buffers"):
+                totals[key] = 0
+                for entry in entries:
+                    for value in entry[key]:
+                        if value is not None and id(value) not in seen:
+                            seen.add(id(value))
+                            totals[key] += approx_nbytes(value)
+            total = sum(
+                totals[key] for key in ("readback", "replay", "queued_bytes", "buffers")
+            )
+            return MemoryUsage(name=obj.name, kind=kind, total=total, **totals)
+
+        rows = [row(sig, [usage[sig]], "signal") for sig in signals]
+        for dev in devices:
+            below = [walk.item for walk in dev._get_index("signals")]
+            below += [sub for _, sub in dev._get_index("subdevices")]
+            rows.append(row(dev, [usage[obj] for obj in [dev] + below], "device"))
+
+        rows.sort(key=lambda row: (-row.total, -row.subscriptions, row.name))
+        return rows
+
+    def memory_report(self, limit=None):
+        """A table of :meth:`memory_usage`, largest first
+
+        Parameters
+        ----------
+        limit : int, optional
+            Include only this many rows
+
+        Returns
+        -------
+        report : str
+        """
+        rows = self.memory_usage()[:limit]
+        width = max([len("name")] + [len(row.name) for row in rows])
+        header = [f"{'name':<{width}} {'kind':<6}"]
+        header.extend(f"{heading:>10}" for _, heading in _MEMORY_COLUMNS)
+        out = [" ".join(header)]
+        out.append("-" * len(out[0]))
+        for row in rows:
+            line = [f"{row.name:<{width}} {row.kind:<6}"]
+            line.extend(f"{getattr(row, key):>10}" for key, _ in _MEMORY_COLUMNS)
+            out.append(" ".join(line))
+        return "\n".join(out)
+
     def wait_for_connection(
         self, all_signals=False, timeout=DEFAULT_CONNECTION_TIMEOUT
     ):
@@ -1385,22 +2155,18 @@ class Device(BlueskyInterface, OphydObject):
         if attr_prefix is None:
             attr_prefix = self.name
 
-        for attr, sig in self._signals.items():
+        for walk in self._get_index("signals"):
             # fully qualified attribute name from top-level device
-            full_attr = "{}.{}".format(attr_prefix, attr)
-            if isinstance(sig, Device):
-                yield from sig.get_instantiated_signals(attr_prefix=full_attr)
-            else:
-                yield full_attr, sig
+            yield f"{attr_prefix}.{walk.dotted_name}", walk.item
 
     @property
     def connected(self):
         signals_connected = all(
-            walk.item.connected for walk in self.walk_signals(include_lazy=False)
+            walk.item.connected for walk in self._get_index("signals")
         )
         pending_funcs = any(
-            getattr(item, "_required_for_connection", None)
-            for name, item in self.walk_subdevices()
+            item._required_for_connection
+            for name, item in self._get_index("subdevices")
         )
 
         pending_funcs = pending_funcs or self._required_for_connection
@@ -1409,7 +2175,10 @@ class Device(BlueskyInterface, OphydObject):
     def __getattr__(self, name):
         """Get a component from a fully-qualified name"""
         if "." in name:
-            return operator.attrgetter(name)(self)
+            try:
+                return self._get_index("names")[name]
+            except KeyError:
+                return operator.attrgetter(name)(self)
 
         # Components will be instantiated through the descriptor mechanism in
         # the Component class, so anything reaching this point is an error.
@@ -1433,47 +2202,256 @@ class Device(BlueskyInterface, OphydObject):
                 "a Component but does not inherent from Device."
             ) from None
 
+        if attr in self._signals:
+            # Instantiated by another thread (e.g., prefetching) meanwhile
+            return self._signals[attr]
+
+        try:
+            # Created outside of the lock, as this may wait for connection
+            sig = cpt.create_component(self)
+        except AttributeError as ex:
+            # Raise a different Exception, as AttributeError will be shadowed
+            # during initial access
+            raise RuntimeError(
+                f"AttributeError while instantiating " f"component: {attr}"
+            ) from ex
+
+        with self._instantiate_lock:
+            existing = self._signals.get(attr)
+            if existing is None:
+                self._signals[attr] = sig
+                self._invalidate_index()
+
+        if existing is not None:
+            # Another thread won the race; keep its instance
+            sig.destroy()
+            return existing
+
         try:
-            self._signals[attr] = cpt.create_component(self)
-            sig = self._signals[attr]
             for event_type, functions in cpt._subscriptions.items():
                 for func in functions:
                     method = getattr(self, func.__name__)
                     sig.subscribe(method, event_type=event_type, run=sig.connected)
         except AttributeError as ex:
-            # Raise a different Exception, as AttributeError will be shadowed
-            # during initial access
             raise RuntimeError(
                 f"AttributeError while instantiating " f"component: {attr}"
             ) from ex
 
+        if cpt.lazy:
+            _record_instantiation(sig)
         return sig
 
     @doc_annotation_forwarder(BlueskyInterface)
     def read(self):
         res = super().read()
 
-        for _, component in self._get_components_of_kind(Kind.normal):
-            res.update(component.read())
+        plan = self._get_read_plan("read")
+        for reading in _call_all(plan, "read", self.parallel_reads):
+            res.update(reading)
         return res
 
+    def structured_dtype(self):
+        """The numpy dtypes of the arrays returned by :meth:`read_structured`
+
+        Each has one field per key of ``read()``.  The value dtype is derived
+        from ``describe()``: its ``dtype_numpy`` and ``shape`` where given,
+        and otherwise float64 for numbers, int64 for integers, bool for
+        booleans and object for strings and arrays of unknown type.  All
+        timestamps are float64.
+
+        The dtypes are cached for as long as the components read and the
+        ``_describe_key()`` of each signal read are unchanged, so a change of
+        kind or of the shape of an array gives new dtypes.  Components with
+        their own ``read()`` are only described again on a change of kind.
+
+        Returns
+        -------
+        value_dtype, timestamp_dtype : numpy.dtype
+        """
+        return self._get_structured(self._get_read_plan("read"))
+
+    def _structured_layout(self, plan):
+        """The signals read with get(), and the other components read with
+        read(), for read_structured of ``plan``"""
+        cached = self._structured_layout_cache
+        if cached is not None and cached[0] is plan:
+            return cached[1]
+
+        if type(self).read is Device.read:
+            # Signals using the default read() are read with get() and
+            # timestamp, avoiding their reading dicts
+            signals = tuple(
+                cpt
+                for cpt in plan
+                if type(cpt).read is Signal.read
+                and getattr(cpt, "_describe_cacheable", False)
+            )
+            direct = set(signals)
+            others = tuple(cpt for cpt in plan if cpt not in direct)
+        else:
+            signals, others = (), (self,)
+        layout = (signals, others)
+        self._structured_layout_cache = (plan, layout)
+        return layout
+
+    def _get_structured(self, plan, keys=None):
+        """The cached dtypes of read_structured for ``plan``
+
+        ``keys`` are the ``_describe_key()`` of the signals read with get(),
+        if already known.
+        """
+        signals, _ = self._structured_layout(plan)
+        if keys is None:
+            keys = [sig._describe_key() for sig in signals]
+        cached = self._structured
+        if cached is not None and cached[0] is plan and cached[1] == keys:
+            return cached[2:]
+
+        desc = self.describe()
+        value_dtype = np.dtype(
+            [(key, _structured_field_dtype(data_key)) for key, data_key in desc.items()]
+        )
+        timestamp_dtype = np.dtype([(key, "f8") for key in desc])
+        # Describing may have read values for the first time
+        keys = [sig._describe_key() for sig in signals]
+        if None not in keys:
+            self._structured = (plan, keys, value_dtype, timestamp_dtype)
+        return value_dtype, timestamp_dtype
+
+    def read_structured(self, out=None, index=()):
+        """Read the Device into numpy structured arrays
+
+        An alternative to :meth:`read`, returning the values and timestamps as
+        two records, with one field per key of ``read()``, rather than as a
+        dictionary per key.  With ``out``, a reading can be written straight
+        into a row of preallocated storage::
+
+            value_dtype, timestamp_dtype = dev.structured_dtype()
+            values = np.empty(num_points, dtype=value_dtype)
+            timestamps = np.empty(num_points, dtype=timestamp_dtype)
+            for i in range(num_points):
+                dev.read_structured(out=(values, timestamps), index=i)
+
+        Parameters
+        ----------
+        out : (values, timestamps), optional
+            Arrays of the dtypes from :meth:`structured_dtype` to write to,
+            instead of new 0-d arrays
+        index : int or tuple, optional
+            Where in ``out`` to write the reading.  Defaults to ``()``, for
+            0-d arrays.
+
+        Returns
+        -------
+        values, timestamps : numpy.ndarray
+            ``out``, if given, or new 0-d arrays
+        """
+        plan = self._get_read_plan("read")
+        signals, others = self._structured_layout(plan)
+        for sig in signals:
+            if not sig.connected:
+                raise DisconnectedError(f"{sig.name} is not connected")
+
+        row = {}
+        keys = []
+        results = _call_all(signals, "get", self.parallel_reads)
+        for sig, value in zip(signals, results):
+            row[sig.name] = (value, sig.timestamp)
+            keys.append(sig._describe_key())
+        for reading in _call_all(others, "read", self.parallel_reads):
+            for key, item in reading.items():
+                row[key] = (item["value"], item["timestamp"])
+
+        # Checked once the values are read, in case one changed shape
+        value_dtype, timestamp_dtype = self._get_structured(plan, keys)
+        if out is None:
+            out = np.zeros((), dtype=value_dtype), np.zeros((), dtype=timestamp_dtype)
+
+        # Assigning whole records is far faster than assigning field by field
+        items = [row.get(key, (None, 0.0)) for key in value_dtype.names]
+        values, timestamps = out
+        values[index] = tuple(value for value, _ in items)
+        timestamps[index] = tuple(timestamp for _, timestamp in items)
+        return values, timestamps
+
     def read_configuration(self) -> OrderedDictType[str, Dict[str, Any]]:
         """Dictionary mapping names to value dicts with keys: value, timestamp
 
         To control which fields are included, change the Component kinds on the
         device, or modify the ``configuration_attrs`` list.
         """
+        if self.cache_configuration:
+            return self._read_configuration_cached()
+
         res = OrderedDict()
 
-        for _, component in self._get_components_of_kind(Kind.config):
-            res.update(component.read_configuration())
+        plan = self._get_read_plan("read_configuration")
+        for reading in _call_all(plan, "read_configuration", self.parallel_reads):
+            res.update(reading)
+        return res
+
+    def _config_value_changed(self, *, obj, **kwargs):
+        "Value subscription of a configuration signal"
+        with self._config_lock:
+            self._config_dirty.add(obj)
+
+    def _track_configuration(self, plan):
+        "Subscribe to the configuration signals in ``plan``, and only those"
+        for sig, cid in self._config_subscriptions:
+            sig.unsubscribe(cid)
+        self._config_subscriptions = [
+            (cpt, cpt.subscribe(self._config_value_changed, cpt.SUB_VALUE, run=False))
+            for cpt in plan
+            if isinstance(cpt, Signal)
+        ]
+        self._config_plan = plan
+
+    def _read_configuration_cached(self):
+        """read_configuration(), re-reading only signals which have changed
+
+        Signals whose value subscription has run since they were last read
+        are read again, as are components which are not signals (and so are
+        not tracked).  The readings of all others are reused.
+        """
+        plan = self._get_read_plan("read_configuration")
+        if plan is not self._config_plan:
+            self._track_configuration(plan)
+            stale = set(plan)
+            with self._config_lock:
+                self._config_dirty.clear()
+        else:
+            with self._config_lock:
+                stale, self._config_dirty = self._config_dirty, set()
+            stale.update(cpt for cpt in plan if not isinstance(cpt, Signal))
+
+        to_read = [cpt for cpt in plan if cpt in stale]
+        new = _call_all(to_read, "read_configuration", self.parallel_reads)
+
+        previous = {}
+        for reading in self._config_readings.values():
+            previous.update(reading)
+        readings = {cpt: self._config_readings.get(cpt) for cpt in plan}
+        readings.update(zip(to_read, new))
+
+        changed = set()
+        for reading in new:
+            for key, value in reading.items():
+                old = previous.get(key)
+                if old is None or not _values_equal(value["value"], old["value"]):
+                    changed.add(key)
+
+        self._config_readings = readings
+        self.configuration_changed_keys = frozenset(changed)
+
+        res = OrderedDict()
+        for reading in readings.values():
+            res.update((key, dict(val)) for key, val in reading.items())
         return res
 
     @doc_annotation_forwarder(BlueskyInterface)
     def describe(self):
         res = super().describe()
-        for _, component in self._get_components_of_kind(Kind.normal):
-            res.update(component.describe())
+        res.update(self._describe_plan("describe"))
         return res
 
     def describe_configuration(self) -> OrderedDictType[str, Dict[str, Any]]:
@@ -1491,15 +2469,12 @@ class Device(BlueskyInterface, OphydObject):
             The keys must be strings and the values must be dict-like
             with the ``event_model.event_descriptor.data_key`` schema.
         """
-        res = OrderedDict()
-        for _, component in self._get_components_of_kind(Kind.config):
-            res.update(component.describe_configuration())
-        return res
+        return self._describe_plan("describe_configuration")
 
     @property
     def hints(self):
         fields = []
-        for _, component in self._get_components_of_kind(Kind.normal):
+        for component in self._get_read_plan("hints"):
             c_hints = component.hints
             fields.extend(c_hints.get("fields", []))
         return {"fields": fields}
@@ -1618,6 +2593,39 @@ class Device(BlueskyInterface, OphydObject):
             signal = getattr(self, attr)
             signal.put(value, **kwargs)
 
+    def put_many(self, values, *, wait=False, timeout=None):
+        """Put values to several signals at once
+
+        The EpicsSignal puts are made together, as in :func:`~ophyd.signal.put_group`.
+
+        Parameters
+        ----------
+        values : dict
+            Signal (or dotted component name) to value, in the order to put
+        wait : bool, optional
+            Use put completion for all puts, and wait until all have
+            completed
+        timeout : float, optional
+            Timeout of the status
+
+        Returns
+        -------
+        status : StatusBase or None
+            Finished when all puts have completed.  None within an enclosing
+            put_group, which then makes the puts.
+
+        Raises
+        ------
+        ValueError
+            If ``wait`` or ``timeout`` is given within an enclosing put_group
+        """
+        with put_group(wait=wait, timeout=timeout) as group:
+            for sig, value in values.items():
+                if isinstance(sig, str):
+                    sig = getattr(self, sig)
+                sig.put(value)
+        return group.status
+
     @classmethod
     def get_device_tuple(cls):
         """The device tuple type associated with an Device class
@@ -1657,10 +2665,115 @@ class Device(BlueskyInterface, OphydObject):
                         "configuration_fields, so it cannot be "
                         "changed using configure" % key
                     )
-            getattr(self, key).set(val).wait()
+            sig = getattr(self, key)
+            if self.skip_redundant_sets and isinstance(sig, Signal):
+                current = old.get(sig.name, {}).get("value", UNSET_VALUE)
+                status = self._set_if_needed(sig, val, current)
+            else:
+                status = sig.set(val)
+            if status is not None:
+                status.wait()
         new = self.read_configuration()
         return old, new
 
+    def _walk_config_signals(self, prefix=""):
+        "Yield (dotted name, signal) for the configuration signals of the tree"
+        for attr, cpt in self._get_components_of_kind(Kind.config):
+            dotted_name = prefix + attr
+            if isinstance(cpt, Device):
+                yield from cpt._walk_config_signals(dotted_name + ".")
+            else:
+                yield dotted_name, cpt
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture the values of all writable configuration signals
+
+        The signals which ``read_configuration()`` would include, throughout
+        the device tree, are read at once (concurrently, where they wait on
+        the control system).
+
+        Returns
+        -------
+        snapshot : dict
+            Maps the dotted name of each signal, relative to this device, to
+            its value.  Arrays are stored as lists, so the result can be
+            saved as JSON or YAML as it is.  Pass it to :meth:`restore`.
+        """
+        signals = [
+            (dotted_name, sig)
+            for dotted_name, sig in self._walk_config_signals()
+            if getattr(sig, "write_access", False)
+        ]
+        values = _call_all([sig for _, sig in signals], "get", self.parallel_reads)
+        return {
+            dotted_name: value.tolist() if isinstance(value, np.ndarray) else value
+            for (dotted_name, _), value in zip(signals, values)
+        }
+
+    def restore(self, snapshot, *, order=None) -> StatusBase:
+        """Set the signals in a snapshot back to their recorded values
+
+        Only signals whose current value differs (within their tolerances)
+        are set.  These sets are made concurrently, in groups as given by
+        ``order``.
+
+        Parameters
+        ----------
+        snapshot : dict
+            As returned by :meth:`snapshot`
+        order : sequence, optional
+            Groups of dotted signal names (or signals) to restore, all at
+            once, before anything later; see ``stage_order``, which is used
+            by default.  Signals not listed are restored last.
+
+        Returns
+        -------
+        status : DeviceStatus
+            Finished once all values are restored
+        """
+        values = {}
+        for dotted_name, value in snapshot.items():
+            try:
+                sig = getattr(self, dotted_name)
+            except AttributeError:
+                raise KeyError(
+                    f"{dotted_name!r} in the snapshot is not part of {self.name!r}"
+                ) from None
+            values[sig] = value
+
+        status = DeviceStatus(self)
+
+        def restore_values():
+            sigs = list(values)
+            current = _call_all(sigs, "get", self.parallel_reads)
+            changed = {
+                sig
+                for sig, cur in zip(sigs, current)
+                if not _value_matches(sig, cur, values[sig])
+            }
+            self.log.debug(
+                "Restoring %d of %d signals of %s", len(changed), len(sigs), self.name
+            )
+            for group in self._stage_groups(sigs, order):
+                statuses = []
+                for sig in group:
+                    if sig in changed:
+                        statuses.append(sig.set(values[sig]))
+                        status.add_child(statuses[-1])
+                for st in statuses:
+                    st.wait()
+
+        def run():
+            try:
+                restore_values()
+            except Exception as ex:
+                status.set_exception(ex)
+            else:
+                status.set_finished()
+
+        _start_thread(run, name=f"{self.name}_restore")
+        return status
+
     def _repr_info(self):
         yield ("prefix", self.prefix)
         yield from super()._repr_info()
@@ -1738,6 +2851,7 @@ class Device(BlueskyInterface, OphydObject):
 # out-of-the-box for this scenario.
 if not hasattr(Device, "_sig_attrs"):
     Device._initialize_device()
+trace_class_methods(Device, "devices", ("stage", "unstage", "trigger"))
 
 
 @contextlib.contextmanager
@@ -1807,6 +2921,105 @@ def create_device_from_components(
     return type(name, base_class, clsdict, **class_kwargs)
 
 
+def create_devices(
+    specs, *, max_workers=_MAX_WORKERS, wait=True, timeout=DEFAULT_CONNECTION_TIMEOUT
+):
+    """Instantiate many independent Devices concurrently
+
+    Creating a Device creates all of its non-lazy signals, and with them their
+    PVs and connection searches.  For a large profile, doing this in several
+    control layer threads overlaps that work, after which a single wait covers
+    the connection of all devices.
+
+    Parameters
+    ----------
+    specs : dict
+        Device name to ``(cls, prefix)`` or ``(cls, prefix, kwargs)``, where
+        ``kwargs`` are additional keyword arguments for ``cls``
+    max_workers : int, optional
+        Number of devices to create at once
+    wait : bool, optional
+        Wait for all devices to connect before returning.  Defaults to True.
+    timeout : float, optional
+        Overall connection timeout, measured from the start of the wait.
+        Defaults to the longest ``connection_timeout`` of the devices.
+
+    Returns
+    -------
+    devices : dict
+        Device name to instance, in the order of ``specs``
+
+    Raises
+    ------
+    DeviceCreationError
+        If any device could not be created; the exception of each and the
+        devices that were created are attached to it
+    TimeoutError
+        If any device failed to connect in time
+    """
+
+    def create(name, spec):
+        cls, prefix, *kwargs = spec
+        kwargs = kwargs[0] if kwargs else {}
+        return cls(prefix, name=name, **kwargs)
+
+    created = {}
+    exceptions = {}
+    pool = _WorkerPool(max_workers, "ophyd_create_devices")
+    try:
+        futures = {
+            name: pool.submit(functools.partial(create, name, spec))
+            for name, spec in specs.items()
+        }
+        for name, future in futures.items():
+            try:
+                created[name] = future.result()
+            except Exception as ex:
+                exceptions[name] = ex
+    finally:
+        pool.shutdown()
+
+    devices = {name: created[name] for name in specs if name in created}
+    if exceptions:
+        msg = ", ".join(
+            f"{name} ({ex.__class__.__name__}: {ex})" for name, ex in exceptions.items()
+        )
+        raise DeviceCreationError(
+            f"Failed to create devices: {msg}",
+            exceptions={name: exceptions[name] for name in specs if name in exceptions},
+            devices=devices,
+        )
+
+    if wait:
+        _wait_for_devices(devices.values(), timeout)
+    return devices
+
+
+def _wait_for_devices(devices, timeout=DEFAULT_CONNECTION_TIMEOUT):
+    "Wait for a group of devices to connect, with one deadline for all of them"
+    devices = list(devices)
+    if timeout is DEFAULT_CONNECTION_TIMEOUT:
+        timeout = max((dev.connection_timeout for dev in devices), default=0.0)
+
+    poll_period = 0.05 if timeout is None else min(0.05, timeout / 10.0)
+    deadline = None if timeout is None else ttime.monotonic() + timeout
+    pending = [dev for dev in devices if not dev.connected]
+    while pending and (deadline is None or ttime.monotonic() < deadline):
+        ttime.sleep(poll_period)
+        pending = [dev for dev in pending if not dev.connected]
+
+    reasons = []
+    for dev in pending:
+        try:
+            # Only to have the reason why it is not connected
+            dev.wait_for_connection(timeout=0)
+        except TimeoutError as ex:
+            reasons.append(f"{dev.name}: {ex}")
+
+    if reasons:
+        raise TimeoutError("; ".join(reasons))
+
+
 def required_for_connection(func=None, *, description=None, device=None):
     """Require that a method be called prior to marking a Device as connected
 
@@ -333,6 +333,15 @@ class MonitorFlyerMixin(BlueskyInterface):
         collected["values"].append(value)
         collected["timestamps"].append(timestamp)
 
+    def _memory_buffers(self):
+        buffers = dict(super()._memory_buffers())
+        for attr, data in list((self._collected_data or {}).items()):
+            values, timestamps = data["values"], data["timestamps"]
+            buffers.setdefault(attr, []).extend(
+                [values, timestamps, *list(values), *list(timestamps)]
+            )
+        return buffers
+
     def _get_stream_name(self, attr):
         obj = getattr(self, attr)
         return self.stream_names.get(attr, obj.name)
@@ -0,0 +1,196 @@
+"""In-memory history of the values of a signal
+
+A :class:`SignalHistory` keeps the last values of a signal, and their
+timestamps, in a numpy ring buffer.  It is enabled per signal, and filled in
+as the signal updates, before its subscriptions run::
+
+    history = beam_current.enable_history(3600)
+    ...
+    if history.std(window=60) > threshold:
+        ...
+"""
+import threading
+import time
+
+import numpy as np
+
+__all__ = ("SignalHistory",)
+
+
+class SignalHistory:
+    """A ring buffer of (timestamp, value) pairs
+
+    Timestamps are expected to increase; the queries by time rely on it.
+
+    Parameters
+    ----------
+    size : int
+        Number of values to keep
+    dtype : numpy dtype, optional
+        Data type of the values.  Defaults to float.
+    shape : tuple, optional
+        Shape of each value.  Defaults to ``()``, for scalars.
+    """
+
+    def __init__(self, size, *, dtype=float, shape=()):
+        if size < 1:
+            raise ValueError(f"History size must be positive, not {size}")
+        self.size = size
+        self._timestamps = np.zeros(size)
+        self._values = np.zeros((size,) + tuple(shape), dtype=dtype)
+        # Total number of values appended; the next goes at _count % size
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} {len(self)}/{self.size} "
+            f"dtype={self._values.dtype}>"
+        )
+
+    def __len__(self):
+        return min(self._count, self.size)
+
+    @property
+    def dtype(self):
+        "Data type of the values"
+        return self._values.dtype
+
+    @property
+    def total_count(self):
+        "Number of values appended, including those no longer kept"
+        return self._count
+
+    def append(self, timestamp, value):
+        """Add a value
+
+        Raises
+        ------
+        ValueError, TypeError
+            If the value cannot be stored with the dtype and shape of the
+            history
+        """
+        with self._lock:
+            index = self._count % self.size
+            self._values[index] = value
+            self._timestamps[index] = timestamp
+            self._count += 1
+
+    def clear(self):
+        "Remove all values"
+        with self._lock:
+            self._count = 0
+
+    def get(self):
+        """All the values kept, oldest first
+
+        Returns
+        -------
+        timestamps, values : numpy.ndarray
+            Copies, which are not changed by later updates
+        """
+        with self._lock:
+            count = self._count
+            if count <= self.size:
+                return self._timestamps[:count].copy(), self._values[:count].copy()
+            # The oldest value is the next to be overwritten
+            start = count % self.size
+            order = np.r_[start : self.size, 0:start]
+            return self._timestamps[order], self._values[order]
+
+    def time_range(self, start=None, stop=None):
+        """The values with timestamps in ``[start, stop]``, oldest first
+
+        Parameters
+        ----------
+        start, stop : float, optional
+            Unix timestamps.  By default, the range is open-ended.
+
+        Returns
+        -------
+        timestamps, values : numpy.ndarray
+        """
+        timestamps, values = self.get()
+        low = 0 if start is None else np.searchsorted(timestamps, start, "left")
+        high = (
+            len(timestamps)
+            if stop is None
+            else np.searchsorted(timestamps, stop, "right")
+        )
+        return timestamps[low:high], values[low:high]
+
+    def last(self, window=None):
+        """The values of the last ``window`` seconds, oldest first
+
+        Parameters
+        ----------
+        window : float, optional
+            Seconds before now.  By default, all values kept.
+
+        Returns
+        -------
+        timestamps, values : numpy.ndarray
+        """
+        if window is None:
+            return self.get()
+        return self.time_range(start=time.time() - window)
+
+    def mean(self, window=None):
+        "Mean of the values of the last ``window`` seconds (NaN if none)"
+        return self.stats(window)["mean"]
+
+    def std(self, window=None):
+        "Standard deviation of the values of the last ``window`` seconds"
+        return self.stats(window)["std"]
+
+    def min(self, window=None):
+        "Minimum of the values of the last ``window`` seconds"
+        return self.stats(window)["min"]
+
+    def max(self, window=None):
+        "Maximum of the values of the last ``window`` seconds"
+        return self.stats(window)["max"]
+
+    def rate(self, window=None):
+        """Rate of change per second of the values of the last ``window``
+        seconds, from a least-squares linear fit"""
+        return self.stats(window)["rate"]
+
+    def stats(self, window=None):
+        """Statistics of the values of the last ``window`` seconds
+
+        Statistics of array values are computed element-wise.
+
+        Parameters
+        ----------
+        window : float, optional
+            Seconds before now.  By default, all values kept.
+
+        Returns
+        -------
+        stats : dict
+            With keys 'count', 'mean', 'std', 'min', 'max' and 'rate' (the
+            change per second, from a least-squares linear fit).  The
+            statistics are NaN when there are too few values.
+        """
+        timestamps, values = self.last(window)
+        count = len(timestamps)
+        if count == 0:
+            nan = np.full(values.shape[1:], np.nan)[()]
+            return dict(count=0, mean=nan, std=nan, min=nan, max=nan, rate=nan)
+
+        mean = values.mean(axis=0)
+        rate = np.full(values.shape[1:], np.nan)[()]
+        dt = timestamps - timestamps.mean()
+        denominator = np.dot(dt, dt)
+        if denominator > 0:
+            rate = np.tensordot(dt, values - mean, axes=1) / denominator
+
+        return dict(
+            count=count,
+            mean=mean,
+            std=values.std(axis=0),
+            min=values.min(axis=0),
+            max=values.max(axis=0),
+            rate=rate,
+        )
@@ -0,0 +1,204 @@
+"""Recording and prefetching of the lazy components used in a session
+
+Lazy components, such as every ``ADComponent``, are created and connected on
+first access, which may be in the middle of a scan.  A
+:class:`LazyComponentRecorder` notes which lazy components are accessed in a
+session, and :func:`prefetch_lazy_components` creates those same components in
+the background at the start of the next one::
+
+    # Record, saving the profile when Python exits
+    record_lazy_components("~/.ophyd/lazy_profile.json")
+
+    # After creating the devices at the next startup
+    prefetch_lazy_components([det, scaler], "~/.ophyd/lazy_profile.json")
+"""
+import atexit
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+
+from ._workers import _start_thread, _WorkerPool
+from .status import StatusBase
+
+__all__ = (
+    "LazyComponentRecorder",
+    "load_lazy_profile",
+    "prefetch_lazy_components",
+    "record_lazy_components",
+)
+
+logger = logging.getLogger(__name__)
+
+# The active recorder, see record_lazy_components
+_recorder = None
+
+# Set while prefetching, so that prefetched components are not recorded as used
+_prefetching = contextvars.ContextVar("ophyd_lazy_prefetching", default=False)
+
+
+class LazyComponentRecorder:
+    """Records the lazy components accessed, keyed on root device name
+
+    Parameters
+    ----------
+    path : str, optional
+        Default file for :meth:`save`
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._lock = threading.Lock()
+        # root device name -> {dotted name: None}, an insertion-ordered set
+        self._used = {}
+        self._save_at_exit = False
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def record(self, obj):
+        "Record the instantiation of the lazy component ``obj``"
+        root_name = obj.root.name
+        with self._lock:
+            self._used.setdefault(root_name, {})[obj.dotted_name] = None
+
+    @property
+    def profile(self):
+        "Root device name to the dotted names of the lazy components used"
+        with self._lock:
+            return {name: list(used) for name, used in self._used.items()}
+
+    def save(self, path=None):
+        """Write the profile as JSON
+
+        Parameters
+        ----------
+        path : str, optional
+            Defaults to the path given on creation
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path specified to save the profile to")
+
+        path = os.path.expanduser(path)
+        with open(path, "w") as f:
+            json.dump(self.profile, f, indent=2)
+
+    def save_at_exit(self):
+        "Save the profile to :attr:`path` when Python exits, until stopped"
+        if not self._save_at_exit:
+            atexit.register(self.save)
+            self._save_at_exit = True
+
+    def stop(self):
+        "Stop recording, if this is the active recorder, and saving at exit"
+        global _recorder
+        if _recorder is self:
+            _recorder = None
+        if self._save_at_exit:
+            atexit.unregister(self.save)
+            self._save_at_exit = False
+
+
+def record_lazy_components(path=None, *, save_at_exit=True):
+    """Record which lazy components are used, from now on
+
+    This stops and replaces any recorder already active.
+
+    Parameters
+    ----------
+    path : str, optional
+        File to save the profile to
+    save_at_exit : bool, optional
+        Save the profile to ``path`` when Python exits.  Defaults to True.
+
+    Returns
+    -------
+    recorder : LazyComponentRecorder
+    """
+    global _recorder
+    if _recorder is not None:
+        _recorder.stop()
+    recorder = LazyComponentRecorder(path)
+    if path is not None and save_at_exit:
+        recorder.save_at_exit()
+    _recorder = recorder
+    return recorder
+
+
+def _record_instantiation(obj):
+    "Hook called by Device on the instantiation of a lazy component"
+    recorder = _recorder
+    if recorder is not None and not _prefetching.get():
+        recorder.record(obj)
+
+
+def load_lazy_profile(path):
+    """Load a profile saved by :meth:`LazyComponentRecorder.save`
+
+    Returns
+    -------
+    profile : dict
+        Root device name to a list of dotted component names
+    """
+    with open(os.path.expanduser(path)) as f:
+        return json.load(f)
+
+
+def _prefetch(devices, profile, max_workers, status):
+    def instantiate(dev, dotted_name):
+        _prefetching.set(True)
+        try:
+            getattr(dev, dotted_name)
+        except Exception:
+            logger.warning(
+                "Failed to prefetch %s.%s", dev.name, dotted_name, exc_info=True
+            )
+
+    pool = _WorkerPool(max_workers, "ophyd_prefetch")
+    try:
+        futures = [
+            pool.submit(functools.partial(instantiate, dev, dotted_name))
+            for dev in devices
+            for dotted_name in profile.get(dev.name, ())
+        ]
+        for future in futures:
+            future.result()
+    except Exception as ex:
+        status.set_exception(ex)
+    else:
+        status.set_finished()
+    finally:
+        pool.shutdown()
+
+
+def prefetch_lazy_components(devices, profile, *, max_workers=16):
+    """Instantiate and connect the lazy components in a profile, in the background
+
+    Failures are logged and otherwise ignored; the components concerned are
+    instantiated again on first use, as usual.
+
+    Parameters
+    ----------
+    devices : iterable of Device
+        Devices to prefetch components of, matched to the profile by name
+    profile : dict or str
+        Profile, or path to one, from :meth:`LazyComponentRecorder.save`
+    max_workers : int, optional
+        Number of components to instantiate (and wait for) at once
+
+    Returns
+    -------
+    status : StatusBase
+        Finished when prefetching is complete
+    """
+    if not isinstance(profile, dict):
+        profile = load_lazy_profile(profile)
+
+    status = StatusBase()
+    _start_thread(
+        _prefetch, list(devices), profile, max_workers, status, name="ophyd_prefetch"
+    )
+    return status
@@ -1,12 +1,18 @@
 import functools
+import threading
 import time
 import weakref
+from collections import namedtuple
 from enum import IntFlag
 from itertools import count
 from logging import LoggerAdapter, getLogger
 from typing import ClassVar, FrozenSet
 
+import numpy as np
+
+from ._dispatch import _CallbackThread
 from .log import control_layer_logger
+from .utils import approx_nbytes
 
 
 def select_version(cls, version):
@@ -60,6 +66,159 @@ class UnknownSubscription(KeyError):
     ...
 
 
+class _SubscriptionFilter:
+    """Rate limit and deadband filter in front of a subscription callback
+
+    Events are dropped before the callback is called. When an event is held
+    back only by ``max_rate``, the latest such event is delivered once the
+    rate allows it, so the subscriber always receives the final value. It is
+    delivered by a timed callback of the dispatcher thread the event arrived
+    on (or of the 'monitor' thread, for events from other threads), so it
+    stays ordered with the other callbacks of that thread.
+
+    A ``value`` is within the deadband (and dropped) if::
+
+        |value - last_delivered| <= deadband + rel_deadband * |last_delivered|
+
+    Events without a ``value`` keyword argument are only rate limited.
+    """
+
+    _no_value = object()
+    _clock = staticmethod(time.monotonic)
+
+    def __init__(self, callback, *, max_rate=None, deadband=None, rel_deadband=None):
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+        if (deadband is not None and deadband < 0) or (
+            rel_deadband is not None and rel_deadband < 0
+        ):
+            raise ValueError("deadband and rel_deadband must not be negative")
+
+        self.callback = callback
+        self.min_period = None if max_rate is None else 1.0 / max_rate
+        self.deadband = deadband
+        self.rel_deadband = rel_deadband
+        self._lock = threading.Lock()
+        self._last_value = self._no_value
+        self._last_time = None
+        self._pending = None
+        # Identifies the scheduled flush; None when no flush is scheduled
+        self._flush_token = None
+        functools.update_wrapper(self, callback)
+
+    def _within_deadband(self, value):
+        last = self._last_value
+        if last is self._no_value or value is self._no_value:
+            return False
+        if self.deadband is None and self.rel_deadband is None:
+            return False
+        try:
+            last = np.asarray(last)
+            diff = np.abs(np.asarray(value) - last)
+            if diff.shape != last.shape:
+                return False
+            threshold = (self.deadband or 0) + (self.rel_deadband or 0) * np.abs(last)
+            return bool(np.all(diff <= threshold))
+        except (TypeError, ValueError):
+            # Not numeric: only identical values are within the deadband
+            try:
+                return bool(value == self._last_value)
+            except Exception:
+                return False
+
+    def __call__(self, *args, **kwargs):
+        value = kwargs.get("value", self._no_value)
+        with self._lock:
+            if self._within_deadband(value):
+                # The subscriber already has (close to) the latest value
+                self._pending = None
+                return
+
+            if self.min_period is not None:
+                now = self._clock()
+                if self._last_time is not None:
+                    wait = self._last_time + self.min_period - now
+                    if wait > 0:
+                        self._pending = (args, kwargs)
+                        if self._flush_token is None:
+                            self._flush_token = token = object()
+                            self._call_later(wait, token)
+                        return
+                self._last_time = now
+
+            self._last_value = value
+            self._pending = None
+
+        self.callback(*args, **kwargs)
+
+    def _call_later(self, delay, token):
+        "Schedule the delivery of the held-back event on the dispatcher"
+        thread = threading.current_thread()
+        if isinstance(thread, _CallbackThread):
+            thread.call_later(delay, self._flush, token)
+        else:
+            from . import get_cl
+
+            get_cl().get_dispatcher().call_later("monitor", delay, self._flush, token)
+
+    def _flush(self, token):
+        "Deliver the latest event held back by the rate limit"
+        with self._lock:
+            if token is not self._flush_token:
+                # Cancelled
+                return
+            self._flush_token = None
+            if self._pending is None:
+                return
+            args, kwargs = self._pending
+            self._pending = None
+            self._last_time = self._clock()
+            self._last_value = kwargs.get("value", self._no_value)
+
+        self.callback(*args, **kwargs)
+
+    def cancel(self):
+        "Drop any held-back event"
+        with self._lock:
+            self._pending = None
+            self._flush_token = None
+
+
+# Incremented whenever the kind of any OphydObject (or of a not yet
+# instantiated lazy component) changes; cached read plans are rebuilt when it
+# differs from the value they were built with
+_kind_generation = 0
+_kind_generation_lock = threading.Lock()
+
+
+def _kind_changed():
+    global _kind_generation
+    with _kind_generation_lock:
+        _kind_generation += 1
+
+
+def _get_kind_generation():
+    return _kind_generation
+
+
+_REPLAY_CACHE_MODES = ("full", "readback", "metadata", "off")
+# Stands in for the value of a cached event in 'readback' replay mode
+_REPLAY_READBACK = object()
+
+
+_Subscription = namedtuple("_Subscription", "cid callback wrapped")
+_Subscription.__doc__ = "A subscription id, the user callback and its wrapper"
+
+# Guards changes to the subscription tables; _run_subs does not need it
+_subscription_lock = threading.Lock()
+
+
+def _cancel_pending(wrapped):
+    "Drop events held back by a subscription filter, if any"
+    if isinstance(wrapped, _SubscriptionFilter):
+        wrapped.cancel()
+
+
 def register_instances_keyed_on_name(fail_if_late=False):
     """Register OphydObj instances in a WeakValueDictionary keyed on name.
 
@@ -137,6 +296,25 @@ class OphydObject:
     name
     """
 
+    # Attributes common to all instances are stored in slots, keeping the
+    # instance __dict__ small for large numbers of signals; subclasses are free
+    # to add any other attributes as usual.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_ophyd_labels_",
+        "_kind",
+        "_attr_name",
+        "_name",
+        "_parent",
+        "_callbacks",
+        "_cid_to_event_mapping",
+        "_args_cache",
+        "_cb_count",
+        "_log",
+        "_control_layer_log",
+    )
+
     # Any callables appended to this mutable class variable will be notified
     # one time when a new instance of OphydObj is instantiated. See
     # OphydObject.add_instantiation_callback().
@@ -147,6 +325,10 @@ class OphydObject:
     # may want to know whether it has already "missed" any instances.
     __any_instantiated = False
     subscriptions: ClassVar[FrozenSet[str]] = frozenset()
+    # How the last event of each type is kept for replay to new subscribers;
+    # see set_replay_cache.  Subclasses may override these class-wide.
+    replay_cache = "full"
+    replay_cache_max_bytes = None
 
     def __init__(self, *, name=None, attr_name="", parent=None, labels=None, kind=None):
         if labels is None:
@@ -167,23 +349,19 @@ class OphydObject:
         self._name = name
         self._parent = parent
 
-        # dictionary of wrapped callbacks
-        self._callbacks = {k: {} for k in self.subscriptions}
-        # this is to maintain api on clear_sub
-        self._unwrapped_callbacks = {k: {} for k in self.subscriptions}
+        # event type -> tuple of _Subscription, replaced (never mutated) on
+        # subscribe/unsubscribe; event types without subscribers are absent
+        self._callbacks = {}
         # map cid -> back to which event it is in
         self._cid_to_event_mapping = dict()
         # cache of last inputs to _run_subs, the semi-private way
         # to trigger the callbacks for a given subscription to be run
-        self._args_cache = {k: None for k in self.subscriptions}
+        self._args_cache = {}
         # count of subscriptions we have handed out, used to give unique ids
         self._cb_count = count()
-        self.log = LoggerAdapter(
-            getLogger("ophyd.objects"), {"ophyd_object_name": name}
-        )
-        self.control_layer_log = LoggerAdapter(
-            control_layer_logger, {"ophyd_object_name": name}
-        )
+        # Loggers are created on first use, see the log properties
+        self._log = None
+        self._control_layer_log = None
 
         if not self.__any_instantiated:
             self.log.debug("first instance of OphydObject: id=%s", id(self))
@@ -299,6 +477,32 @@ class OphydObject:
             version_of=version_of,
         )
 
+    @property
+    def log(self):
+        "Logger adapter which includes the name of this object"
+        if self._log is None:
+            self._log = LoggerAdapter(
+                getLogger("ophyd.objects"), {"ophyd_object_name": self._name}
+            )
+        return self._log
+
+    @log.setter
+    def log(self, log):
+        self._log = log
+
+    @property
+    def control_layer_log(self):
+        "Control layer logger adapter which includes the name of this object"
+        if self._control_layer_log is None:
+            self._control_layer_log = LoggerAdapter(
+                control_layer_logger, {"ophyd_object_name": self._name}
+            )
+        return self._control_layer_log
+
+    @control_layer_log.setter
+    def control_layer_log(self, log):
+        self._control_layer_log = log
+
     def _validate_kind(self, val):
         if isinstance(val, str):
             return Kind[val.lower()]
@@ -310,7 +514,12 @@ class OphydObject:
 
     @kind.setter
     def kind(self, val):
-        self._kind = self._validate_kind(val)
+        val = self._validate_kind(val)
+        # Not a change when first set, on initialization
+        changed = getattr(self, "_kind", val) != val
+        self._kind = val
+        if changed:
+            _kind_changed()
 
     @property
     def dotted_name(self) -> str:
@@ -388,7 +597,9 @@ class OphydObject:
 
         No exceptions are raised if the callback functions fail.
         """
-        if sub_type not in self.subscriptions:
+        subs = self._callbacks.get(sub_type)
+        # Subscribing checks the event type, so only check without subscribers
+        if subs is None and sub_type not in self.subscriptions:
             raise UnknownSubscription(
                 "Unknown subscription {!r}, must be one of {!r}".format(
                     sub_type, self.subscriptions
@@ -404,14 +615,152 @@ class OphydObject:
         if "timestamp" in kwargs and kwargs["timestamp"] is None:
             kwargs["timestamp"] = time.time()
 
-        # Shallow-copy the callback arguments for replaying the
-        # callback at a later time (e.g., when a new subscription is made)
-        self._args_cache[sub_type] = (tuple(args), dict(kwargs))
+        # Keep the callback arguments for replaying the callback at a later
+        # time (e.g., when a new subscription is made).  ``args`` and
+        # ``kwargs`` belong to this call and callbacks receive copies of
+        # them, so no copy is needed here.
+        if self.replay_cache == "full" and self.replay_cache_max_bytes is None:
+            self._args_cache[sub_type] = (args, kwargs)
+        else:
+            self._cache_replay_args(sub_type, args, kwargs)
+
+        # The tuple is replaced rather than mutated by (un)subscribe, so it is
+        # safe to iterate without copying
+        for sub in subs or ():
+            sub.wrapped(*args, **kwargs)
+
+    def set_replay_cache(self, mode="full", *, max_bytes=None):
+        """Choose how the last event of each type is kept for replay
+
+        A new subscription made with ``run=True`` is immediately called with
+        the arguments of the last event of its type.  By default these are
+        kept as they are, which for array signals holds on to the last
+        array (and the one before it, as ``old_value``).
+
+        To change the default for a whole class, override the
+        ``replay_cache`` and ``replay_cache_max_bytes`` class attributes.
+
+        Parameters
+        ----------
+        mode : {'full', 'readback', 'metadata', 'off'}, optional
+            'full'
+                Keep all arguments (default).
+            'readback'
+                Do not keep ``value``. When replaying, use the current
+                readback value instead and pass ``old_value=None``.
+                Supported for the value subscription of signals. Other event
+                types are kept in full.
+            'metadata'
+                Do not keep events that carry a ``value``; other events (e.g.
+                metadata and connection events) are kept. Value
+                subscriptions are not run on subscribe.
+            'off'
+                Keep nothing. No subscription is run on subscribe.
+        max_bytes : int, optional
+            With 'full', keep events carrying a ``value`` only if
+            ``value`` and ``old_value`` together take no more than this many
+            bytes. Larger events are dropped, as with 'metadata'.
+        """
+        if mode not in _REPLAY_CACHE_MODES:
+            raise ValueError(
+                f"Unknown replay cache mode {mode!r}, must be one of "
+                f"{_REPLAY_CACHE_MODES}"
+            )
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+
+        self.replay_cache = mode
+        self.replay_cache_max_bytes = max_bytes
+        # Apply the new rules to what is already cached
+        for sub_type, (args, kwargs) in list(self._args_cache.items()):
+            self._cache_replay_args(sub_type, args, kwargs)
+
+    def _cache_replay_args(self, sub_type, args, kwargs):
+        """Keep the arguments of an event according to :meth:`set_replay_cache`"""
+        mode = self.replay_cache
+        if mode not in _REPLAY_CACHE_MODES:
+            raise ValueError(f"Unknown replay cache mode {mode!r}")
+
+        if mode == "off":
+            self._args_cache.pop(sub_type, None)
+            return
+
+        if "value" not in kwargs or kwargs["value"] is _REPLAY_READBACK:
+            self._args_cache[sub_type] = (args, kwargs)
+            return
 
-        for cb in list(self._callbacks[sub_type].values()):
-            cb(*args, **kwargs)
+        if mode == "readback":
+            try:
+                self._replay_readback(sub_type)
+            except KeyError:
+                mode = "full"
+            else:
+                kwargs = dict(kwargs, value=_REPLAY_READBACK, old_value=None)
+                self._args_cache[sub_type] = (args, kwargs)
+                return
+
+        max_bytes = self.replay_cache_max_bytes
+        if mode == "metadata" or (
+            max_bytes is not None
+            and approx_nbytes(kwargs["value"]) + approx_nbytes(kwargs.get("old_value"))
+            > max_bytes
+        ):
+            self._args_cache.pop(sub_type, None)
+        else:
+            self._args_cache[sub_type] = (args, kwargs)
+
+    def _memory_usage(self):
+        """Approximate memory held by this object, for Device.memory_usage
+
+        Returns
+        -------
+        usage : dict
+            Lists of the cached values ('readback' and 'replay', the payloads
+            of the replay cache) and the number of 'subscriptions'
+        """
+        replay = []
+        for args, kwargs in list(self._args_cache.values()):
+            for key in ("value", "old_value"):
+                value = kwargs.get(key)
+                if value is not None and value is not _REPLAY_READBACK:
+                    replay.append(value)
+
+        return {
+            "readback": [],
+            "replay": replay,
+            "subscriptions": sum(len(subs) for subs in self._callbacks.values()),
+        }
+
+    def _get_replay_args(self, sub_type):
+        "The arguments to replay to a new subscription, or None"
+        cached = self._args_cache.get(sub_type)
+        if cached is None:
+            return None
+        args, kwargs = cached
+        if kwargs.get("value") is _REPLAY_READBACK:
+            kwargs = dict(kwargs, value=self._replay_readback(sub_type))
+        return args, kwargs
+
+    def _replay_readback(self, sub_type):
+        """The current value to replay for ``sub_type`` in 'readback' mode
 
-    def subscribe(self, callback, event_type=None, run=True):
+        Raises
+        ------
+        KeyError
+            If this object cannot supply the value for ``sub_type``
+        """
+        raise KeyError(sub_type)
+
+    def subscribe(
+        self,
+        callback,
+        event_type=None,
+        run=True,
+        *,
+        max_rate=None,
+        deadband=None,
+        rel_deadband=None,
+    ):
         """Subscribe to events this event_type generates.
 
         The callback will be called as ``cb(*args, **kwargs)`` with
@@ -423,8 +772,8 @@ class OphydObject:
         if the key 'timestamp' is in kwargs _and_ is None, then it will
         be replaced with the current time before running the callback.
 
-        The ``*args``, ``**kwargs`` passed to _run_subs will be cached as
-        shallow copies, be aware of passing in mutable data.
+        The ``*args``, ``**kwargs`` passed to _run_subs will be cached
+        without copying their contents, be aware of passing in mutable data.
 
         .. warning::
 
@@ -448,6 +797,17 @@ class OphydObject:
             This maps to the ``sub_type`` kwargs in `_run_subs`
         run : bool, optional
             Run the callback now
+        max_rate : float, optional
+            Maximum rate (Hz) at which to run the callback. Events arriving
+            faster are dropped, except that the latest one is delivered once
+            the rate allows, so the final value is never missed.
+        deadband : float, optional
+            Drop events whose ``value`` differs from the last delivered value
+            by no more than this.
+        rel_deadband : float, optional
+            Drop events whose ``value`` differs from the last delivered value
+            by no more than this fraction of it. Combined with ``deadband``
+            as ``deadband + rel_deadband * |last_value|``.
 
         See Also
         --------
@@ -501,12 +861,21 @@ class OphydObject:
         # get next cid
         cid = next(self._cb_count)
         wrapped = wrap_cb(callback)
-        self._unwrapped_callbacks[event_type][cid] = callback
-        self._callbacks[event_type][cid] = wrapped
-        self._cid_to_event_mapping[cid] = event_type
+        if max_rate is not None or deadband is not None or rel_deadband is not None:
+            wrapped = _SubscriptionFilter(
+                wrapped,
+                max_rate=max_rate,
+                deadband=deadband,
+                rel_deadband=rel_deadband,
+            )
+        with _subscription_lock:
+            self._callbacks[event_type] = self._callbacks.get(event_type, ()) + (
+                _Subscription(cid, callback, wrapped),
+            )
+            self._cid_to_event_mapping[cid] = event_type
 
         if run:
-            cached = self._args_cache[event_type]
+            cached = self._get_replay_args(event_type)
             if cached is not None:
                 args, kwargs = cached
                 wrapped(*args, **kwargs)
@@ -515,8 +884,12 @@ class OphydObject:
 
     def _reset_sub(self, event_type):
         """Remove all subscriptions in an event type"""
-        self._callbacks[event_type].clear()
-        self._unwrapped_callbacks[event_type].clear()
+        with _subscription_lock:
+            subs = self._callbacks.pop(event_type, ())
+            for sub in subs:
+                self._cid_to_event_mapping.pop(sub.cid, None)
+        for sub in subs:
+            _cancel_pending(sub.wrapped)
 
     def clear_sub(self, cb, event_type=None):
         """Remove a subscription, given the original callback function
@@ -537,9 +910,9 @@ class OphydObject:
             event_types = [event_type]
         cid_list = []
         for et in event_types:
-            for cid, target in self._unwrapped_callbacks[et].items():
-                if cb == target:
-                    cid_list.append(cid)
+            for sub in self._callbacks.get(et, ()):
+                if cb == sub.callback:
+                    cid_list.append(sub.cid)
         for cid in cid_list:
             self.unsubscribe(cid)
 
@@ -553,14 +926,22 @@ class OphydObject:
         cid : int
            token return by :meth:`subscribe`
         """
-        ev_type = self._cid_to_event_mapping.pop(cid, None)
-        if ev_type is None:
-            return
-        del self._unwrapped_callbacks[ev_type][cid]
-        del self._callbacks[ev_type][cid]
+        with _subscription_lock:
+            ev_type = self._cid_to_event_mapping.pop(cid, None)
+            if ev_type is None:
+                return
+            subs = self._callbacks[ev_type]
+            remaining = tuple(sub for sub in subs if sub.cid != cid)
+            if remaining:
+                self._callbacks[ev_type] = remaining
+            else:
+                del self._callbacks[ev_type]
+        for sub in subs:
+            if sub.cid == cid:
+                _cancel_pending(sub.wrapped)
 
     def unsubscribe_all(self):
-        for ev_type in self._callbacks:
+        for ev_type in list(self._callbacks):
             self._reset_sub(ev_type)
 
     def check_value(self, value, **kwargs):
@@ -405,6 +405,8 @@ class PseudoPositioner(Device, SoftPositioner):
         self._finish_thread = None
         self._real_waiting = []
         self._move_queue = []
+        # Status of the current move, parent of the real motor statuses
+        self._move_status = None
         self.auto_target = auto_target
 
         if self.__class__ is PseudoPositioner:
@@ -786,6 +788,17 @@ class PseudoPositioner(Device, SoftPositioner):
         """Last commanded target positions"""
         return self.PseudoPosition(*(pos.target for pos in self._pseudo))
 
+    def _move_real(self, real, position, **kwargs):
+        """Start moving one real positioner, without waiting
+
+        The status of the real motion is recorded as a child of the status
+        of the current pseudo motion.
+        """
+        status = real.move(position, wait=False, **kwargs)
+        if self._move_status is not None:
+            self._move_status.add_child(status)
+        return status
+
     def _sequential_move(self, real_pos, timeout=None, **kwargs):
         """Move all real positioners to a certain position, in series"""
         self._move_queue[:] = zip(self._real, real_pos)
@@ -831,9 +844,9 @@ class PseudoPositioner(Device, SoftPositioner):
                     self.log.error("Motion timeout")
                     self._done_moving(success=False)
                 else:
-                    status = real.move(
+                    status = self._move_real(
+                        real,
                         position,
-                        wait=False,
                         timeout=sub_timeout,
                         moved_cb=move_next,
                         **kwargs,
@@ -852,7 +865,7 @@ class PseudoPositioner(Device, SoftPositioner):
 
         for real, value in zip(self._real, real_pos):
             self.log.debug("[concurrent] Moving %s to %s", real.name, value)
-            real.move(value, wait=False, moved_cb=self._real_finished, **kwargs)
+            self._move_real(real, value, moved_cb=self._real_finished, **kwargs)
 
     @pseudo_position_argument
     def move(self, position, wait=True, timeout=None, moved_cb=None):
@@ -911,6 +924,7 @@ class PseudoPositioner(Device, SoftPositioner):
 
         timeout = status.timeout
         real_pos = self.forward(position)
+        self._move_status = status
 
         with self._finished_lock:
             # ensure we don't get any motion complete messages before motion
@@ -920,6 +934,14 @@ class PseudoPositioner(Device, SoftPositioner):
             else:
                 self._concurrent_move(real_pos, timeout=timeout)
 
+        # Added once the motions are started, which may finish the move
+        status.add_callback(self._move_finished)
+
+    def _move_finished(self, status):
+        "Stop recording real motions as children of a finished move"
+        if self._move_status is status:
+            self._move_status = None
+
     @pseudo_position_argument
     def forward(self, pseudo_pos):
         """Calculate a RealPosition from a given PseudoPosition
@@ -1,4 +1,8 @@
 # vi: ts=4 sw=4
+import contextlib
+import contextvars
+import copy
+import functools
 import os
 import threading
 import time
@@ -8,8 +12,11 @@ import weakref
 import numpy as np
 
 from . import get_cl
+from ._workers import _call_all
+from .history import SignalHistory
 from .ophydobj import Kind, OphydObject
-from .status import Status
+from .status import Status, StatusBase
+from .tracing import trace_class_methods
 from .utils import DestroyedError, LimitError, ReadOnlyError, doc_annotation_forwarder
 from .utils.epics_pvs import (
     AlarmSeverity,
@@ -72,10 +79,165 @@ def check_dtype(value_array, dtype):
         return True
 
 
+# Metadata keys which describe() uses
+_DESCRIBE_METADATA_KEYS = frozenset(
+    {"units", "precision", "enum_strs", "lower_ctrl_limit", "upper_ctrl_limit"}
+)
+
+
+class _MetadataDict(dict):
+    """Signal metadata, with a version bumped when describe() may change
+
+    ``version`` is incremented whenever one of the keys used by
+    ``describe()`` is set to a different value.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def _check(self, key, value):
+        old = self.get(key, UNSET_VALUE)
+        if old is value:
+            return
+        try:
+            changed = bool(old != value)
+        except Exception:
+            changed = True
+        if changed:
+            self.version += 1
+
+    def __setitem__(self, key, value):
+        if key in _DESCRIBE_METADATA_KEYS:
+            self._check(key, value)
+        super().__setitem__(key, value)
+
+    def update(self, *args, **kwargs):
+        if args:
+            kwargs = dict(*args, **kwargs)
+        if not _DESCRIBE_METADATA_KEYS.isdisjoint(kwargs):
+            for key in _DESCRIBE_METADATA_KEYS.intersection(kwargs):
+                self._check(key, kwargs[key])
+        super().update(kwargs)
+
+
+def _value_signature(value):
+    "What describe() infers from a value: its type and shape"
+    if isinstance(value, np.ndarray):
+        return (np.ndarray, value.dtype.str, value.shape)
+    if isinstance(value, (list, tuple)):
+        return (type(value), len(value))
+    return type(value)
+
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _copy_description(value):
+    """Copy a cached description, so that callers may change it
+
+    Nested dicts and lists (shapes, limits, ...) are copied too.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_description(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_copy_description(val) for val in value]
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
 class _DefaultFloat(float):
     pass
 
 
+# Shared by every _ReadyFlag, as signals rarely wait on them and only briefly
+_ready_condition = threading.Condition()
+
+
+class _ReadyFlag:
+    """A threading.Event-like flag, waited on with a shared Condition
+
+    A threading.Event per EpicsSignal, with its own Condition and lock, costs
+    several hundred bytes for something only used while connecting.
+    """
+
+    __slots__ = ("_flag",)
+
+    def __init__(self):
+        self._flag = False
+
+    def is_set(self):
+        return self._flag
+
+    def set(self):
+        with _ready_condition:
+            self._flag = True
+            _ready_condition.notify_all()
+
+    def clear(self):
+        self._flag = False
+
+    def wait(self, timeout=None):
+        with _ready_condition:
+            return _ready_condition.wait_for(self.is_set, timeout)
+
+
+_key_maps_without_limits = {}
+
+
+class _Burst:
+    "The arrays filled in by Signal.read_burst"
+
+    def __init__(self, n, out=None):
+        self.n = n
+        self.values, self.timestamps = out if out is not None else (None, None)
+        self.count = 0
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+
+    def add(self, value, timestamp):
+        "Add a value, returning False once the arrays are full"
+        with self._lock:
+            if self.count >= self.n:
+                return False
+            if self.values is None:
+                value_array = np.asanyarray(value)
+                # Strings of any length, rather than that of the first one
+                dtype = object if value_array.dtype.kind in "OSU" else value_array.dtype
+                self.values = np.empty((self.n,) + value_array.shape, dtype=dtype)
+                self.timestamps = np.empty(self.n)
+            self.values[self.count] = value
+            self.timestamps[self.count] = timestamp
+            self.count += 1
+            if self.count == self.n:
+                self.done.set()
+            return True
+
+    def result(self):
+        with self._lock:
+            if self.values is None:
+                return np.empty(0), np.empty(0)
+            return self.values[: self.count], self.timestamps[: self.count]
+
+
+def _without_limits(key_map):
+    "The metadata key map of a read PV with a separate setpoint PV (shared)"
+    try:
+        return _key_maps_without_limits[id(key_map)][1]
+    except KeyError:
+        shared = {
+            key: value
+            for key, value in key_map.items()
+            if key not in ("lower_ctrl_limit", "upper_ctrl_limit")
+        }
+        # Keep a reference to key_map, so that its id is not reused
+        _key_maps_without_limits[id(key_map)] = (key_map, shared)
+        return shared
+
+
 class Signal(OphydObject):
     r"""A signal, which can have a read-write or read-only value.
 
@@ -110,12 +272,35 @@ class Signal(OphydObject):
     ----------
     rtolerance : any, optional
         The relative tolerance associated with the value
+    always_set : bool
+        Have devices set this signal on stage, unstage and configure even
+        when it already has the value, for signals where writing has an
+        effect of its own (such as Acquire or Erase).  Only matters to
+        devices with ``skip_redundant_sets``.  Default is False.
     """
 
+    __slots__ = (
+        "cl",
+        "_dispatcher",
+        "_metadata_thread_ctx",
+        "_value_dtype_str",
+        "_value_shape",
+        "_readback",
+        "_destroyed",
+        "_set_thread",
+        "_describe_cache",
+        "_tolerance",
+        "rtolerance",
+        "_metadata",
+        "_history",
+        "_history_warned",
+    )
+
     SUB_VALUE = "value"
     SUB_META = "meta"
     _default_sub = SUB_VALUE
     _metadata_keys = None
+    always_set = False
     _core_metadata_keys = ("connected", "read_access", "write_access", "timestamp")
 
     def __init__(
@@ -191,13 +376,18 @@ class Signal(OphydObject):
         self._destroyed = False
 
         self._set_thread = None
+        # (key, description) of the last describe(); see _describe_key
+        self._describe_cache = None
         self._tolerance = tolerance
         # self.tolerance is a property
         self.rtolerance = rtolerance
+        # See enable_history
+        self._history = None
+        self._history_warned = False
 
         # Signal defaults to being connected, with full read/write access.
         # Subclasses are expected to clear these on init, if applicable.
-        self._metadata = dict(
+        self._metadata = _MetadataDict(
             connected=True,
             read_access=True,
             write_access=True,
@@ -219,6 +409,11 @@ class Signal(OphydObject):
 
             self._metadata.update(**unset_metadata)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Spans on get/put, see ophyd.tracing.config_ophyd_tracing
+        trace_class_methods(cls, "signals", ("get", "put"))
+
     @property
     def source_name(self):
         return "SIM:{}".format(self.name)
@@ -278,6 +473,18 @@ class Signal(OphydObject):
             raise RuntimeError("Signal value has never been read yet")
         return self._readback
 
+    def _memory_usage(self):
+        usage = super()._memory_usage()
+        value = self._readback
+        if value is not UNSET_VALUE and value is not None:
+            usage["readback"] = [value]
+        return usage
+
+    def _replay_readback(self, sub_type):
+        if sub_type != self.SUB_VALUE:
+            raise KeyError(sub_type)
+        return self._readback
+
     def put(
         self,
         value,
@@ -351,10 +558,60 @@ class Signal(OphydObject):
         if "timestamp" not in self._metadata_keys:
             md_for_callback["timestamp"] = timestamp
 
+        history = self._history
+        if history is not None:
+            try:
+                history.append(timestamp, value)
+            except (TypeError, ValueError):
+                # Warned once per enable_history, rather than on every put
+                log = self.log.debug if self._history_warned else self.log.warning
+                self._history_warned = True
+                log("Value %r not added to the history", value)
+
         self._run_subs(
             sub_type=self.SUB_VALUE, old_value=old_value, value=value, **md_for_callback
         )
 
+    def enable_history(self, size, *, dtype=float, shape=()):
+        """Keep the last ``size`` values of the signal in memory
+
+        Values are added on each update of the signal, before its value
+        subscriptions run, starting with the current value.  This replaces any
+        history already enabled.
+
+        Parameters
+        ----------
+        size : int
+            Number of values to keep
+        dtype : numpy dtype, optional
+            Data type of the values.  Defaults to float.
+        shape : tuple, optional
+            Shape of each value.  Defaults to ``()``, for scalars.
+
+        Returns
+        -------
+        history : ophyd.history.SignalHistory
+        """
+        history = SignalHistory(size, dtype=dtype, shape=shape)
+        value = self._readback
+        if value is not UNSET_VALUE:
+            try:
+                history.append(self.timestamp, value)
+            except (TypeError, ValueError):
+                pass
+        self._history = history
+        self._history_warned = False
+        return history
+
+    def disable_history(self):
+        "Stop keeping the history enabled by :meth:`enable_history`"
+        self._history = None
+
+    @property
+    def history(self):
+        "The SignalHistory from :meth:`enable_history`, or None"
+        return self._history
+
     def _set_and_wait(self, value, timeout, **kwargs):
         """
         Overridable hook for subclasses to override :meth:`.set` functionality.
@@ -518,6 +775,14 @@ class Signal(OphydObject):
     def value(self, value):
         self.put(value)
 
+    @property
+    def _read_needs_request(self):
+        """Does read() wait for a request to the control system?
+
+        Devices read such signals concurrently.
+        """
+        return False
+
     @raise_if_disconnected
     def read(self):
         """Put the status of the signal into a simple dictionary format
@@ -530,6 +795,79 @@ class Signal(OphydObject):
         value = self.get()
         return {self.name: {"value": value, "timestamp": self.timestamp}}
 
+    @raise_if_disconnected
+    def read_burst(self, n, period=None, from_monitor=True, *, timeout=None, out=None):
+        """Read ``n`` consecutive values of the signal into arrays
+
+        Parameters
+        ----------
+        n : int
+            Number of values to read
+        period : float, optional
+            With ``from_monitor``, the minimum time between the timestamps of
+            the values kept (faster updates are skipped).  Otherwise, the time
+            between the starts of successive ``get()`` calls; by default they
+            are made back to back.
+        from_monitor : bool, optional
+            Take the next ``n`` value updates of the signal (its SUB_VALUE
+            subscription) rather than calling ``get()``.  Defaults to True.
+        timeout : float, optional
+            Stop reading after this time, returning the values read so far.
+            By default, wait until all ``n`` values are read.
+        out : (values, timestamps), optional
+            Arrays of length ``n`` (or more) to fill in.  By default, they are
+            allocated on the first value read, to its dtype and shape.
+
+        Returns
+        -------
+        values, timestamps : numpy.ndarray
+            The first axis is of the number of values read, which is ``n``
+            unless ``timeout`` expired
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is less than 1
+        """
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}")
+        burst = _Burst(n, out)
+        if from_monitor:
+            last_timestamp = None
+
+            def value_updated(*, value, timestamp=None, **kwargs):
+                nonlocal last_timestamp
+                if timestamp is None:
+                    timestamp = time.time()
+                if (
+                    period is not None
+                    and last_timestamp is not None
+                    and timestamp - last_timestamp < period
+                ):
+                    return
+                if burst.add(value, timestamp):
+                    last_timestamp = timestamp
+
+            cid = self.subscribe(value_updated, event_type=self.SUB_VALUE, run=False)
+            try:
+                burst.done.wait(timeout)
+            finally:
+                self.unsubscribe(cid)
+        else:
+            start = time.monotonic()
+            deadline = None if timeout is None else start + timeout
+            for i in range(n):
+                next_time = start + i * (period or 0.0)
+                if deadline is not None and max(next_time, time.monotonic()) > deadline:
+                    break
+                delay = next_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                value = self.get()
+                burst.add(value, self.timestamp)
+
+        return burst.result()
+
     def _infer_value_kind(self, inference_func):
         if self._readback is UNSET_VALUE:
             val = self.get()
@@ -550,6 +888,32 @@ class Signal(OphydObject):
         else:
             return inferred_kind
 
+    def _describe_key(self):
+        """A key which changes whenever the result of ``describe()`` may
+
+        It covers the name, the metadata used by ``describe()`` and the type
+        and shape of the value.  None means the result cannot be cached.
+        """
+        metadata_version = getattr(self._metadata, "version", None)
+        if metadata_version is None:
+            return None
+        return (
+            self.name,
+            metadata_version,
+            self._value_dtype_str,
+            self._value_shape,
+            _value_signature(self._readback),
+        )
+
+    @property
+    def _describe_cacheable(self):
+        "Can a Device cache the output of describe() by _describe_key()?"
+        cls = type(self)
+        return (
+            cls.describe is Signal.describe
+            and cls.describe_configuration is Signal.describe_configuration
+        )
+
     def describe(self):
         """Provide schema and meta-data for :meth:`~BlueskyInterface.read`
 
@@ -565,6 +929,25 @@ class Signal(OphydObject):
             The keys must be strings and the values must be dict-like
             with the ``event_model.event_descriptor.data_key`` schema.
         """
+        key = self._describe_key()
+        cached = self._describe_cache
+        if key is None or cached is None or cached[0] != key:
+            desc = self._describe()[self.name]
+            if key is not None:
+                # the value may have been read while describing
+                self._describe_cache = (
+                    self._describe_key(),
+                    _copy_description(desc),
+                )
+            return {self.name: desc}
+        return {self.name: _copy_description(cached[1])}
+
+    def _describe(self):
+        """The description returned, and cached, by :meth:`describe`
+
+        Subclasses extend this, rather than ``describe()``, to have their
+        additions cached too.
+        """
         dtype_numpy = self._value_dtype_str
         shape = (
             self._value_shape
@@ -671,6 +1054,9 @@ class Signal(OphydObject):
         )
 
 
+trace_class_methods(Signal, "signals", ("get", "put"))
+
+
 class SignalRO(Signal):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -753,9 +1139,23 @@ class DerivedSignal(Signal):
         """Signal that this one is derived from"""
         return self._derived_from
 
-    def describe(self):
+    @property
+    def _read_needs_request(self):
+        return getattr(self._derived_from, "_read_needs_request", False)
+
+    def _describe_key(self):
+        key = super()._describe_key()
+        derived_from = self._derived_from
+        if key is None or not getattr(derived_from, "_describe_cacheable", False):
+            return None
+        derived_key = derived_from._describe_key()
+        if derived_key is None:
+            return None
+        return key + (derived_key,)
+
+    def _describe(self):
         """Description based on the original signal description"""
-        desc = super().describe()
+        desc = super()._describe()
         desc[self.name]["derived_from"] = self._derived_from.name
         # Description of the derived signal
         derived_desc = self._derived_from.describe()[self._derived_from.name]
@@ -969,6 +1369,25 @@ class EpicsSignalBase(Signal):
         Explicitly passing None means, "Wait forever."
     """
 
+    __slots__ = (
+        "_metadata_lock",
+        "_read_pv",
+        "_read_pvname",
+        "_string",
+        "_signal_is_ready",
+        "_first_connection",
+        "_auto_monitor",
+        "_connection_timeout",
+        "_timeout",
+        "_write_timeout",
+        "_connection_states",
+        "_access_rights_valid",
+        "_received_first_metadata",
+        "_monitors",
+        "_metadata_key_map",
+        "_read_pv_finalizer",
+    )
+
     # This is set to True when the first instance is made. It is used to ensure
     # that certain class-global settings can only be made before any
     # instantiation.
@@ -1021,7 +1440,7 @@ class EpicsSignalBase(Signal):
         self._read_pvname = read_pv
         self._string = bool(string)
 
-        self._signal_is_ready = threading.Event()
+        self._signal_is_ready = _ReadyFlag()
         self._first_connection = True
 
         if auto_monitor is DEFAULT_AUTO_MONITOR:
@@ -1283,6 +1702,10 @@ class EpicsSignalBase(Signal):
         """Attempt to cast the EPICS PV value to a string by default"""
         return self._string
 
+    @property
+    def _read_needs_request(self):
+        return not self._auto_monitor
+
     @property
     def precision(self):
         """The precision of the read PV, as reported by EPICS"""
@@ -1310,13 +1733,13 @@ class EpicsSignalBase(Signal):
                 self._monitors[pvname] = mon
 
     @doc_annotation_forwarder(Signal)
-    def subscribe(self, callback, event_type=None, run=True):
+    def subscribe(self, callback, event_type=None, run=True, **kwargs):
         if event_type is None:
             event_type = self._default_sub
         if event_type == self.SUB_VALUE:
             self._add_callback(self._read_pvname, self._read_pv, self._read_changed)
 
-        return super().subscribe(callback, event_type=event_type, run=run)
+        return super().subscribe(callback, event_type=event_type, run=run, **kwargs)
 
     def _ensure_connected(self, *pvs, timeout):
         "Ensure that `pv` is connected, with access/connection callbacks run"
@@ -1572,7 +1995,7 @@ class EpicsSignalBase(Signal):
             force=True,
         )
 
-    def describe(self):
+    def _describe(self):
         """Return the description as a dictionary
 
         Returns
@@ -1580,7 +2003,7 @@ class EpicsSignalBase(Signal):
         dict
             Dictionary of name and formatted description string
         """
-        ret = super().describe()
+        ret = super()._describe()
         desc = ret[self.name]
         lower_ctrl_limit, upper_ctrl_limit = self.limits
         desc.update(
@@ -1679,6 +2102,73 @@ class EpicsSignalRO(EpicsSignalBase):
             self._run_metadata_callbacks()
 
 
+class _PutCoalescer:
+    "State of the coalesced puts of an EpicsSignal"
+
+    __slots__ = ("_lock", "_in_flight", "_deadline", "_pending", "coalesced")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Token of the put in flight, or None
+        self._in_flight = None
+        self._deadline = None
+        # (value, callbacks, timeout, kwargs) of the put held back
+        self._pending = None
+        self.coalesced = 0
+
+    def _start(self, timeout):
+        "Mark a put as in flight, returning its token"
+        self._in_flight = object()
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        return self._in_flight
+
+    def defer(self, value, callbacks, timeout, kwargs):
+        """Hold back a put if another is in flight
+
+        Returns
+        -------
+        token : object or None
+            None if the put was held back.  Otherwise, the put is to be
+            written now and ``token`` passed to :meth:`completed`.
+        callbacks : list
+            The callbacks to run on completion of the put written now,
+            including those of any put it replaces
+        """
+        with self._lock:
+            if self._pending is not None:
+                self.coalesced += 1
+                # Callbacks run once the replacing value is written
+                callbacks = self._pending[1] + callbacks
+                self._pending = None
+
+            if self._in_flight is not None and (
+                self._deadline is None or time.monotonic() < self._deadline
+            ):
+                self._pending = (value, callbacks, timeout, kwargs)
+                return None, []
+
+            # None in flight, or its completion never came: write this one
+            return self._start(timeout), callbacks
+
+    def completed(self, token, failed=False):
+        """The put of ``token`` completed; return the put held back, if any
+
+        Returns
+        -------
+        pending : (token, value, callbacks, timeout, kwargs) or None
+            The put to write now, if any
+        """
+        with self._lock:
+            if token is not self._in_flight:
+                # Completion of a put which timed out, and was superseded
+                return None
+            pending, self._pending = self._pending, None
+            if pending is None or failed:
+                self._in_flight = None
+                return None
+            return (self._start(pending[2]),) + pending
+
+
 class EpicsSignal(EpicsSignalBase):
     """An EPICS signal, comprised of either one or two EPICS PVs
 
@@ -1698,6 +2188,9 @@ class EpicsSignal(EpicsSignalBase):
         Name of signal.  If not given defaults to read_pv
     put_complete : bool, optional
         Use put completion when writing the value
+    coalesce_puts : bool, optional
+        Hold back puts made while one is in flight, writing only the latest
+        once it completes.  See :attr:`coalesce_puts`.
     tolerance : any, optional
         The absolute tolerance associated with the value.
         If specified, this overrides any precision information calculated from
@@ -1736,6 +2229,16 @@ class EpicsSignal(EpicsSignalBase):
         Explicitly passing None means, "Wait forever."
     """
 
+    __slots__ = (
+        "_write_pv",
+        "_setpoint_pvname",
+        "_setpoint",
+        "_put_complete",
+        "_use_limits",
+        "_write_pv_finalizer",
+        "_coalescer",
+    )
+
     SUB_SETPOINT = "setpoint"
     SUB_SETPOINT_META = "setpoint_meta"
 
@@ -1762,6 +2265,7 @@ class EpicsSignal(EpicsSignalBase):
         write_pv=None,
         *,
         put_complete=False,
+        coalesce_puts=False,
         string=False,
         limits=False,
         name=None,
@@ -1772,6 +2276,7 @@ class EpicsSignal(EpicsSignalBase):
         self._use_limits = bool(limits)
         self._put_complete = put_complete
         self._setpoint = None
+        self._coalescer = _PutCoalescer() if coalesce_puts else None
 
         metadata = dict(
             setpoint_timestamp=None,
@@ -1801,11 +2306,7 @@ class EpicsSignal(EpicsSignalBase):
             validate_pv_name(write_pv)
             self._metadata_key_map = {
                 write_pv: self._write_pv_metadata_key_map,
-                read_pv: {
-                    key: value
-                    for key, value in self._metadata_key_map[read_pv].items()
-                    if key not in ("lower_ctrl_limit", "upper_ctrl_limit")
-                },
+                read_pv: _without_limits(self._metadata_key_map[read_pv]),
             }
 
             self._write_pv = self.cl.get_pv(
@@ -1834,7 +2335,7 @@ class EpicsSignal(EpicsSignalBase):
         self._write_pv_finalizer()
 
     @doc_annotation_forwarder(EpicsSignalBase)
-    def subscribe(self, callback, event_type=None, run=True):
+    def subscribe(self, callback, event_type=None, run=True, **kwargs):
         if event_type is None:
             event_type = self._default_sub
 
@@ -1843,7 +2344,7 @@ class EpicsSignal(EpicsSignalBase):
                 self._setpoint_pvname, self._write_pv, self._write_changed
             )
 
-        return super().subscribe(callback, event_type=event_type, run=run)
+        return super().subscribe(callback, event_type=event_type, run=run, **kwargs)
 
     def wait_for_connection(self, timeout=DEFAULT_CONNECTION_TIMEOUT):
         """Wait for the underlying signals to initialize or connect"""
@@ -2117,10 +2618,26 @@ class EpicsSignal(EpicsSignalBase):
         timeout : float, optional
             Timeout before assuming that put has failed. (Only relevant if
             put completion is used.)
+
+        Within a :func:`put_group`, the value is checked but the put is only
+        made on exiting the group.
         """
         if not force:
             self.check_value(value)
 
+        group = _put_group.get()
+        if group is not None:
+            group.add(
+                self,
+                value,
+                connection_timeout=connection_timeout,
+                callback=callback,
+                use_complete=use_complete,
+                timeout=timeout,
+                **kwargs,
+            )
+            return
+
         if connection_timeout is DEFAULT_CONNECTION_TIMEOUT:
             connection_timeout = self.connection_timeout
         if timeout is DEFAULT_WRITE_TIMEOUT:
@@ -2132,6 +2649,59 @@ class EpicsSignal(EpicsSignalBase):
         if not self.write_access:
             raise ReadOnlyError("No write access to underlying EPICS PV")
 
+        coalescer = self._coalescer
+        if coalescer is None:
+            self._put(value, use_complete, callback, timeout, kwargs)
+            return
+
+        callbacks = [callback] if callback is not None else []
+        token, callbacks = coalescer.defer(value, callbacks, timeout, kwargs)
+        if token is not None:
+            self._put_coalesced(coalescer, token, value, callbacks, timeout, kwargs)
+
+    def _put_coalesced(self, coalescer, token, value, callbacks, timeout, kwargs):
+        "Write a value with put completion, then the put held back meanwhile"
+
+        def put_completed(**callback_kwargs):
+            if timer is not None:
+                timer.cancel()
+            # Release the coalescer before running the callbacks, so that one
+            # failing cannot hold back all later puts
+            pending = coalescer.completed(token)
+            for callback in callbacks:
+                try:
+                    callback(**callback_kwargs)
+                except Exception:
+                    self.log.exception("Put completion callback %r failed", callback)
+            if pending is not None:
+                self._put_coalesced(coalescer, *pending)
+
+        def timed_out():
+            # No completion came in time: write the put held back meanwhile,
+            # rather than holding it (and every later put) back forever
+            pending = coalescer.completed(token)
+            if pending is not None:
+                try:
+                    self._put_coalesced(coalescer, *pending)
+                except Exception:
+                    self.log.exception("Failed to write the put held back")
+
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, timed_out)
+            timer.daemon = True
+
+        try:
+            self._put(value, True, put_completed, timeout, kwargs)
+        except Exception:
+            coalescer.completed(token, failed=True)
+            raise
+
+        if timer is not None:
+            timer.start()
+
+    def _put(self, value, use_complete, callback, timeout, kwargs):
+        "Write to the write PV, and update the setpoint"
         self.control_layer_log.debug(
             "_write_pv.put(value=%s, use_complete=%s, callback=%s, kwargs=%s)",
             value,
@@ -2219,6 +2789,38 @@ class EpicsSignal(EpicsSignalBase):
         )
         self.put(value)
 
+    @property
+    def coalesce_puts(self):
+        """Coalesce puts made while one is in flight
+
+        While a put is in progress (until its put completion callback), a new
+        put is held back rather than written, replacing any put held back
+        before it.  Once the put in progress completes, the latest value held
+        back is written.  The put completion callbacks of the puts replaced
+        are run once the value replacing them is written.  Puts are always
+        made with put completion.  If the put in progress has a timeout and
+        does not complete within it, the value held back is written then.
+
+        As a result, the status of a :meth:`set` whose value was replaced
+        finishes successfully once the value replacing it is written: it
+        does not mean that its own value was ever written.  Compare with
+        :attr:`setpoint` where that matters.
+        """
+        return self._coalescer is not None
+
+    @coalesce_puts.setter
+    def coalesce_puts(self, value):
+        if not value:
+            self._coalescer = None
+        elif self._coalescer is None:
+            self._coalescer = _PutCoalescer()
+
+    @property
+    def coalesced_puts(self):
+        "Number of puts replaced by a later one, and so never written"
+        coalescer = self._coalescer
+        return coalescer.coalesced if coalescer is not None else 0
+
     @property
     def put_complete(self):
         "Use put completion when writing the value"
@@ -2238,6 +2840,166 @@ class EpicsSignal(EpicsSignalBase):
         self._use_limits = bool(value)
 
 
+# The PutGroup of the put_group() being entered; see EpicsSignal.put
+_put_group = contextvars.ContextVar("ophyd_put_group", default=None)
+
+
+class PutGroup:
+    """EpicsSignal puts queued by :func:`put_group`, and made together
+
+    Parameters
+    ----------
+    wait : bool, optional
+        Use put completion for all puts, and wait for every one to complete
+    timeout : float, optional
+        Timeout of :attr:`status`
+
+    Attributes
+    ----------
+    status : StatusBase or None
+        Once the puts are made, finished when all of them have completed
+    """
+
+    def __init__(self, *, wait=False, timeout=None):
+        self.wait = wait
+        self.timeout = timeout
+        self.status = None
+        self._puts = []
+
+    def __len__(self):
+        return len(self._puts)
+
+    def add(self, signal, value, **kwargs):
+        "Queue ``signal.put(value, **kwargs)``"
+        self._puts.append((signal, value, kwargs))
+
+    def write(self):
+        """Make the queued puts, back to back
+
+        Puts using put completion count as complete once their callback is
+        called; others as soon as they are made.
+
+        Returns
+        -------
+        status : StatusBase
+            Finished when all puts have completed
+        """
+        puts, self._puts = self._puts, []
+        status = StatusBase(timeout=self.timeout)
+        # One for each put, and one released once all are made
+        remaining = [len(puts) + 1]
+        lock = threading.Lock()
+
+        def put_completed():
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished and not status.done:
+                status.set_finished()
+
+        error = None
+        for signal, value, kwargs in puts:
+            callback = kwargs.pop("callback", None)
+            use_complete = kwargs.pop("use_complete", None)
+            if self.wait:
+                use_complete = True
+            elif use_complete is None:
+                use_complete = signal.put_complete
+
+            def put_callback(*args, callback=callback, **callback_kwargs):
+                try:
+                    if callback is not None:
+                        callback(*args, **callback_kwargs)
+                finally:
+                    put_completed()
+
+            try:
+                if use_complete:
+                    signal.put(
+                        value,
+                        force=True,
+                        use_complete=True,
+                        callback=put_callback,
+                        **kwargs,
+                    )
+                else:
+                    signal.put(
+                        value,
+                        force=True,
+                        use_complete=False,
+                        callback=callback,
+                        **kwargs,
+                    )
+                    put_completed()
+            except Exception as ex:
+                if error is None:
+                    error = ex
+
+        put_completed()
+        self.status = status
+        if error is not None:
+            if not status.done:
+                status.set_exception(error)
+            raise error
+        if self.wait:
+            status.wait()
+        return status
+
+
+@contextlib.contextmanager
+def put_group(*, wait=False, timeout=None):
+    """Queue EpicsSignal puts, and make them together on exit
+
+    Puts made in the block are checked, then queued.  On leaving the block,
+    they are made back to back, in order, without waiting on each other, and
+    a single status tracks their completion.  If the block raises, the queued
+    puts are not made.
+
+    >>> with put_group(wait=True) as group:
+    ...     mono.energy_sp.put(8000)
+    ...     slits.hgap.put(0.5)
+    >>> group.status.done
+    True
+
+    Within an enclosing group, puts join that group instead, and ``wait`` and
+    ``timeout`` are those of the enclosing group.
+
+    Parameters
+    ----------
+    wait : bool, optional
+        Use put completion for all puts, and wait on exit until all have
+        completed
+    timeout : float, optional
+        Timeout of the combined status
+
+    Yields
+    ------
+    group : PutGroup
+        With a ``status`` once the puts are made
+
+    Raises
+    ------
+    ValueError
+        If ``wait`` or ``timeout`` is given within an enclosing group
+    """
+    outer = _put_group.get()
+    if outer is not None:
+        if wait or timeout is not None:
+            raise ValueError(
+                "wait and timeout cannot be given within an enclosing put_group"
+            )
+        yield outer
+        return
+
+    group = PutGroup(wait=wait, timeout=timeout)
+    token = _put_group.set(group)
+    try:
+        yield group
+    finally:
+        _put_group.reset(token)
+    group.write()
+
+
 class EpicsSignalNoValidation(EpicsSignal):
     """An EpicsSignal that does not verify values on set.
     This signal does support readback, but does not guarantee that
@@ -2380,3 +3142,176 @@ class ArrayAttributeSignal(AttributeSignal):
 
     def get(self, **kwargs):
         return np.asarray(super().get(**kwargs))
+
+
+class VectorSignal(Signal):
+    """Homogeneous channel signals, read and described as one array
+
+    Banks of identical channels, such as the counters of a scaler, are often
+    built as one sub-device (or signal) per channel, each read and described
+    on its own.  A VectorSignal reads all of its channels in one call and
+    reports their values as one array under a single key.  It is usually
+    created by :class:`~ophyd.device.VectorComponent`.
+
+    Parameters
+    ----------
+    channels : sequence of Signal
+        The channel signals, in array order
+    channel_names : sequence of str, optional
+        Names of the channels, reported by ``describe()`` under
+        'channel_names'.  Defaults to the names of the channel signals.
+    dtype : numpy dtype, optional
+        Data type of the array.  By default, it is inferred from the values.
+    name : str, keyword only
+        The signal name
+
+    Keyword arguments are passed on to the base class (Signal) initializer.
+
+    Attributes
+    ----------
+    parallel_reads : bool
+        Read the channels that request their value from the control system
+        concurrently, in worker threads of the control layer.  Also enabled
+        by ``parallel_reads`` of the parent Device.  Default is False.
+    """
+
+    parallel_reads = False
+
+    def __init__(self, channels, *, channel_names=None, dtype=None, name, **kwargs):
+        channels = tuple(channels)
+        if channel_names is None:
+            channel_names = [channel.name for channel in channels]
+        channel_names = tuple(channel_names)
+        if len(channel_names) != len(channels):
+            raise ValueError(
+                f"{len(channel_names)} channel names given for "
+                f"{len(channels)} channels"
+            )
+
+        super().__init__(
+            name=name,
+            value=UNSET_VALUE,
+            dtype=dtype,
+            shape=(len(channels),),
+            **kwargs,
+        )
+        self._channels = channels
+        self._channel_names = channel_names
+        self._array_dtype = dtype
+        self._metadata["write_access"] = False
+        self._channel_values = [UNSET_VALUE] * len(channels)
+        self._channel_values_lock = threading.Lock()
+        self._monitoring = False
+
+    @property
+    def channels(self):
+        "The channel signals, in array order"
+        return self._channels
+
+    @property
+    def channel_names(self):
+        "Names of the channels, in array order"
+        return self._channel_names
+
+    @property
+    def _read_needs_request(self):
+        return any(channel._read_needs_request for channel in self._channels)
+
+    def _make_array(self, values):
+        return np.asarray(values, dtype=self._array_dtype)
+
+    def get(self, **kwargs):
+        """Get the value of every channel, as one array
+
+        See :attr:`parallel_reads` to read the channels concurrently.
+        """
+        parallel = self.parallel_reads or getattr(self.parent, "parallel_reads", False)
+        values = _call_all(self._channels, "get", parallel, **kwargs)
+        with self._channel_values_lock:
+            self._channel_values[:] = values
+        self._readback = self._make_array(values)
+        self._metadata["timestamp"] = max(
+            channel.timestamp for channel in self._channels
+        )
+        return self._readback
+
+    def put(self, value, **kwargs):
+        "Disabled for a VectorSignal"
+        raise ReadOnlyError(f"The signal {self.name} is read-only.")
+
+    def set(self, value, **kwargs):
+        "Disabled for a VectorSignal"
+        raise ReadOnlyError(f"The signal {self.name} is read-only.")
+
+    def subscribe(self, callback, event_type=None, run=True, **kwargs):
+        if event_type is None:
+            event_type = self._default_sub
+        if event_type == self.SUB_VALUE:
+            self._monitor_channels()
+
+        return super().subscribe(callback, event_type=event_type, run=run, **kwargs)
+
+    def _monitor_channels(self):
+        "Update the array, and run SUB_VALUE, as each channel updates"
+        with self._channel_values_lock:
+            if self._monitoring:
+                return
+            self._monitoring = True
+
+        for index, channel in enumerate(self._channels):
+            channel.subscribe(
+                functools.partial(self._channel_value_callback, index),
+                event_type=channel.SUB_VALUE,
+                run=channel.connected,
+            )
+
+    def _channel_value_callback(self, index, *, value, timestamp=None, **kwargs):
+        "A channel value updated - update the array"
+        if value is UNSET_VALUE:
+            return
+
+        with self._channel_values_lock:
+            values = self._channel_values
+            values[index] = value
+            if any(value is UNSET_VALUE for value in values):
+                return
+            array = self._make_array(values)
+
+        old_value = self._readback
+        self._readback = array
+        if timestamp is None:
+            timestamp = time.time()
+        self._metadata["timestamp"] = timestamp
+        self._run_subs(
+            sub_type=self.SUB_VALUE,
+            old_value=old_value,
+            value=array,
+            timestamp=timestamp,
+        )
+
+    @property
+    def source_name(self):
+        return "VECTOR:" + ",".join(channel.source_name for channel in self._channels)
+
+    def _describe(self):
+        desc = super()._describe()
+        desc[self.name]["channel_names"] = list(self._channel_names)
+        return desc
+
+    def wait_for_connection(self, timeout=DEFAULT_CONNECTION_TIMEOUT):
+        """Wait for the channel signals to connect"""
+        for channel in self._channels:
+            channel.wait_for_connection(timeout=timeout)
+
+    @property
+    def connected(self):
+        """Are all of the channels connected?"""
+        return not self._destroyed and all(
+            channel.connected for channel in self._channels
+        )
+
+    def destroy(self):
+        """Destroy the signal and its channels"""
+        for channel in self._channels:
+            channel.destroy()
+        super().destroy()
@@ -1,7 +1,7 @@
 import json
 import threading
 import time
-from collections import deque
+from collections import deque, namedtuple
 from functools import partial
 from logging import LoggerAdapter
 from warnings import warn
@@ -10,6 +10,7 @@ import numpy as np
 from opentelemetry import trace
 
 from .log import logger
+from .tracing import LazyAttribute, set_span_attributes, should_trace_status
 from .utils import (
     InvalidState,
     StatusTimeoutError,
@@ -26,6 +27,29 @@ class UseNewProperty(RuntimeError):
     ...
 
 
+class _NullTraceAttributes(dict):
+    "Shared stand-in for the trace attributes of a Status that is not traced"
+
+    def __setitem__(self, key, value):
+        pass
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+_NULL_TRACE_ATTRIBUTES = _NullTraceAttributes()
+
+TimelineEntry = namedtuple("TimelineEntry", "depth status created finished settled")
+TimelineEntry.__doc__ = """
+One Status in a :meth:`StatusBase.timeline`
+
+Timestamps are UNIX epoch times, or None if that stage has not been reached:
+``created`` when the Status was instantiated, ``finished`` when it was marked
+finished, failed or timed out, and ``settled`` when it became done (after
+``settle_time``) and its callbacks were about to run.
+"""
+
+
 class StatusBase:
     """
     Track the status of a potentially-lengthy action like moving or triggering.
@@ -85,14 +109,23 @@ class StatusBase:
 
     def __init__(self, *, timeout=None, settle_time=0, done=None, success=None):
         super().__init__()
-        self._tracing_span = tracer.start_span(_TRACE_PREFIX)
-        self._trace_attributes = {
-            "status_type": self.__class__.__name__,
-            "settle_time": settle_time,
-        }
-        self._trace_attributes.update(
-            {"timeout": timeout} if timeout else {"no_timeout_given": True}
-        )
+        self._created_ts = time.time()
+        self._finished_ts = None
+        self._settled_ts = None
+        self._children = ()
+        # See ophyd.tracing.config_ophyd_tracing for what is traced
+        if should_trace_status(type(self)):
+            self._tracing_span = tracer.start_span(_TRACE_PREFIX)
+            self._trace_attributes = {
+                "status_type": self.__class__.__name__,
+                "settle_time": settle_time,
+            }
+            self._trace_attributes.update(
+                {"timeout": timeout} if timeout else {"no_timeout_given": True}
+            )
+        else:
+            self._tracing_span = None
+            self._trace_attributes = _NULL_TRACE_ATTRIBUTES
         self._tname = None
         self._lock = threading.RLock()
         self._event = threading.Event()  # state associated with done-ness
@@ -147,8 +180,6 @@ class StatusBase:
                 )
                 self.set_exception(exc)
 
-        self._trace_attributes["object_repr"] = repr(self)
-
     @property
     def timeout(self):
         """
@@ -261,6 +292,7 @@ class StatusBase:
                         f"Status {self!r} failed to complete in specified timeout."
                     )
                     self._exception = exc
+                    self._finished_ts = time.time()
         # Mark this as "settled".
         try:
             self._settled()
@@ -272,6 +304,7 @@ class StatusBase:
         # timeout above or by set_exception(exc), so we can set the Event that
         # will mark this Status as done.
         with self._lock:
+            self._settled_ts = time.time()
             self._event.set()
         if self._exception is not None:
             try:
@@ -343,6 +376,7 @@ class StatusBase:
                 # We have already timed out.
                 return
             self._exception = exc
+            self._finished_ts = time.time()
             self._settled_event.set()
 
         self._close_trace()
@@ -363,6 +397,8 @@ class StatusBase:
                     f"already been called on {self!r}"
                 )
             self._externally_initiated_completion = True
+            if self._finished_ts is None:
+                self._finished_ts = time.time()
         # Note that in either case, the callbacks themselves are run from the
         # same thread. This just sets an Event, either from this thread (the
         # one calling set_finished) or the thread created below.
@@ -438,7 +474,6 @@ class StatusBase:
             raise WaitTimeoutError(f"Status {self!r} has not completed yet.")
         return self._exception
 
-    @tracer.start_as_current_span(f"{_TRACE_PREFIX} wait")
     def wait(self, timeout=None):
         """
         Block until the action completes.
@@ -465,7 +500,14 @@ class StatusBase:
             indicates that the action itself raised ``TimeoutError``, distinct
             from ``WaitTimeoutError`` above.
         """
-        _set_trace_attributes(trace.get_current_span(), self._trace_attributes)
+        if self._tracing_span is None:
+            return self._wait(timeout)
+
+        with tracer.start_as_current_span(f"{_TRACE_PREFIX} wait") as span:
+            self._set_trace_attributes(span)
+            return self._wait(timeout)
+
+    def _wait(self, timeout):
         if not self._event.wait(timeout=timeout):
             raise WaitTimeoutError(f"Status {self!r} has not completed yet.")
         if self._exception is not None:
@@ -552,12 +594,86 @@ class StatusBase:
                     "method instead."
                 )
 
+    @property
+    def children(self):
+        """
+        Statuses of the sub-operations this Status is composed of.
+
+        These are linked with :meth:`add_child` and used by :meth:`timeline`.
+        """
+        return tuple(self._children)
+
+    def add_child(self, status):
+        """
+        Record ``status`` as a sub-operation of this Status.
+
+        This does not change when this Status finishes; it only links the two
+        for :meth:`timeline` and :meth:`critical_path`.
+
+        Parameters
+        ----------
+        status: StatusBase
+        """
+        with self._lock:
+            self._children = (*self._children, status)
+
+    def timeline(self):
+        """
+        The timestamps of this Status and, recursively, of its children.
+
+        Returns
+        -------
+        entries : list of TimelineEntry
+            Depth-first, starting with this Status at depth 0.
+        """
+        entries = []
+
+        def visit(status, depth):
+            entries.append(_timeline_entry(status, depth))
+            for child in getattr(status, "_children", ()):
+                visit(child, depth + 1)
+
+        visit(self, 0)
+        return entries
+
+    def critical_path(self):
+        """
+        The chain of statuses that determined when this Status completed.
+
+        Starting from this Status, repeatedly follow the child that settled
+        last (or is still pending). The last entry is the slowest leaf
+        operation: the one to optimize.
+
+        Returns
+        -------
+        entries : list of TimelineEntry
+        """
+
+        def settled_key(status):
+            # Pending statuses are slower than anything that has settled
+            return float("inf") if status._settled_ts is None else status._settled_ts
+
+        path = [_timeline_entry(self, 0)]
+        children = self._children
+        while children:
+            status = max(children, key=settled_key)
+            path.append(_timeline_entry(status, len(path)))
+            children = getattr(status, "_children", ())
+        return path
+
+    def _set_trace_attributes(self, span):
+        if span.is_recording():
+            set_span_attributes(span, self._trace_attributes)
+            span.set_attribute("object_repr", repr(self))
+
     def _update_trace_attributes(self):
-        _set_trace_attributes(self._tracing_span, self._trace_attributes)
+        if self._tracing_span is not None:
+            self._set_trace_attributes(self._tracing_span)
 
     def _close_trace(self):
-        self._update_trace_attributes()
-        self._tracing_span.end()
+        if self._tracing_span is not None:
+            self._update_trace_attributes()
+            self._tracing_span.end()
 
     def __and__(self, other):
         """
@@ -576,6 +692,7 @@ class AndStatus(StatusBase):
         self.left = left
         self.right = right
         super().__init__(**kwargs)
+        self._children = (left, right)
         self._trace_attributes["left"] = self.left._trace_attributes
         self._trace_attributes["right"] = self.right._trace_attributes
 
@@ -704,7 +821,9 @@ class DeviceStatus(StatusBase):
             if device
             else {"no_device_given": True}
         )
-        self._trace_attributes["kwargs"] = json.dumps(kwargs, default=repr)
+        self._trace_attributes["kwargs"] = LazyAttribute(
+            partial(json.dumps, kwargs, default=repr)
+        )
 
     def _handle_failure(self):
         super()._handle_failure()
@@ -991,20 +1110,21 @@ class MoveStatus(DeviceStatus):
         if not self.done:
             self.pos.subscribe(self._notify_watchers, event_type=self.pos.SUB_READBACK)
 
-        self._trace_attributes.update(
-            {
-                "target": target,
-                "start_time": start_ts,
-                "start_pos ": self.pos.position,
-                "unit": self._unit,
-                "positioner_name": self._name,
-            }
-        )
-        self._trace_attributes.update(
-            {"positioner": repr(self.pos)}
-            if self.pos
-            else {"no_positioner_given": True}
-        )
+        if self._tracing_span is not None:
+            self._trace_attributes.update(
+                {
+                    "target": target,
+                    "start_time": start_ts,
+                    "start_pos ": self.start_pos,
+                    "unit": self._unit,
+                    "positioner_name": self._name,
+                }
+            )
+            self._trace_attributes.update(
+                {"positioner": LazyAttribute(partial(repr, self.pos))}
+                if self.pos
+                else {"no_positioner_given": True}
+            )
 
     def watch(self, func):
         """
@@ -1107,9 +1227,62 @@ class MoveStatus(DeviceStatus):
     __repr__ = __str__
 
 
-def _set_trace_attributes(span, trace_attributes):
-    for k, v in trace_attributes.items():
-        span.set_attribute(k, v)
+def _timeline_entry(status, depth):
+    return TimelineEntry(
+        depth=depth,
+        status=status,
+        created=status._created_ts,
+        finished=status._finished_ts,
+        settled=status._settled_ts,
+    )
+
+
+def format_timeline(entries):
+    """
+    Format a :meth:`StatusBase.timeline` or :meth:`StatusBase.critical_path`
+    as a table.
+
+    Times are in seconds, relative to the creation of the first entry.
+
+    Parameters
+    ----------
+    entries : list of TimelineEntry
+
+    Returns
+    -------
+    table : str
+    """
+    if not entries:
+        return ""
+
+    t0 = entries[0].created
+
+    def fmt(ts):
+        return "-" if ts is None else f"{ts - t0:.3f}"
+
+    def elapsed(entry):
+        return "-" if entry.settled is None else f"{entry.settled - entry.created:.3f}"
+
+    rows = [("status", "created", "finished", "settled", "elapsed")]
+    for entry in entries:
+        rows.append(
+            (
+                "  " * entry.depth + str(entry.status),
+                fmt(entry.created),
+                fmt(entry.finished),
+                fmt(entry.settled),
+                elapsed(entry),
+            )
+        )
+
+    widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if col == 0 else cell.rjust(width)
+            for col, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    )
 
 
 def wait(status, timeout=None, *, poll_rate="DEPRECATED"):
@@ -1059,3 +1059,24 @@ def test_make_data_key(param, expected):
         external="FILESTORE:",
         dtype_numpy=expected,
     )
+
+
+def test_lazy_docstrings():
+    from ophyd import EpicsSignal
+    from ophyd.areadetector import ADComponent, cam, docs
+
+    docs.load_docs.cache_clear()
+
+    class MyCam(cam.CamBase):
+        _html_docs = ["areaDetectorDoc.html"]
+        my_acquire = ADComponent(EpicsSignal, "Acquire")
+        documented = ADComponent(EpicsSignal, "Other", doc="Documented")
+
+    # the documentation table is not read on class creation
+    assert docs.load_docs.cache_info().currsize == 0
+    assert MyCam.documented.doc == "Documented"
+    assert docs.load_docs.cache_info().currsize == 0
+
+    assert "[Acquire r/w busy]" in MyCam.my_acquire.doc
+    assert docs.load_docs.cache_info().currsize == 1
+    assert "areaDetectorDoc.html" in docs.docs
@@ -1,13 +1,16 @@
 import logging
+import threading
 from unittest.mock import Mock
 
 import numpy as np
 import pytest
 
-from ophyd import Component, Device, FormattedComponent
+from ophyd import Component, Device, FormattedComponent, Kind, get_cl
 from ophyd.device import (
     ComponentWalk,
+    DynamicDeviceComponent,
     create_device_from_components,
+    create_devices,
     do_not_wait_for_lazy_connection,
     required_for_connection,
     wait_for_lazy_connection,
@@ -18,8 +21,9 @@ from ophyd.signal import (
     ReadOnlyError,
     Signal,
     SignalRO,
+    VectorSignal,
 )
-from ophyd.utils import ExceptionBundle
+from ophyd.utils import DeviceCreationError, ExceptionBundle
 
 logger = logging.getLogger(__name__)
 
@@ -430,6 +434,645 @@ def test_sub_decorator():
     assert len(MyDevice.multi._subscriptions) == 3
 
 
+def test_read_plans():
+    class Sub(Device):
+        a = Component(Signal, value=1)
+        b = Component(Signal, value=2, kind="config")
+
+    class CustomRead(Device):
+        c = Component(Signal, value=3)
+
+        def read(self):
+            res = super().read()
+            res["extra"] = {"value": 0, "timestamp": 0}
+            return res
+
+    class Top(Device):
+        sub = Component(Sub, "")
+        custom = Component(CustomRead, "")
+        d = Component(Signal, value=4, kind="hinted")
+
+    top = Top(name="top")
+    # sub-devices using the default read are flattened into leaf signals,
+    # others are read through their own read()
+    assert top._get_read_plan("read") == (top.sub.a, top.custom, top.d)
+    assert top._get_read_plan("read_configuration") == (top.sub.b,)
+    assert list(top.read()) == ["top_sub_a", "top_custom_c", "extra", "top_d"]
+    assert list(top.describe()) == ["top_sub_a", "top_custom_c", "top_d"]
+    assert top.hints == {"fields": ["top_d"]}
+
+    plan = top._get_read_plan("read")
+    assert top._get_read_plan("read") is plan
+    # creating other objects, or setting a kind to its current value, does
+    # not invalidate it
+    Top(name="other")
+    top.d.kind = "hinted"
+    assert top._get_read_plan("read") is plan
+
+    # kind changes anywhere below invalidate the plan
+    top.sub.b.kind = Kind.normal | Kind.config
+    assert "top_sub_b" in top.read()
+    top.sub.read_attrs = []
+    assert "top_sub_a" not in top.read()
+    top.read_attrs = ["d"]
+    assert list(top.read()) == ["top_d"]
+    assert list(top.read_configuration()) == ["top_sub_b"]
+
+
+def test_parallel_reads():
+    # Each read waits for all three to be in progress, so the read only
+    # completes if they are made concurrently
+    barrier = threading.Barrier(3, timeout=5)
+    threads = []
+
+    class SlowSignal(Signal):
+        _read_needs_request = True
+
+        def get(self, **kwargs):
+            threads.append(threading.current_thread())
+            if barrier is not None:
+                barrier.wait()
+            return super().get(**kwargs)
+
+    class FailingSignal(SlowSignal):
+        def get(self, **kwargs):
+            raise ValueError("failed")
+
+    class Dev(Device):
+        a = Component(SlowSignal, value=1)
+        b = Component(Signal, value=2)
+        c = Component(SlowSignal, value=3, kind="config")
+        d = Component(SlowSignal, value=4)
+        e = Component(SlowSignal, value=5, kind="config")
+        f = Component(SlowSignal, value=6)
+
+    dev = Dev(name="dev")
+    dev.parallel_reads = True
+    reading = dev.read()
+    # order and content match a sequential read
+    assert list(reading) == ["dev_a", "dev_b", "dev_d", "dev_f"]
+    assert [r["value"] for r in reading.values()] == [1, 2, 4, 6]
+    # made by worker threads of the control layer
+    assert len(threads) == 3
+    assert all(isinstance(th, get_cl().thread_class) for th in threads)
+    assert threading.current_thread() not in threads
+
+    barrier = None
+    threads.clear()
+    assert list(dev.read_configuration()) == ["dev_c", "dev_e"]
+    assert threading.current_thread() not in threads
+
+    # sequential by default
+    dev.parallel_reads = False
+    threads.clear()
+    dev.read()
+    assert threads == [threading.current_thread()] * 3
+
+    class FailingDev(Device):
+        a = Component(SlowSignal, value=1)
+        b = Component(FailingSignal, value=2)
+
+    failing = FailingDev(name="dev")
+    failing.parallel_reads = True
+    with pytest.raises(ValueError):
+        failing.read()
+
+
+def test_parallel_staging():
+    events = []
+    # Puts of signals in the same barrier wait for each other, so staging
+    # only completes if they are made at the same time
+    barriers = {}
+
+    class SlowSignal(Signal):
+        def put(self, value, **kwargs):
+            events.append(("start", self.dotted_name, value))
+            barrier = barriers.get(self.attr_name)
+            if barrier is not None:
+                barrier.wait()
+            super().put(value, **kwargs)
+            events.append(("end", self.dotted_name, value))
+
+    class Sub(Device):
+        x = Component(SlowSignal, value=0)
+
+        def stage(self):
+            self.stage_sigs["x"] = 1
+            threads.append(threading.current_thread())
+            return super().stage()
+
+    class Dev(Device):
+        acquire = Component(SlowSignal, value=1)
+        a = Component(SlowSignal, value=0)
+        b = Component(SlowSignal, value=0)
+        sub1 = Component(Sub, "")
+        sub2 = Component(Sub, "")
+
+    threads = []
+    dev = Dev(name="dev")
+    dev.parallel_staging = True
+    dev.stage_order = ["acquire"]
+    dev.stage_sigs.update([("a", 1), ("b", 1), ("acquire", 0)])
+
+    ab = threading.Barrier(2, timeout=5)
+    barriers.update(a=ab, b=ab, x=threading.Barrier(2, timeout=5))
+    staged = dev.stage()
+    assert staged == [dev, dev.sub1, dev.sub2]
+    # acquire, then a and b together, then both sub-devices together
+    assert events[:2] == [("start", "acquire", 0), ("end", "acquire", 0)]
+    assert sorted(events[2:4]) == [("start", "a", 1), ("start", "b", 1)]
+    assert sorted(events[4:6]) == [("end", "a", 1), ("end", "b", 1)]
+    assert sorted(events[6:8]) == [("start", "sub1.x", 1), ("start", "sub2.x", 1)]
+    assert [sig.get() for sig in (dev.a, dev.b, dev.sub1.x, dev.sub2.x)] == [1] * 4
+    # each sub-device is staged in a control layer thread
+    assert len(set(threads)) == 2
+    assert all(isinstance(th, get_cl().thread_class) for th in threads)
+
+    barriers.clear()
+    events.clear()
+    assert dev.unstage() == [dev.sub1, dev.sub2, dev]
+    assert (dev.acquire.get(), dev.a.get(), dev.b.get()) == (1, 0, 0)
+    # unstaged in reverse order: acquire is restored last
+    assert events[-2:] == [("start", "acquire", 1), ("end", "acquire", 1)]
+
+
+def test_parallel_staging_rollback():
+    class FailingSignal(Signal):
+        def put(self, value, **kwargs):
+            if value == "fail":
+                raise ValueError("failed")
+            super().put(value, **kwargs)
+
+    class Dev(Device):
+        a = Component(Signal, value=0)
+        b = Component(FailingSignal, value=0)
+
+    dev = Dev(name="dev")
+    dev.parallel_staging = True
+    dev.stage_sigs.update([("a", 1), ("b", "fail")])
+    with pytest.raises(ValueError):
+        dev.stage()
+    # the successful setting was rolled back
+    assert dev.a.get() == 0
+    assert not dev._original_vals
+
+
+@pytest.mark.parametrize("skip", [True, False])
+def test_skip_redundant_sets(skip):
+    puts = []
+
+    class CountingSignal(Signal):
+        def put(self, value, **kwargs):
+            puts.append((self.attr_name, value))
+            super().put(value, **kwargs)
+
+    class Dev(Device):
+        a = Component(CountingSignal, value=1.0, tolerance=0.01)
+        b = Component(CountingSignal, value=0)
+        c = Component(CountingSignal, value="x", kind="config")
+
+    dev = Dev(name="dev")
+    dev.skip_redundant_sets = skip
+    dev.stage_sigs.update([("a", 1.001), ("b", 1)])
+    dev.stage()
+    # a is restored, even though it was not set, if it changed in between
+    dev.a.put(2.0)
+    puts.clear()
+    dev.unstage()
+    assert dev.a.get() == 1.0
+    assert dev.b.get() == 0
+    assert puts == [("b", 0), ("a", 1.0)]
+
+    puts.clear()
+    dev.stage()
+    dev.unstage()
+    dev.configure({"c": "x"})
+    if skip:
+        assert puts == [("b", 1), ("b", 0)]
+    else:
+        assert puts == [("a", 1.001), ("b", 1), ("b", 0), ("a", 1.0), ("c", "x")]
+
+
+def test_snapshot_restore():
+    puts = []
+    threads = []
+
+    class CountingSignal(Signal):
+        def put(self, value, **kwargs):
+            puts.append((self.dotted_name, value))
+            threads.append(threading.current_thread())
+            super().put(value, **kwargs)
+
+    class Sub(Device):
+        gain = Component(CountingSignal, value=1, kind="config")
+        offsets = Component(CountingSignal, value=np.zeros(3), kind="config")
+        data = Component(CountingSignal, value=0)
+
+    class Dev(Device):
+        mode = Component(CountingSignal, value="a", kind="config")
+        fixed = Component(SignalRO, value=5, kind="config")
+        sub = Component(Sub, "")
+
+    dev = Dev(name="dev")
+    dev.sub.kind = "config"
+    snapshot = dev.snapshot()
+    assert snapshot == {
+        "mode": "a",
+        "sub.gain": 1,
+        "sub.offsets": [0.0, 0.0, 0.0],
+    }
+
+    dev.mode.put("b")
+    dev.sub.offsets.put(np.ones(3))
+    dev.sub.data.put(10)
+    puts.clear()
+    threads.clear()
+
+    status = dev.restore(snapshot, order=["sub.offsets"])
+    status.wait(timeout=5)
+    # only the values that changed are set, in the requested order
+    assert puts == [("sub.offsets", [0.0, 0.0, 0.0]), ("mode", "a")]
+    assert dev.mode.get() == "a"
+    assert dev.sub.data.get() == 10
+    assert len(status.children) == 2
+    # written from a control layer thread
+    assert threading.current_thread() not in threads
+    assert all(isinstance(th, get_cl().thread_class) for th in threads)
+
+    with pytest.raises(KeyError):
+        dev.restore({"missing": 1})
+
+
+def test_describe_cache():
+    class Sub(Device):
+        a = Component(Signal, value=1)
+        b = Component(Signal, value=2.0, kind="config")
+
+    class Dev(Device):
+        sub = Component(Sub, "")
+        c = Component(Signal, value="c")
+
+    dev = Dev(name="dev")
+    desc = dev.describe()
+    cached = dev._describe_cache["describe"]
+    assert dev.describe() == desc
+    assert dev._describe_cache["describe"] is cached
+
+    dev.c.put("d")
+    assert dev._describe_cache["describe"] is cached
+    dev.c.put(3)
+    assert dev.describe()["dev_c"]["dtype"] == "integer"
+    assert dev._describe_cache["describe"] is not cached
+
+    assert list(dev.describe_configuration()) == ["dev_sub_b"]
+    dev.sub.a.kind = Kind.normal | Kind.config
+    assert list(dev.describe_configuration()) == ["dev_sub_a", "dev_sub_b"]
+
+    # changing a returned description does not change the cache
+    arr = Dev(name="arr")
+    arr.c.put(np.zeros(3))
+    desc = arr.describe()
+    desc["arr_c"]["shape"].append(10)
+    assert arr.describe()["arr_c"]["shape"] == [3]
+    assert arr.c.describe()["arr_c"]["shape"] == [3]
+    sig_desc = arr.c.describe()
+    sig_desc["arr_c"]["shape"][0] = 4
+    assert arr.c.describe()["arr_c"]["shape"] == [3]
+
+
+def test_cached_read_configuration():
+    reads = []
+
+    class CountingSignal(Signal):
+        def read(self):
+            reads.append(self.name)
+            return super().read()
+
+    class Dev(Device):
+        a = Component(CountingSignal, value=1, kind="config")
+        b = Component(CountingSignal, value=np.zeros(2), kind="config")
+        c = Component(CountingSignal, value=0)
+        cache_configuration = True
+
+    dev = Dev(name="dev")
+    first = dev.read_configuration()
+    assert list(first) == ["dev_a", "dev_b"]
+    assert dev.configuration_changed_keys == {"dev_a", "dev_b"}
+    assert sorted(reads) == ["dev_a", "dev_b"]
+
+    reads.clear()
+    assert dev.read_configuration() == first
+    assert reads == []
+    assert dev.configuration_changed_keys == frozenset()
+
+    # a put of the same value is re-read, but not reported as a change
+    dev.a.put(1)
+    dev.b.put(np.ones(2))
+    reading = dev.read_configuration()
+    assert sorted(reads) == ["dev_a", "dev_b"]
+    assert dev.configuration_changed_keys == {"dev_b"}
+    assert list(reading["dev_b"]["value"]) == [1.0, 1.0]
+
+    # the returned dictionaries are copies
+    reading["dev_a"]["value"] = 10
+    assert dev.read_configuration()["dev_a"]["value"] == 1
+
+    dev.c.kind = Kind.normal | Kind.config
+    assert list(dev.read_configuration()) == ["dev_a", "dev_b", "dev_c"]
+    assert dev.configuration_changed_keys == {"dev_c"}
+
+
+def test_component_index():
+    class Sub(Device):
+        a = Component(Signal, value=1)
+        lazy = Component(Signal, value=2, lazy=True)
+
+    class Dev(Device):
+        sub = Component(Sub, "")
+        b = Component(Signal, value=3)
+
+    dev = Dev(name="dev")
+    names = [walk.dotted_name for walk in dev.walk_signals()]
+    assert names == ["sub.a", "b"]
+    index = dev._get_index("signals")
+    assert dev._get_index("signals") is index
+    assert dev._get_index("names")["sub.a"] is dev.sub.a
+    assert getattr(dev, "sub.a") is dev.sub.a
+
+    # instantiating a lazy component below the device updates its index, in
+    # component order
+    assert getattr(dev, "sub.lazy").get() == 2
+    assert dev._get_index("signals") is not index
+    names = [walk.dotted_name for walk in dev.walk_signals()]
+    assert names == ["sub.a", "sub.lazy", "b"]
+    assert [walk.ancestors for walk in dev.walk_signals()][1] == (dev, dev.sub)
+    assert list(dev.get_instantiated_signals()) == [
+        ("dev.sub.a", dev.sub.a),
+        ("dev.sub.lazy", dev.sub.lazy),
+        ("dev.b", dev.b),
+    ]
+    assert list(dev.walk_subdevices()) == [("sub", dev.sub)]
+    assert dev.connected
+
+
+def test_concurrent_lazy_instantiation():
+    created = []
+    destroyed = []
+    barrier = threading.Barrier(4)
+
+    class SlowSignal(Signal):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+            barrier.wait(timeout=5)
+
+        def destroy(self):
+            destroyed.append(self)
+            super().destroy()
+
+    class Dev(Device):
+        a = Component(SlowSignal, value=0, lazy=True)
+        b = Component(SlowSignal, value=0, lazy=True)
+
+    dev = Dev(name="dev")
+    results = []
+
+    def access(attr):
+        results.append((attr, getattr(dev, attr)))
+
+    # all four creations run at once; the barrier would time out otherwise
+    threads = [threading.Thread(target=access, args=(attr,)) for attr in "aabb"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 4
+    assert all(sig is getattr(dev, attr) for attr, sig in results)
+    # the losing instance of each component is discarded
+    assert len(destroyed) == 2
+    assert dev.a not in destroyed and dev.b not in destroyed
+
+
+def test_memory_usage():
+    from ophyd.flyers import MonitorFlyerMixin
+
+    class Sub(Device):
+        image = Component(Signal, value=np.zeros(1000))
+        lazy = Component(Signal, value=0, lazy=True)
+
+    class Dev(MonitorFlyerMixin, Device):
+        sub = Component(Sub, "")
+        b = Component(Signal, value=0.0)
+
+    dev = Dev(name="dev", monitor_attrs=["b"])
+    dev.sub.image.subscribe(lambda **kwargs: None)
+    image = np.ones(1000)
+    dev.sub.image.put(image)
+    dev.sub.image.put(image)
+    dev.kickoff()
+    for i in range(10):
+        dev.b.put(np.full(100, i))
+
+    usage = {row.name: row for row in dev.memory_usage()}
+    assert set(usage) == {"dev", "dev_sub", "dev_sub_image", "dev_b"}
+    image = usage["dev_sub_image"]
+    assert image.kind == "signal"
+    # the readback, value and old_value are one array, counted once
+    assert image.readback == 8000
+    assert image.replay == 0
+    assert image.total == 8000
+    assert image.subscriptions == 1
+    # the last two collected arrays are the readback and in the replay cache
+    assert usage["dev_b"].buffers > 6400
+    assert usage["dev_b"].total > 8000
+    assert usage["dev_sub"].total == image.total
+    assert usage["dev"].total >= usage["dev_sub"].total + usage["dev_b"].total
+    assert list(usage)[0] == "dev"
+
+    report = dev.memory_report(limit=2).splitlines()
+    assert len(report) == 4
+    assert report[2].startswith("dev ")
+    assert report[3].startswith("dev_b ")
+
+
+def test_vector_component():
+    from ophyd import VectorComponent
+
+    class Channel(Signal):
+        def __init__(self, read_pv, **kwargs):
+            self.read_pv = read_pv
+            super().__init__(value=0, **kwargs)
+
+    class Scaler(Device):
+        counts = VectorComponent(
+            Channel, ".S{channel}", range(1, 4), channel_names=["a", "b", "c"]
+        )
+
+    scaler = Scaler("XF:SC", name="sc")
+    counts = scaler.counts
+    assert [ch.read_pv for ch in counts.channels] == [
+        "XF:SC.S1",
+        "XF:SC.S2",
+        "XF:SC.S3",
+    ]
+    assert [ch.name for ch in counts.channels] == [
+        "sc_counts_a",
+        "sc_counts_b",
+        "sc_counts_c",
+    ]
+    assert counts.parent is scaler
+
+    for value, channel in enumerate(counts.channels):
+        channel.put(value + 1)
+    reading = scaler.read()
+    assert list(reading) == ["sc_counts"]
+    np.testing.assert_array_equal(reading["sc_counts"]["value"], [1, 2, 3])
+    desc = scaler.describe()["sc_counts"]
+    assert desc["shape"] == [3]
+    assert desc["dtype"] == "array"
+    assert desc["channel_names"] == ["a", "b", "c"]
+
+    with pytest.raises(ReadOnlyError):
+        counts.put([0, 0, 0])
+
+    values = []
+    counts.subscribe(lambda value, **kwargs: values.append(value), run=False)
+    counts.channels[1].put(20)
+    np.testing.assert_array_equal(values[-1], [1, 20, 3])
+    np.testing.assert_array_equal(counts.get(), [1, 20, 3])
+
+
+def test_vector_signal_concurrent_get():
+    # Each channel read waits for all three to be in progress, so the get
+    # only completes if they are made concurrently
+    barrier = threading.Barrier(3, timeout=5)
+    threads = []
+
+    class SlowChannel(Signal):
+        _read_needs_request = True
+
+        def get(self, **kwargs):
+            threads.append(threading.current_thread())
+            barrier.wait()
+            return super().get(**kwargs)
+
+    channels = [SlowChannel(name=f"ch{i}", value=i) for i in range(3)]
+    vector = VectorSignal(channels, name="vector")
+    vector.parallel_reads = True
+    np.testing.assert_array_equal(vector.get(), [0, 1, 2])
+    assert len(threads) == 3
+    assert all(isinstance(th, get_cl().thread_class) for th in threads)
+    assert threading.current_thread() not in threads
+
+    # sequential by default
+    barrier = threading.Barrier(1)
+    threads.clear()
+    vector.parallel_reads = False
+    np.testing.assert_array_equal(vector.get(), [0, 1, 2])
+    assert threads == [threading.current_thread()] * 3
+
+
+def test_read_structured():
+    class Custom(Device):
+        c = Component(Signal, value=3)
+
+        def read(self):
+            return {"custom": {"value": 5, "timestamp": 1.0}}
+
+        def describe(self):
+            return {"custom": {"source": "", "dtype": "integer", "shape": []}}
+
+    class Dev(Device):
+        a = Component(Signal, value=1.5)
+        b = Component(Signal, value=np.arange(3), dtype="int32", shape=(3,))
+        s = Component(Signal, value="text")
+        custom = Component(Custom, "")
+
+    dev = Dev(name="dev")
+    value_dtype, timestamp_dtype = dev.structured_dtype()
+    assert value_dtype.names == ("dev_a", "dev_b", "dev_s", "custom")
+    assert value_dtype["dev_a"] == np.float64
+    assert value_dtype["dev_b"] == np.dtype(("int32", (3,)))
+    assert value_dtype["dev_s"] == object
+    assert dev.structured_dtype()[0] is value_dtype
+
+    values, timestamps = dev.read_structured()
+    reading = dev.read()
+    assert set(reading) == set(value_dtype.names)
+    for key, item in reading.items():
+        np.testing.assert_array_equal(values[key], item["value"])
+        assert timestamps[key] == item["timestamp"]
+
+    storage = np.zeros(3, dtype=value_dtype), np.zeros(3, dtype=timestamp_dtype)
+    for i in range(3):
+        dev.a.put(float(i))
+        dev.read_structured(out=storage, index=i)
+    np.testing.assert_array_equal(storage[0]["dev_a"], [0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(storage[0]["custom"], [5, 5, 5])
+    assert storage[1]["dev_a"][2] == dev.a.timestamp
+
+    # a change of kind changes the fields
+    dev.s.kind = Kind.omitted
+    assert dev.structured_dtype()[0].names == ("dev_a", "dev_b", "custom")
+
+    # as does a change of shape
+    describes = []
+
+    class Waveform(Device):
+        wf = Component(Signal, value=np.arange(3), dtype="int64")
+        x = Component(Signal, value=1.0)
+
+        def describe(self):
+            describes.append(self.name)
+            return super().describe()
+
+    dev = Waveform(name="dev")
+    assert dev.structured_dtype()[0]["dev_wf"].shape == (3,)
+    for i in range(3):
+        dev.x.put(float(i))
+        dev.read_structured()
+    # described only once, for the first
+    assert len(describes) == 1
+
+    dev.wf.put(np.arange(5))
+    values, _ = dev.read_structured()
+    np.testing.assert_array_equal(values["dev_wf"], np.arange(5))
+    assert len(describes) == 2
+
+
+def test_skip_redundant_sets_setpoint():
+    puts = []
+
+    class CountingSignal(Signal):
+        def put(self, value, **kwargs):
+            puts.append((self.attr_name, value))
+            super().put(value, **kwargs)
+
+    class SetpointSignal(CountingSignal):
+        "Readback and setpoint from different PVs"
+        pvname = "RBV"
+        setpoint_pvname = "SP"
+
+        def get_setpoint(self):
+            return self._setpoint
+
+    class Dev(Device):
+        sp = Component(SetpointSignal, value=0)
+        acquire = Component(CountingSignal, value=1)
+
+    dev = Dev(name="dev")
+    assert not dev.skip_redundant_sets
+    dev.skip_redundant_sets = True
+    dev.acquire.always_set = True
+    # the readback already has the value, but not the setpoint
+    dev.sp._setpoint = 5
+    dev.stage_sigs.update([("sp", 0), ("acquire", 1)])
+    dev.stage()
+    assert puts == [("sp", 0), ("acquire", 1)]
+    dev.unstage()
+
+
 def test_walk_components():
     class SubSubDevice(Device):
         cpt4 = Component(FakeSignal, "4")
@@ -853,6 +1496,65 @@ def test_required_for_connection_on_method():
     dev.wait_for_connection(timeout=0.01)
 
 
+def test_create_devices():
+    class Channel(Device):
+        val = Component(Signal, value=5)
+
+    class Channels(Device):
+        chans = DynamicDeviceComponent(
+            {f"ch{i}": (Channel, f"CH{i}:", {}) for i in range(20)}
+        )
+
+    class Pending(Device):
+        @required_for_connection
+        def method(self):
+            ...
+
+    threads = set()
+
+    class Channels(Channels):
+        def __init__(self, *args, **kwargs):
+            threads.add(threading.current_thread())
+            super().__init__(*args, **kwargs)
+
+    specs = {f"dev{i}": (Channels, f"PREFIX{i}:") for i in range(10)}
+    specs["kw"] = (Channels, "", {"kind": "config"})
+    devices = create_devices(specs, max_workers=4)
+    assert list(devices) == list(specs)
+    assert devices["dev3"].prefix == "PREFIX3:"
+    assert devices["dev3"].chans.ch5.prefix == "PREFIX3:CH5:"
+    assert devices["dev3"].chans.ch5.val.get() == 5
+    assert devices["kw"].kind == Kind.config
+    # created in control layer threads
+    assert 1 <= len(threads) <= 4
+    assert all(isinstance(th, get_cl().thread_class) for th in threads)
+    assert threading.current_thread() not in threads
+    # and the workers then exit
+    for th in threads:
+        th.join(timeout=5)
+        assert not th.is_alive()
+
+    with pytest.raises(DeviceCreationError, match="bad") as cm:
+        create_devices({"ok": (Channels, ""), "bad": (Channels, None)})
+    assert list(cm.value.exceptions) == ["bad"]
+    assert isinstance(cm.value.exceptions["bad"], ValueError)
+    assert list(cm.value.devices) == ["ok"]
+
+    # all devices are waited on, until one deadline
+    with pytest.raises(TimeoutError, match="pending1.*pending2"):
+        create_devices(
+            {
+                "ok": (Channels, ""),
+                "pending1": (Pending, ""),
+                "pending2": (Pending, ""),
+            },
+            timeout=0.1,
+        )
+
+    devices = create_devices({"pending": (Pending, "")}, wait=False)
+    assert not devices["pending"].connected
+
+
 def test_required_for_connection_in_init():
     class MyDevice(Device):
         def __init__(self, **kwargs):
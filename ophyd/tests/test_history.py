@@ -0,0 +1,78 @@
+import logging
+
+import numpy as np
+import pytest
+
+from ophyd import Signal
+from ophyd.history import SignalHistory
+
+
+def test_ring_buffer():
+    history = SignalHistory(4)
+    timestamps, values = history.get()
+    assert len(timestamps) == len(values) == 0
+    assert np.isnan(history.mean())
+
+    for i in range(6):
+        history.append(100.0 + i, 2.0 * i)
+    assert len(history) == 4
+    assert history.total_count == 6
+    timestamps, values = history.get()
+    assert list(timestamps) == [102.0, 103.0, 104.0, 105.0]
+    assert list(values) == [4.0, 6.0, 8.0, 10.0]
+
+    timestamps, values = history.time_range(103.0, 104.5)
+    assert list(values) == [6.0, 8.0]
+    assert list(history.time_range(stop=102.0)[1]) == [4.0]
+
+    stats = history.stats()
+    assert stats["count"] == 4
+    assert stats["mean"] == 7.0
+    assert stats["min"] == 4.0
+    assert stats["max"] == 10.0
+    assert stats["std"] == pytest.approx(np.std([4, 6, 8, 10]))
+    assert history.rate() == pytest.approx(2.0)
+
+    history.clear()
+    assert len(history) == 0
+
+    with pytest.raises(ValueError):
+        SignalHistory(0)
+
+
+def test_array_history():
+    history = SignalHistory(3, shape=(2,))
+    history.append(1.0, [1, 10])
+    history.append(2.0, [2, 30])
+    np.testing.assert_allclose(history.mean(), [1.5, 20])
+    np.testing.assert_allclose(history.rate(), [1, 20])
+
+
+def test_signal_history(caplog):
+    sig = Signal(name="sig", value=1.0)
+    assert sig.history is None
+    history = sig.enable_history(10)
+    assert sig.history is history
+
+    seen = []
+    sig.subscribe(lambda **kwargs: seen.append(len(history)), run=False)
+    sig.put(2.0)
+    sig.put(3.0)
+    # filled in before the subscriptions run
+    assert seen == [2, 3]
+    assert list(history.get()[1]) == [1.0, 2.0, 3.0]
+    assert history.get()[0][-1] == sig.timestamp
+    assert history.last(window=60)[1][-1] == 3.0
+
+    # values which do not fit are skipped, with one warning
+    sig.put("text")
+    sig.put("more text")
+    assert len(history) == 3
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert [r.getMessage() for r in warnings] == [
+        "Value 'text' not added to the history"
+    ]
+
+    sig.disable_history()
+    sig.put(4.0)
+    assert len(history) == 3
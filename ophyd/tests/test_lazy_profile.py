@@ -0,0 +1,82 @@
+import pytest
+
+from ophyd import Component, Device, Signal, lazy_profile
+from ophyd.lazy_profile import (
+    load_lazy_profile,
+    prefetch_lazy_components,
+    record_lazy_components,
+)
+
+
+class Sub(Device):
+    eager = Component(Signal, value=0)
+    lazy = Component(Signal, value=1, lazy=True)
+
+
+class Dev(Device):
+    sub = Component(Sub, "", lazy=True)
+    unused = Component(Signal, value=2, lazy=True)
+    top = Component(Signal, value=3, lazy=True)
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    recorder = record_lazy_components(
+        str(tmp_path / "profile.json"), save_at_exit=False
+    )
+    yield recorder
+    recorder.stop()
+
+
+def test_record_and_prefetch(recorder):
+    dev = Dev(name="dev")
+    dev.top.get()
+    dev.sub.lazy.get()
+    other = Dev(name="other")
+    other.sub.eager.get()
+    assert recorder.profile == {
+        "dev": ["top", "sub", "sub.lazy"],
+        "other": ["sub"],
+    }
+
+    recorder.save()
+    profile = load_lazy_profile(recorder.path)
+    assert profile == recorder.profile
+
+    dev = Dev(name="dev")
+    assert "sub" not in dev._signals
+    status = prefetch_lazy_components([dev], recorder.path)
+    status.wait(timeout=5)
+    assert set(dev._signals) == {"top", "sub"}
+    assert "lazy" in dev.sub._signals
+    assert "unused" not in dev._signals
+    # prefetched components are not recorded as used
+    assert recorder.profile["dev"] == ["top", "sub", "sub.lazy"]
+
+
+def test_prefetch_failure_is_logged(caplog):
+    dev = Dev(name="dev")
+    status = prefetch_lazy_components([dev], {"dev": ["missing", "top"]})
+    status.wait(timeout=5)
+    assert "top" in dev._signals
+    assert "dev.missing" in caplog.text
+
+
+def test_stopped_recorder_does_not_save_at_exit(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(lazy_profile.atexit, "register", registered.append)
+    monkeypatch.setattr(lazy_profile.atexit, "unregister", registered.remove)
+
+    first = record_lazy_components(str(tmp_path / "first.json"))
+    assert registered == [first.save]
+    # replacing a recorder stops it
+    second = record_lazy_components(str(tmp_path / "second.json"))
+    assert registered == [second.save]
+    second.stop()
+    assert registered == []
+
+
+def test_prefetch_error_finishes_status():
+    status = prefetch_lazy_components([Dev(name="dev")], {"dev": None})
+    with pytest.raises(TypeError):
+        status.wait(timeout=5)
@@ -7,3 +7,42 @@ from ophyd import __version__
 def test_cli_version():
     cmd = [sys.executable, "-m", "ophyd", "--version"]
     assert subprocess.check_output(cmd).decode().strip() == __version__
+
+
+def test_import_is_lazy():
+    # Guard against regressions in ``import ophyd`` time: neither the control
+    # layer nor the larger subsystems should be imported until they are used
+    code = """
+import sys
+import ophyd
+assert not hasattr(ophyd, "foo")
+print(" ".join(sys.modules))
+"""
+    modules = set(subprocess.check_output([sys.executable, "-c", code]).split())
+    for module in (
+        "epics",
+        "caproto",
+        "networkx",
+        "ophyd.areadetector",
+        "ophyd.epics_motor",
+        "ophyd.quadem",
+        "ophyd.scaler",
+    ):
+        assert module.encode() not in modules
+
+    code = "import ophyd; print(ophyd.EpicsScaler.__module__, ophyd.SimDetector)"
+    assert subprocess.check_output([sys.executable, "-c", code]).split() == [
+        b"ophyd.scaler",
+        b"<class",
+        b"'ophyd.areadetector.detectors.SimDetector'>",
+    ]
+
+
+def test_lazy_areadetector_names():
+    import ophyd
+    import ophyd.areadetector
+
+    for name in ophyd._LAZY_ATTRS:
+        if hasattr(ophyd.areadetector, name):
+            assert getattr(ophyd, name) is getattr(ophyd.areadetector, name)
+    assert "SimDetector" in dir(ophyd)
@@ -1,11 +1,14 @@
 import logging
+import threading
 import time
 from unittest.mock import Mock
 
 import pytest
 
+from ophyd._dispatch import EventDispatcher
 from ophyd.ophydobj import (
     OphydObject,
+    _SubscriptionFilter,
     register_instances_in_weakset,
     register_instances_keyed_on_name,
 )
@@ -165,6 +168,128 @@ def test_unsubscribe_all():
     assert hit == 1
 
 
+def test_subscribe_deadband():
+    class TestObj(OphydObject):
+        SUB_TEST = "value"
+
+    test_obj = TestObj(name="name", parent=None)
+    values = []
+
+    def cb(value, **kwargs):
+        values.append(value)
+
+    test_obj.subscribe(cb, "value", deadband=0.5)
+    for value in (1.0, 1.2, 1.5, 1.6, 1.3, 0.9):
+        test_obj._run_subs(sub_type="value", value=value)
+    assert values == [1.0, 1.6, 0.9]
+
+    rel_values = []
+    test_obj.subscribe(
+        lambda value, **kwargs: rel_values.append(value),
+        "value",
+        rel_deadband=0.1,
+        run=False,
+    )
+    for value in (100, 105, 111, 122, 123):
+        test_obj._run_subs(sub_type="value", value=value)
+    assert rel_values == [100, 111, 123]
+
+    with pytest.raises(ValueError):
+        test_obj.subscribe(cb, "value", deadband=-1)
+
+
+class FakeClock:
+    "Drives the rate limit of subscription filters without sleeping"
+
+    def __init__(self, monkeypatch):
+        self.now = 0.0
+        self.scheduled = []
+        monkeypatch.setattr(_SubscriptionFilter, "_clock", staticmethod(self.time))
+        monkeypatch.setattr(
+            _SubscriptionFilter,
+            "_call_later",
+            lambda sub_filter, delay, token: self.call_later(sub_filter, delay, token),
+        )
+
+    def time(self):
+        return self.now
+
+    def call_later(self, sub_filter, delay, token):
+        self.scheduled.append((self.now + delay, sub_filter._flush, token))
+
+    def advance(self, seconds):
+        self.now += seconds
+        due = [entry for entry in self.scheduled if entry[0] <= self.now]
+        self.scheduled = [entry for entry in self.scheduled if entry[0] > self.now]
+        for _, flush, token in due:
+            flush(token)
+
+
+def test_subscribe_max_rate(monkeypatch):
+    class TestObj(OphydObject):
+        SUB_TEST = "value"
+
+    clock = FakeClock(monkeypatch)
+    test_obj = TestObj(name="name", parent=None)
+    values = []
+
+    def cb(value, **kwargs):
+        values.append(value)
+
+    cid = test_obj.subscribe(cb, "value", max_rate=2)
+    for value in range(10):
+        test_obj._run_subs(sub_type="value", value=value)
+        clock.advance(0.01)
+    assert values == [0]
+    # one delivery is scheduled, however many events are held back
+    assert len(clock.scheduled) == 1
+
+    # the final value is delivered once the rate allows it
+    clock.advance(0.3)
+    assert values == [0]
+    clock.advance(0.2)
+    assert values == [0, 9]
+
+    # pending values are dropped on unsubscribe
+    clock.advance(0.1)
+    test_obj._run_subs(sub_type="value", value=10)
+    test_obj._run_subs(sub_type="value", value=11)
+    test_obj.unsubscribe(cid)
+    clock.advance(1)
+    assert values == [0, 9]
+
+    with pytest.raises(ValueError):
+        test_obj.subscribe(cb, "value", max_rate=0)
+
+
+def test_subscribe_max_rate_dispatcher_thread():
+    class TestObj(OphydObject):
+        SUB_TEST = "value"
+
+    dispatcher = EventDispatcher(context=None, logger=logger, utility_threads=0)
+    try:
+        monitor = dispatcher.threads["monitor"]
+        test_obj = TestObj(name="name", parent=None)
+        delivered = []
+        done = threading.Event()
+
+        def cb(value, **kwargs):
+            delivered.append((value, threading.current_thread()))
+            if value == 2:
+                done.set()
+
+        test_obj.subscribe(cb, "value", max_rate=10)
+        for value in range(3):
+            monitor.queue.put(
+                (test_obj._run_subs, (), dict(sub_type="value", value=value))
+            )
+        assert done.wait(5)
+        # the held-back value is delivered on the thread the events ran on
+        assert delivered == [(0, monitor), (2, monitor)]
+    finally:
+        dispatcher.stop()
+
+
 def test_subscribe_warn(recwarn):
     class TestObj(OphydObject):
         SUB_TEST = "value"
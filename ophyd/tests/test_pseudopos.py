@@ -484,3 +484,35 @@ def test_pseudo_hints(hw):
         getattr(pos, "pseudo{}".format(j)).readback.name for j in (1, 2, 3)
     ]
     assert pos.hints["fields"] == expected_fields
+
+
+def test_real_statuses_are_children(hw):
+    pos = hw.pseudo1x3
+
+    status = pos.set((0.3,))
+    status.wait(5)
+
+    assert len(status.children) == len(pos._real)
+    timeline = status.timeline()
+    assert [entry.depth for entry in timeline] == [0, 1, 1, 1]
+    assert all(entry.settled is not None for entry in timeline)
+
+    path = status.critical_path()
+    assert path[0].status is status
+    assert path[-1].status in status.children
+
+    # a finished move is not kept, nor given later real motions
+    assert pos._move_status is None
+    pos._real[0].move(0.1, wait=True)
+    assert len(status.children) == len(pos._real)
+
+
+def test_move_overrides_forwarding_kwargs(hw):
+    class Forwarding(hw.pseudo1x3.__class__):
+        def _concurrent_move(self, real_pos, **kwargs):
+            for real, value in zip(self._real, real_pos):
+                real.move(value, wait=False, **kwargs)
+            self._done_moving(success=True)
+
+    pos = Forwarding(name="forwarding", concurrent=True)
+    pos.move((0.3,), wait=True, timeout=5)
@@ -9,6 +9,7 @@ import pytest
 
 from ophyd import get_cl
 from ophyd.areadetector.paths import EpicsPathSignal
+from ophyd.ophydobj import UnknownSubscription
 from ophyd.signal import (
     DerivedSignal,
     EpicsSignal,
@@ -17,6 +18,7 @@ from ophyd.signal import (
     InternalSignal,
     InternalSignalError,
     Signal,
+    put_group,
 )
 from ophyd.status import wait
 from ophyd.utils import AlarmSeverity, AlarmStatus, ReadOnlyError
@@ -188,6 +190,351 @@ def test_signal_describe_fail():
     )
 
 
+def test_signal_compact():
+    # (the first instance in a process logs, creating its logger)
+    Signal(name="first")
+    sig = Signal(name="sig", value=1)
+    # attributes set on creation are stored in slots, bar the class override
+    assert set(vars(sig)) <= {"_metadata_keys"}
+    # loggers are made on first use
+    assert sig._log is None
+    assert sig.log.extra == {"ophyd_object_name": "sig"}
+    # other attributes can still be added
+    sig.extra = 1
+    assert vars(sig)["extra"] == 1
+
+
+def test_signal_put_unsubscribed():
+    sig = Signal(name="sig", value=0)
+    # a fresh signal has no event to replay
+    values = []
+    cid = sig.subscribe(lambda value, **kwargs: values.append(value))
+    assert values == []
+    sig.unsubscribe(cid)
+
+    for i in range(10):
+        sig.put(i, timestamp=i)
+
+    # the last event is replayed to new subscribers as it was made
+    replayed = []
+    sig.subscribe(lambda **kwargs: replayed.append(kwargs))
+    ((kwargs),) = replayed
+    assert (kwargs["value"], kwargs["old_value"], kwargs["timestamp"]) == (9, 8, 9)
+    assert kwargs["obj"] is sig
+    sig.put(10)
+    assert replayed[-1]["old_value"] == 9
+
+    with pytest.raises(UnknownSubscription):
+        sig._run_subs(sub_type="unknown")
+
+
+@pytest.mark.parametrize(
+    "mode, max_bytes, expected",
+    [
+        ("full", None, [(2, 1)]),
+        ("full", 16, []),
+        ("full", 1024, [(2, 1)]),
+        ("readback", None, [(3, None)]),
+        ("metadata", None, []),
+        ("off", None, []),
+    ],
+)
+def test_signal_replay_cache(mode, max_bytes, expected):
+    sig = Signal(name="sig", value=numpy.zeros(8))
+    sig.set_replay_cache(mode, max_bytes=max_bytes)
+    sig.subscribe(lambda **kwargs: None, run=False)
+    sig.put(numpy.full(8, 1))
+    sig.put(numpy.full(8, 2))
+    sig._run_subs(sub_type=sig.SUB_META, **sig._metadata)
+    sig._readback = numpy.full(8, 3)
+
+    values = []
+
+    def cb(value, old_value, **kwargs):
+        values.append((value[0], None if old_value is None else old_value[0]))
+
+    meta = []
+    sig.subscribe(cb)
+    sig.subscribe(lambda **kwargs: meta.append(kwargs), event_type=sig.SUB_META)
+    assert values == expected
+    if mode == "off":
+        assert meta == []
+    else:
+        assert meta[0]["connected"]
+        assert ("value" in sig._args_cache) == bool(expected)
+
+
+def test_signal_replay_cache_class_default():
+    class ArraySignal(Signal):
+        replay_cache = "metadata"
+
+    sig = ArraySignal(name="sig", value=0)
+    sig.put(1)
+    values = []
+    cid = sig.subscribe(lambda value, **kwargs: values.append(value))
+    assert values == []
+    sig.unsubscribe(cid)
+    # the class default can be changed per instance
+    sig.set_replay_cache("full")
+    sig.put(2)
+    sig.set_replay_cache("readback")
+    sig.put(3)
+    sig.subscribe(lambda value, **kwargs: values.append(value))
+    assert values == [3]
+
+    with pytest.raises(ValueError):
+        sig.set_replay_cache("weak")
+
+
+def test_signal_describe_cache():
+    sig = Signal(name="sig", value=1)
+    with mock.patch.object(sig, "_describe", wraps=sig._describe) as describe:
+        desc = sig.describe()
+        assert sig.describe() == desc
+        assert describe.call_count == 1
+
+        # a new value of the same type and shape uses the cache
+        sig.put(2)
+        sig.describe()["sig"]["extra"] = "not cached"
+        assert sig.describe() == desc
+        assert describe.call_count == 1
+
+        sig.put(numpy.zeros(3))
+        assert sig.describe()["sig"]["shape"] == [3]
+        sig.put(numpy.zeros(5))
+        assert sig.describe()["sig"]["shape"] == [5]
+        assert describe.call_count == 3
+
+        # metadata used by describe invalidates the cache, others do not
+        sig._metadata.update(timestamp=0, severity=1)
+        sig.describe()
+        assert describe.call_count == 3
+        sig._metadata["units"] = "mm"
+        sig.describe()
+        assert describe.call_count == 4
+
+
+def test_signal_read_burst():
+    sig = Signal(name="sig", value=0)
+    stop = threading.Event()
+
+    def put_values():
+        value = 0
+        while not stop.is_set():
+            value += 1
+            sig.put(value)
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=put_values, daemon=True)
+    thread.start()
+    try:
+        values, timestamps = sig.read_burst(5, timeout=5)
+        assert values.shape == timestamps.shape == (5,)
+        assert list(numpy.diff(values)) == [1] * 4
+        assert list(numpy.diff(timestamps) > 0) == [True] * 4
+
+        values, timestamps = sig.read_burst(3, period=0.01, timeout=5)
+        assert len(values) == 3
+        assert (numpy.diff(timestamps) >= 0.01).all()
+    finally:
+        stop.set()
+        thread.join()
+
+    # no updates: returns what was read within the timeout
+    values, timestamps = sig.read_burst(3, timeout=0.05)
+    assert values.shape == (0,)
+
+    with pytest.raises(ValueError):
+        sig.read_burst(0)
+
+    # timed gets, into preallocated arrays
+    sig.put(numpy.arange(2))
+    out = numpy.zeros((4, 2)), numpy.zeros(4)
+    values, timestamps = sig.read_burst(4, period=0.005, from_monitor=False, out=out)
+    assert values.base is out[0]
+    numpy.testing.assert_array_equal(out[0], [[0, 1]] * 4)
+    assert list(out[1]) == [sig.timestamp] * 4
+
+
+class FakeWritePV:
+    "Stands in for the write PV of an EpicsSignal, recording puts"
+
+    def __init__(self):
+        self.puts = []
+
+    def put(self, value, *, use_complete, callback, timeout, **kwargs):
+        self.puts.append((value, use_complete, callback))
+
+    def complete(self, index=-1):
+        value, use_complete, callback = self.puts[index]
+        callback()
+
+
+def fake_epics_signal(pvname, **kwargs):
+    "An EpicsSignal connected to a FakeWritePV"
+    sig = EpicsSignal(pvname, name=pvname.lower(), **kwargs)
+    sig._metadata.update(connected=True, write_access=True)
+    sig._write_pv = FakeWritePV()
+    return sig
+
+
+def test_epicssignal_coalesce_puts():
+    sig = fake_epics_signal("FAKE:COALESCE", coalesce_puts=True)
+    pv = sig._write_pv
+    assert sig.coalesce_puts
+
+    done = []
+    sig.put(1)
+    sig.put(2, callback=lambda: done.append(2))
+    sig.put(3)
+    sig.put(4, callback=lambda: done.append(4))
+    # only the first is written, while it is in flight
+    assert [value for value, *_ in pv.puts] == [1]
+    assert sig.coalesced_puts == 2
+
+    pv.complete()
+    assert [value for value, *_ in pv.puts] == [1, 4]
+    assert sig._setpoint == 4
+    assert done == []
+    pv.complete()
+    # the callbacks of the puts replaced run with that of the value written
+    assert done == [2, 4]
+
+    sig.put(5)
+    assert [value for value, *_ in pv.puts] == [1, 4, 5]
+
+    sig.coalesce_puts = False
+    assert sig.coalesced_puts == 0
+
+
+def test_epicssignal_coalesce_puts_failing_callback():
+    sig = fake_epics_signal("FAKE:COALESCE", coalesce_puts=True)
+    pv = sig._write_pv
+
+    def failing():
+        raise ValueError("callback failed")
+
+    done = []
+    sig.put(1, callback=failing)
+    sig.put(2, callback=lambda: done.append(2))
+    pv.complete()
+    # the failing callback does not stop the held back put
+    assert [value for value, *_ in pv.puts] == [1, 2]
+    pv.complete()
+    assert done == [2]
+
+    sig.put(3, callback=failing)
+    pv.complete()
+    # nor does it leave a put in flight, holding back later ones
+    sig.put(4)
+    assert [value for value, *_ in pv.puts] == [1, 2, 3, 4]
+    assert sig.coalesced_puts == 0
+
+
+def test_epicssignal_coalesce_puts_timeout():
+    sig = fake_epics_signal("FAKE:COALESCE", coalesce_puts=True)
+    pv = sig._write_pv
+
+    done = []
+    sig.put(1, timeout=0.05)
+    sig.put(2, callback=lambda: done.append(2))
+    assert [value for value, *_ in pv.puts] == [1]
+    # the completion of 1 never comes: 2 is written once its timeout passes
+    time.sleep(0.3)
+    assert [value for value, *_ in pv.puts] == [1, 2]
+    pv.complete()
+    assert done == [2]
+
+    # a late completion of the put which timed out changes nothing
+    pv.complete(0)
+    sig.put(3)
+    assert [value for value, *_ in pv.puts] == [1, 2, 3]
+
+
+def test_put_group():
+    a = fake_epics_signal("FAKE:A")
+    b = fake_epics_signal("FAKE:B", put_complete=True)
+    soft = Signal(name="soft", value=0)
+
+    with put_group() as group:
+        a.put(1)
+        b.put(2)
+        soft.put(3)
+        # EpicsSignal puts are queued, others made straight away
+        assert a._write_pv.puts == b._write_pv.puts == []
+        assert soft.get() == 3
+        assert len(group) == 2
+    assert [put[:2] for put in a._write_pv.puts] == [(1, False)]
+    assert [put[:2] for put in b._write_pv.puts] == [(2, True)]
+    assert a._setpoint == 1
+    # complete once the put of b completes
+    assert not group.status.done
+    b._write_pv.complete()
+    group.status.wait(1)
+
+    # nothing is put if the block raises
+    with pytest.raises(ZeroDivisionError):
+        with put_group():
+            a.put(10)
+            1 / 0
+    assert len(a._write_pv.puts) == 1
+
+    # values are checked on put
+    with pytest.raises(ValueError):
+        with put_group():
+            a.put(10)
+            b.check_value = mock.Mock(side_effect=ValueError)
+            b.put(11)
+    assert len(a._write_pv.puts) == 1
+
+
+def test_put_many():
+    from ophyd import Component, Device
+
+    class Dev(Device):
+        a = Component(Signal, value=0)
+
+    dev = Dev(name="dev")
+    sig = fake_epics_signal("FAKE:MANY")
+
+    def complete_soon():
+        time.sleep(0.1)
+        sig._write_pv.complete()
+
+    threading.Thread(target=complete_soon).start()
+    status = dev.put_many({"a": 1, sig: 2}, wait=True, timeout=5)
+    assert status.done and status.success
+    assert dev.a.get() == 1
+    assert [put[:2] for put in sig._write_pv.puts] == [(2, True)]
+
+    # within a group, the puts are made by that group, with its wait/timeout
+    with put_group():
+        assert dev.put_many({sig: 3}) is None
+        with pytest.raises(ValueError):
+            dev.put_many({sig: 4}, wait=True)
+    assert [put[0] for put in sig._write_pv.puts] == [2, 3]
+
+
+def test_put_group_failing_callback():
+    sig = fake_epics_signal("FAKE:A")
+
+    def failing():
+        raise ValueError("callback failed")
+
+    def complete_soon():
+        time.sleep(0.1)
+        with pytest.raises(ValueError):
+            sig._write_pv.complete()
+
+    thread = threading.Thread(target=complete_soon)
+    thread.start()
+    with put_group(wait=True) as group:
+        sig.put(1, callback=failing)
+    thread.join()
+    # the group completes regardless of the callback
+    assert group.status.done and group.status.success
+
+
 def test_internalsignal_write_from_internal():
     test_signal = InternalSignal(name="test_signal")
     for value in range(10):
@@ -12,6 +12,7 @@ from ophyd.status import (
     StatusBase,
     SubscriptionStatus,
     UseNewProperty,
+    format_timeline,
 )
 from ophyd.utils import (
     InvalidState,
@@ -607,3 +608,53 @@ def test_error_in_handle_failure_method():
     st.wait(1)
     time.sleep(0.1)  # Wait for callbacks to run.
     assert state
+
+
+def test_status_timeline():
+    st = StatusBase()
+    (entry,) = st.timeline()
+    assert entry.status is st
+    assert entry.created is not None
+    assert entry.finished is None
+    assert entry.settled is None
+
+    st.set_finished()
+    st.wait(1)
+    (entry,) = st.timeline()
+    assert entry.created <= entry.finished <= entry.settled
+
+
+def test_and_status_critical_path():
+    fast = StatusBase()
+    slow = StatusBase()
+    slowest = StatusBase()
+    st = fast & (slow & slowest)
+    assert st.children == (fast, st.right)
+    assert [entry.depth for entry in st.timeline()] == [0, 1, 1, 2, 2]
+
+    fast.set_finished()
+    slow.set_finished()
+    # pending statuses are on the critical path
+    assert st.critical_path()[-1].status is slowest
+
+    time.sleep(0.01)
+    slowest.set_finished()
+    st.wait(1)
+
+    path = st.critical_path()
+    assert [entry.status for entry in path] == [st, st.right, slowest]
+    assert path[-1].settled >= path[0].created
+
+    table = format_timeline(st.timeline())
+    assert len(table.splitlines()) == 6
+
+
+def test_add_child():
+    parent = StatusBase()
+    child = StatusBase()
+    parent.add_child(child)
+    assert parent.children == (child,)
+    child.set_finished()
+    parent.set_finished()
+    parent.wait(1)
+    assert parent.critical_path()[-1].status is child
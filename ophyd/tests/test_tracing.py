@@ -0,0 +1,162 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ophyd import Component as Cpt
+from ophyd import Device, Signal
+from ophyd.device import BlueskyInterface
+from ophyd.status import _NULL_TRACE_ATTRIBUTES, DeviceStatus, Status, StatusBase
+from ophyd.tracing import (
+    LazyAttribute,
+    config_ophyd_tracing,
+    get_tracing_config,
+    set_span_attributes,
+)
+
+
+@pytest.fixture(autouse=True)
+def default_tracing():
+    yield
+    config_ophyd_tracing()
+
+
+@pytest.fixture
+def mock_tracer():
+    tracer = MagicMock()
+    with patch("ophyd.tracing.tracer", tracer):
+        yield tracer
+
+
+def test_default_config_traces_statuses():
+    config = get_tracing_config()
+    assert config.enabled
+    assert config.sample_ratio == 1.0
+    assert not config.signals
+    assert not config.devices
+
+    st = StatusBase()
+    assert st._tracing_span is not None
+    st.set_finished()
+    st.wait(1)
+
+
+def test_disabled_status_tracing():
+    config_ophyd_tracing(enabled=False)
+    st = DeviceStatus(None, timeout=1)
+    assert st._tracing_span is None
+    assert st._trace_attributes is _NULL_TRACE_ATTRIBUTES
+
+    st.set_exception(ValueError("failed"))
+    with pytest.raises(ValueError):
+        st.wait(1)
+    assert not _NULL_TRACE_ATTRIBUTES
+
+    and_st = StatusBase() & StatusBase()
+    assert and_st._tracing_span is None
+
+
+def test_status_types():
+    config_ophyd_tracing(status_types=[DeviceStatus])
+    assert StatusBase()._tracing_span is None
+    assert Status()._tracing_span is None
+    assert DeviceStatus(None)._tracing_span is not None
+
+    config_ophyd_tracing(status_types=["StatusBase"])
+    # subclasses are included
+    assert DeviceStatus(None)._tracing_span is not None
+
+
+def test_sample_ratio():
+    config_ophyd_tracing(sample_ratio=0.0)
+    assert all(StatusBase()._tracing_span is None for _ in range(10))
+
+    with pytest.raises(ValueError):
+        config_ophyd_tracing(sample_ratio=2)
+
+
+def test_lazy_attributes():
+    func = MagicMock(return_value="value")
+    span = MagicMock()
+
+    span.is_recording.return_value = False
+    set_span_attributes(span, {"key": LazyAttribute(func)})
+    func.assert_not_called()
+    span.set_attribute.assert_not_called()
+
+    span.is_recording.return_value = True
+    set_span_attributes(span, {"key": LazyAttribute(func), "other": 1})
+    func.assert_called_once_with()
+    span.set_attribute.assert_any_call("key", "value")
+    span.set_attribute.assert_any_call("other", 1)
+
+
+def test_signal_spans(mock_tracer):
+    class SubSignal(Signal):
+        def put(self, value, **kwargs):
+            super().put(value + 1, **kwargs)
+
+    # nothing is wrapped until signal tracing is enabled
+    assert not hasattr(vars(SubSignal)["put"], "_ophyd_traced")
+    sig = SubSignal(name="sig")
+    sig.put(1)
+    sig.get()
+    mock_tracer.start_as_current_span.assert_not_called()
+
+    config_ophyd_tracing(signals=True)
+    sig.put(1)
+    sig.get()
+    assert sig.get() == 2
+    # one span per call, even though put calls super().put
+    span_names = [c.args[0] for c in mock_tracer.start_as_current_span.call_args_list]
+    assert span_names == [
+        "Ophyd SubSignal put",
+        "Ophyd SubSignal get",
+        "Ophyd SubSignal get",
+    ]
+
+
+def test_device_spans(mock_tracer):
+    class Sub(Device):
+        sig = Cpt(Signal, value=0)
+
+    class Dev(Device):
+        sub = Cpt(Sub, "")
+
+        def trigger(self):
+            return super().trigger()
+
+    dev = Dev(name="dev")
+    config_ophyd_tracing(devices=True)
+    dev.stage()
+    dev.trigger().wait(1)
+    dev.unstage()
+
+    span_names = [c.args[0] for c in mock_tracer.start_as_current_span.call_args_list]
+    assert span_names == [
+        "Ophyd Dev stage",
+        "Ophyd Sub stage",
+        "Ophyd Dev trigger",
+        "Ophyd Dev unstage",
+        "Ophyd Sub unstage",
+    ]
+
+
+def test_device_spans_keep_mixin_methods(mock_tracer):
+    class Mixin(BlueskyInterface):
+        def stage(self):
+            self.mixin_staged = True
+            return super().stage()
+
+    class Dev(Device, Mixin):
+        sig = Cpt(Signal, value=0)
+
+    dev = Dev(name="dev")
+    config_ophyd_tracing(devices=True)
+    dev.stage()
+    assert dev.mixin_staged
+    # mix-in methods are not wrapped
+    assert not hasattr(vars(Mixin)["stage"], "_ophyd_traced")
+    dev.unstage()
+
+    span_names = [c.args[0] for c in mock_tracer.start_as_current_span.call_args_list]
+    assert span_names == ["Ophyd Dev stage", "Ophyd Dev unstage"]
@@ -0,0 +1,326 @@
+"""Configuration of the OpenTelemetry instrumentation in ophyd
+
+By default, every Status object opens a span covering its lifetime and every
+``Status.wait()`` opens a span covering the wait, as in previous releases.
+Spans on ``Signal.get``/``Signal.put`` and ``Device.stage``/``unstage``/
+``trigger`` are available but off by default.
+
+Use :func:`config_ophyd_tracing` to enable, sample or disable these.
+"""
+import contextvars
+import functools
+import inspect
+import random
+import threading
+import weakref
+
+from opentelemetry import trace
+
+__all__ = (
+    "config_ophyd_tracing",
+    "get_tracing_config",
+    "LazyAttribute",
+    "set_span_attributes",
+    "should_trace",
+    "should_trace_status",
+    "trace_class_methods",
+    "traced_method",
+    "tracer",
+)
+
+tracer = trace.get_tracer("ophyd")
+
+_TRACE_PREFIX = "Ophyd"
+
+# The (id(obj), operation) of the innermost traced method on this thread, used
+# to avoid nested spans when an override calls ``super()``
+_active_operation = contextvars.ContextVar("ophyd_active_operation", default=None)
+
+# Classes passed to trace_class_methods, per category: class -> operations.
+# Their methods are only wrapped once the category is first enabled.
+_traced_classes = {
+    "signals": weakref.WeakKeyDictionary(),
+    "devices": weakref.WeakKeyDictionary(),
+}
+_wrapped_classes = weakref.WeakSet()
+_wrap_lock = threading.RLock()
+
+
+class TracingConfig:
+    """The current tracing configuration; see :func:`config_ophyd_tracing`"""
+
+    __slots__ = (
+        "enabled",
+        "sample_ratio",
+        "status_types",
+        "signals",
+        "devices",
+        "_status_type_cache",
+    )
+
+    def __init__(
+        self,
+        *,
+        enabled=True,
+        sample_ratio=1.0,
+        status_types=None,
+        signals=False,
+        devices=False,
+    ):
+        sample_ratio = float(sample_ratio)
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise ValueError(
+                f"sample_ratio must be between 0 and 1, got {sample_ratio}"
+            )
+
+        if status_types is not None:
+            status_types = frozenset(
+                typ if isinstance(typ, str) else typ.__name__ for typ in status_types
+            )
+
+        self.enabled = bool(enabled)
+        self.sample_ratio = sample_ratio
+        self.status_types = status_types
+        self.signals = bool(signals)
+        self.devices = bool(devices)
+        # status class -> whether it is traced
+        self._status_type_cache = {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(enabled={self.enabled}, "
+            f"sample_ratio={self.sample_ratio}, "
+            f"status_types={self.status_types}, "
+            f"signals={self.signals}, devices={self.devices})"
+        )
+
+
+_config = TracingConfig()
+
+
+def config_ophyd_tracing(
+    *,
+    enabled=True,
+    sample_ratio=1.0,
+    status_types=None,
+    signals=False,
+    devices=False,
+):
+    """
+    Configure which ophyd operations create OpenTelemetry spans.
+
+    Calling this replaces the previous configuration entirely.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Master switch. If False, no spans are created and the status,
+        signal and device code paths skip all tracing work. Default is True.
+    sample_ratio : float, optional
+        Fraction (0 to 1) of root operations to trace. An operation started
+        while a recording span is active is always traced, so a sampled
+        trace is complete. Default is 1.0.
+    status_types : iterable of type or str, optional
+        Status classes (or class names) to trace. A status is traced if its
+        class, or any base class, is listed. Default, None, traces all
+        statuses.
+    signals : bool, optional
+        Create spans for ``Signal.get`` and ``Signal.put``. Default is False.
+    devices : bool, optional
+        Create spans for ``Device.stage``, ``Device.unstage`` and
+        ``Device.trigger``. Default is False.
+
+    Returns
+    -------
+    config : TracingConfig
+
+    Examples
+    --------
+    Turn off tracing entirely::
+
+        config_ophyd_tracing(enabled=False)
+
+    Trace 1% of motions, with signal and device spans nested below them::
+
+        config_ophyd_tracing(sample_ratio=0.01, status_types=["MoveStatus"],
+                             signals=True, devices=True)
+    """
+    global _config
+    _config = TracingConfig(
+        enabled=enabled,
+        sample_ratio=sample_ratio,
+        status_types=status_types,
+        signals=signals,
+        devices=devices,
+    )
+    if _config.enabled:
+        for category in ("signals", "devices"):
+            if getattr(_config, category):
+                _wrap_registered(category)
+    return _config
+
+
+def get_tracing_config():
+    """Return the configuration set by :func:`config_ophyd_tracing`"""
+    return _config
+
+
+def _sampled(config):
+    """Sampling decision, inheriting the decision of a recording parent span"""
+    if config.sample_ratio >= 1.0 or trace.get_current_span().is_recording():
+        return True
+    return config.sample_ratio > 0.0 and random.random() < config.sample_ratio
+
+
+def should_trace_status(status_cls):
+    """Should a new instance of ``status_cls`` open a span?"""
+    config = _config
+    if not config.enabled:
+        return False
+
+    try:
+        type_enabled = config._status_type_cache[status_cls]
+    except KeyError:
+        type_enabled = config.status_types is None or any(
+            cls.__name__ in config.status_types for cls in status_cls.__mro__
+        )
+        config._status_type_cache[status_cls] = type_enabled
+
+    return type_enabled and _sampled(config)
+
+
+def should_trace(category):
+    """Should an operation of ``category`` ('signals' or 'devices') open a span?"""
+    config = _config
+    return config.enabled and getattr(config, category) and _sampled(config)
+
+
+class LazyAttribute:
+    """A span attribute computed only if it is recorded
+
+    Parameters
+    ----------
+    func : callable
+        Called with no arguments to produce the attribute value
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.func!r})"
+
+
+def set_span_attributes(span, attributes):
+    """Set attributes on a span, evaluating any :class:`LazyAttribute`
+
+    Nothing is computed if the span is not recording.
+    """
+    if not span.is_recording():
+        return
+    for key, value in attributes.items():
+        if isinstance(value, LazyAttribute):
+            value = value.func()
+        span.set_attribute(key, value)
+
+
+def traced_method(category, operation):
+    """Wrap a method of an OphydObject to record a span when enabled
+
+    Nested calls of the same operation on the same object (i.e., through
+    ``super()``) are recorded as a single span.
+
+    Parameters
+    ----------
+    category : {'signals', 'devices'}
+        The configuration switch that enables these spans
+    operation : str
+        Used in the span name, ``"Ophyd <ClassName> <operation>"``
+    """
+
+    def wrapper(func):
+        @functools.wraps(func)
+        def inner(self, *args, **kwargs):
+            if not should_trace(category):
+                return func(self, *args, **kwargs)
+
+            key = (id(self), operation)
+            if _active_operation.get() == key:
+                return func(self, *args, **kwargs)
+
+            token = _active_operation.set(key)
+            try:
+                with tracer.start_as_current_span(
+                    f"{_TRACE_PREFIX} {type(self).__name__} {operation}"
+                ) as span:
+                    if span.is_recording():
+                        span.set_attribute("object_name", self.name)
+                        span.set_attribute("object_type", type(self).__name__)
+                    return func(self, *args, **kwargs)
+            finally:
+                _active_operation.reset(token)
+
+        inner._ophyd_traced = True
+        return inner
+
+    return wrapper
+
+
+def trace_class_methods(cls, category, operations):
+    """Trace the given methods of ``cls`` while ``category`` is enabled
+
+    This is called from ``__init_subclass__`` of the OphydObject classes with
+    traced methods.  Only the methods defined by ``cls`` itself are wrapped,
+    never those of mix-in classes.  A method which the first registered class
+    of a hierarchy inherits from elsewhere (e.g. ``Device.stage`` from
+    ``BlueskyInterface``) is traced with a method calling the next
+    implementation in the method resolution order.
+
+    Nothing is wrapped until the category is enabled by
+    :func:`config_ophyd_tracing`, so there is no overhead without tracing.
+    """
+    with _wrap_lock:
+        _traced_classes[category][cls] = tuple(operations)
+        config = _config
+        if config.enabled and getattr(config, category):
+            _wrap_class(cls, category)
+
+
+def _wrap_registered(category):
+    """Wrap the methods of all classes registered for ``category``"""
+    with _wrap_lock:
+        for cls in list(_traced_classes[category]):
+            _wrap_class(cls, category)
+
+
+def _wrap_class(cls, category):
+    if cls in _wrapped_classes:
+        return
+
+    registered = _traced_classes[category]
+    operations = registered[cls]
+    for operation in operations:
+        method = vars(cls).get(operation)
+        if method is None:
+            if any(base in registered for base in cls.__mro__[1:]):
+                # Traced by the registered base class
+                continue
+            method = _next_method(cls, operation)
+        elif not inspect.isfunction(method) or getattr(method, "_ophyd_traced", False):
+            continue
+        setattr(cls, operation, traced_method(category, operation)(method))
+    _wrapped_classes.add(cls)
+
+
+def _next_method(cls, operation):
+    """A method of ``cls`` calling the inherited ``operation``"""
+
+    def method(self, *args, **kwargs):
+        return getattr(super(cls, self), operation)(*args, **kwargs)
+
+    method.__name__ = operation
+    method.__qualname__ = f"{cls.__qualname__}.{operation}"
+    method.__doc__ = getattr(cls, operation).__doc__
+    return method
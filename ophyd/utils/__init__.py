@@ -1,6 +1,7 @@
 # vi: ts=4 sw=4 sts=4 expandtab
 import inspect
 import logging
+import sys
 import warnings
 from collections import OrderedDict
 
@@ -137,6 +138,14 @@ def getattrs(obj, gen):
         yield attr, getattr(obj, attr)
 
 
+def approx_nbytes(value):
+    "Approximate memory held by a value: ``nbytes`` or ``sys.getsizeof``"
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is None:
+        nbytes = sys.getsizeof(value)
+    return nbytes
+
+
 class DO_NOT_USE:
     "sentinel value"
     ...
@@ -36,6 +36,22 @@ class ExceptionBundle(RuntimeError, OpException):
         self.exceptions = exceptions
 
 
+class DeviceCreationError(ExceptionBundle):
+    """Some of the devices requested from ``create_devices`` were not created
+
+    Attributes
+    ----------
+    exceptions : dict
+        Device name to the exception raised creating it
+    devices : dict
+        Device name to instance, for the devices that were created
+    """
+
+    def __init__(self, msg, exceptions, devices):
+        super().__init__(msg, exceptions)
+        self.devices = devices
+
+
 class RedundantStaging(OpException):
     pass
 
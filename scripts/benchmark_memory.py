@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Report the memory used per signal by Signal, EpicsSignal and EpicsSignalRO.
+
+Memory is measured with tracemalloc, and so includes everything allocated on
+creating a signal: the ophyd object itself and the PV objects of the control
+layer.  No IOC is required; the PVs are created but never connect.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from ophyd import EpicsSignal, EpicsSignalRO, Signal, set_cl
+
+FACTORIES = {
+    "Signal": lambda i: Signal(name=f"sig{i}"),
+    "EpicsSignal": lambda i: EpicsSignal(f"BENCH:SIG{i}", name=f"sig{i}"),
+    "EpicsSignalRO": lambda i: EpicsSignalRO(f"BENCH:RO{i}", name=f"ro{i}"),
+}
+
+
+def bytes_per_signal(factory, count):
+    # Warm up, so that one-time (class and control layer) allocations are not
+    # counted
+    factory(-1)
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    signals = [factory(i) for i in range(count)]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del signals
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--control-layer", default="any")
+    args = parser.parse_args()
+
+    set_cl(args.control_layer)
+    for label, factory in FACTORIES.items():
+        print(f"{label:>15}: {bytes_per_signal(factory, args.count):8.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
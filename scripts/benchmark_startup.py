@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Compare serial and concurrent (``ophyd.create_devices``) instantiation of a
+large profile.
+
+The profile is made of classes with many components: scalers, whose channels
+are DynamicDeviceComponents, and area detectors built from ADComponents.  No
+IOC is required; the PVs are created but never connect, so this measures the
+cost of building the device trees and starting their searches.
+"""
+
+import argparse
+import time
+
+from ophyd import EpicsScaler, create_devices
+from ophyd.areadetector import (
+    HDF5Plugin,
+    ImagePlugin,
+    ROIPlugin,
+    SimDetector,
+    SimDetectorCam,
+    StatsPlugin,
+)
+from ophyd.areadetector import ADComponent as ADCpt
+
+
+class BenchDetector(SimDetector):
+    cam = ADCpt(SimDetectorCam, "cam1:")
+    image = ADCpt(ImagePlugin, "image1:")
+    roi1 = ADCpt(ROIPlugin, "ROI1:")
+    stats1 = ADCpt(StatsPlugin, "Stats1:")
+    hdf5 = ADCpt(HDF5Plugin, "HDF1:")
+
+
+PROFILE_CLASSES = {"scaler": EpicsScaler, "det": BenchDetector}
+
+
+def make_specs(count):
+    return {
+        f"{label}{i}": (cls, f"BENCH:{label.upper()}{i}:")
+        for i in range(count)
+        for label, cls in PROFILE_CLASSES.items()
+    }
+
+
+def count_signals(devices):
+    return sum(len(list(dev.walk_signals())) for dev in devices.values())
+
+
+def serial(specs):
+    return {name: cls(prefix, name=name) for name, (cls, prefix) in specs.items()}
+
+
+def concurrent(specs, max_workers):
+    return create_devices(specs, max_workers=max_workers, wait=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20, help="Devices per class")
+    parser.add_argument("--max-workers", type=int, default=16)
+    args = parser.parse_args()
+
+    for label, build in (
+        ("serial", serial),
+        ("create_devices", lambda specs: concurrent(specs, args.max_workers)),
+    ):
+        # Unique prefixes per run, so that no PV is reused from the previous one
+        specs = {
+            name: (cls, f"{label}:{prefix}")
+            for name, (cls, prefix) in make_specs(args.count).items()
+        }
+        t0 = time.perf_counter()
+        devices = build(specs)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{label:>15}: {len(devices)} devices, {count_signals(devices)} "
+            f"signals in {elapsed:.2f} s"
+        )
+        for dev in devices.values():
+            dev.destroy()
+
+
+if __name__ == "__main__":
+    main()